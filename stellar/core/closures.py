@@ -0,0 +1,794 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Closure Compiler (C) 2018
+
+from utils.expr import ExprVisitor  as _ExprVisitor
+from utils.expr import Expr         as _Expr
+from utils.expr import Get          as _Get
+from utils.expr import Binary       as _Binary
+from utils.expr import Grouping     as _Grouping
+from utils.expr import Literal      as _Literal
+from utils.expr import Unary        as _Unary
+
+from utils.stmt import StmtVisitor  as _StmtVisitor
+from utils.stmt import Stmt         as _Stmt
+
+from utils.reporter import BREAK             as _BREAK
+from utils.reporter import RETURN            as _RETURN
+
+from utils.tokens import TokenType    as _TokenType
+
+from utils.env import Environment     as _Environment
+from utils.env import SlotEnvironment as _SlotEnvironment
+from utils.env import UNSET           as _UNSET
+from utils.env import makeEnvironment    as _makeEnvironment
+from utils.env import releaseEnvironment as _releaseEnvironment
+
+from core.interpreter import Interpreter  as _Interpreter
+from core.operators   import RAW_OPS      as _RAW_OPS
+from core.operators   import ARITHMETIC   as _ARITHMETIC
+from core.operators   import DIVISION     as _DIVISION
+from core.operators   import COMPARISON   as _COMPARISON
+from core.operators   import NUMBERS      as _NUMBERS
+from core.operators   import RAW_NUMBERS  as _RAW_NUMBERS
+from core.operators   import rawNumberOp  as _rawNumberOp
+from core.operators   import ONE          as _ONE
+
+from native.datastructs.rocketClass import RocketFunction  as _RocketFunction
+from native.datastructs.rocketClass import RocketInstance  as _RocketInstance
+
+from native.datatypes.rocketNumber  import RocketInt     as _RocketInt
+from native.datatypes.rocketNumber  import RocketFloat   as _RocketFloat
+from native.datatypes.rocketNumber  import SMALL_INTS    as _SMALL_INTS
+from native.datatypes.rocketNumber  import makeInt       as _makeInt
+from native.datatypes.rocketString  import RocketString  as _RocketString
+from native.datatypes.rocketString  import makeString    as _makeString
+from native.datatypes.rocketBoolean import TRUE          as _TRUE
+from native.datatypes.rocketBoolean import FALSE         as _FALSE
+
+
+class ClosureCompiler(_ExprVisitor, _StmtVisitor):
+    # Turns each node into a zero-arg Python closure exactly once.
+    # The closure is cached on the node as 'compiled', so fn bodies called over and over only pay for this on their first run.
+    # Anything off the fast paths falls back to the shared Interpreter helpers so behaviour matches the tree-walker.
+    def __init__(self, interpreter: _Interpreter):
+        self.interpreter = interpreter
+
+    def compileExpr(self, expr: _Expr):
+        try:
+            return expr.compiled
+
+        except AttributeError:
+            expr.compiled = expr.accept(self)
+            return expr.compiled
+
+    def compileStmt(self, stmt: _Stmt):
+        if type(stmt) == list:
+            # Multi-variable definitions only make sense at the top-level, fail at runtime like the tree-walker
+            return lambda: stmt.accept(self.interpreter)
+
+        try:
+            return stmt.compiled
+
+        except AttributeError:
+            stmt.compiled = stmt.accept(self)
+            return stmt.compiled
+
+    # Expressions
+
+    def visitAssignExpr(self, expr):
+        interp = self.interpreter
+        value = self.compileExpr(expr.value)
+        assignName = interp.assignName
+        lexeme = expr.name.lexeme
+        slot = getattr(expr, 'slot', None)
+
+        if slot is not None:
+            depth, index = slot
+
+            def assign_slot():
+                val = value()
+                env = interp.environment
+
+                for _ in range(depth):
+                    env = env.enclosing
+
+                if env.slots[index] is not _UNSET:
+                    env.slots[index] = val
+                    return val
+
+                return assignName(expr, val)
+
+            return assign_slot
+
+        def assign():
+            val = value()
+            env = interp.environment
+
+            # Same walk as 'Environment.assign', errors go through 'assignName' for reporting
+            while env is not None:
+                if env.__class__ is _SlotEnvironment:
+                    index = env.layout.names.get(lexeme)
+
+                    if (env.extras is not None) or (lexeme in env.layout.consts):
+                        return assignName(expr, val)
+
+                    if (index is not None) and (env.slots[index] is not _UNSET):
+                        env.slots[index] = val
+                        return val
+
+                else:
+                    if lexeme in env.statics:
+                        return assignName(expr, val)
+
+                    if lexeme in env.values:
+                        env.values[lexeme] = val
+                        return val
+
+                env = env.enclosing
+
+            return assignName(expr, val)
+
+        return assign
+
+    def visitCompoundAssignExpr(self, expr):
+        interp = self.interpreter
+        read = self.visitVariableExpr(expr)
+        value = self.compileExpr(expr.value)
+        operator = expr.operator
+        binaryOp = interp.binaryOp
+        assignName = interp.assignName
+
+        def compound():
+            return assignName(expr, binaryOp(operator, read(), value()))
+
+        slot = getattr(expr, 'slot', None)
+
+        if slot is None:
+            return compound
+
+        depth, index = slot
+        lexeme = expr.name.lexeme
+        glob = interp.globals
+        ref = [0, _UNSET] # [global table version, what the table holds for the name]
+
+        def compound_slot():
+            if ref[0] != glob.version:
+                ref[0] = glob.version
+                ref[1] = glob.lookup(lexeme)
+
+            # One walk to the slot, read it, apply the op and store back in place
+            env = interp.environment
+
+            for _ in range(depth):
+                env = env.enclosing
+
+            current = env.slots[index]
+
+            # Same cases 'lookupName' leaves the slot for
+            if (current is _UNSET) or (ref[1] is not _UNSET):
+                return compound()
+
+            val = binaryOp(operator, current, value())
+
+            if env.slots[index] is not _UNSET:
+                env.slots[index] = val
+                return val
+
+            return assignName(expr, val)
+
+        return compound_slot
+
+    def visitPostfixExpr(self, expr):
+        interp = self.interpreter
+        read = self.visitVariableExpr(expr)
+        operator = expr.operator
+        binaryOp = interp.binaryOp
+        assignName = interp.assignName
+        checkNumberOperand = interp.checkNumberOperand
+
+        def postfix():
+            val = read()
+
+            checkNumberOperand(operator, val)
+            assignName(expr, binaryOp(operator, val, _ONE))
+
+            return val
+
+        slot = getattr(expr, 'slot', None)
+
+        if slot is None:
+            return postfix
+
+        depth, index = slot
+        step = 1 if operator.type == _TokenType.PLUS else -1
+        lexeme = expr.name.lexeme
+        glob = interp.globals
+        ref = [0, _UNSET] # [global table version, what the table holds for the name]
+
+        def postfix_slot():
+            if ref[0] != glob.version:
+                ref[0] = glob.version
+                ref[1] = glob.lookup(lexeme)
+
+            env = interp.environment
+
+            for _ in range(depth):
+                env = env.enclosing
+
+            current = env.slots[index]
+
+            # Ints get bumped in place, anything else (unset slots, globals of the same name) takes the long way
+            if (current.__class__ is _RocketInt) and (ref[1] is _UNSET):
+                n = current.value + step
+                shared = _SMALL_INTS.get(n)
+                env.slots[index] = shared if shared is not None else _RocketInt(n)
+
+                return current
+
+            return postfix()
+
+        return postfix_slot
+
+    def visitBinaryExpr(self, expr):
+        operator = expr.operator
+
+        # Arithmetic and ordering ops run unboxed down their whole operand tree, only the final result gets boxed (see 'compileRaw')
+        if operator.type in _RAW_OPS:
+            raw = self.compileRaw(expr)
+
+            def number():
+                val = raw()
+
+                if val.__class__ is int:
+                    shared = _SMALL_INTS.get(val)
+                    return shared if shared is not None else _RocketInt(val)
+
+                if val.__class__ is float:
+                    return _RocketFloat(val)
+
+                return val
+
+            return number
+
+        left = self.compileExpr(expr.left)
+        right = self.compileExpr(expr.right)
+        binaryOp = self.interpreter.binaryOp
+
+        return lambda: binaryOp(operator, left(), right())
+
+    def compileRaw(self, expr: _Expr):
+        # Same as 'compileExpr', except the closure hands Rocket numbers back as raw python nums.
+        # Same rules as 'Interpreter.evaluateRaw', anything that isn't two raw nums goes through 'rawNumberOp'
+        interp = self.interpreter
+        kind = expr.__class__
+
+        if kind is _Grouping:
+            return self.compileRaw(expr.expression)
+
+        if kind is _Literal:
+            value = expr.value
+
+            # I.e pre-boxed under '-O'
+            if value.__class__ in _NUMBERS:
+                value = value.value
+
+            if value.__class__ in _RAW_NUMBERS:
+                return lambda: value
+
+        if (kind is _Unary) and (expr.operator.type == _TokenType.MINUS):
+            right = self.compileRaw(expr.right)
+            operator = expr.operator
+            unaryOp = interp.unaryOp
+            sanitizeNum = interp.sanitizeNum
+
+            def negate():
+                r = right()
+                return -r if r.__class__ in _RAW_NUMBERS else unaryOp(operator, sanitizeNum(r))
+
+            return negate
+
+        if (kind is _Binary) and (expr.operator.type in _RAW_OPS):
+            left = self.compileRaw(expr.left)
+            right = self.compileRaw(expr.right)
+            operator = expr.operator
+
+            # '**' can go complex, leave it to 'rawNumberOp'
+            if operator.type == _TokenType.EXP:
+                return lambda: _rawNumberOp(interp, operator, left(), right())
+
+            if operator.type in _DIVISION:
+                op = _DIVISION[operator.type]
+
+                def div():
+                    l = left()
+                    r = right()
+
+                    if (l.__class__ in _RAW_NUMBERS) and (r.__class__ in _RAW_NUMBERS) and (r != 0):
+                        return op(l, r)
+
+                    return _rawNumberOp(interp, operator, l, r)
+
+                return div
+
+            op = _ARITHMETIC.get(operator.type) or _COMPARISON[operator.type]
+
+            def arith():
+                l = left()
+                r = right()
+
+                if (l.__class__ in _RAW_NUMBERS) and (r.__class__ in _RAW_NUMBERS):
+                    return op(l, r)
+
+                return _rawNumberOp(interp, operator, l, r)
+
+            return arith
+
+        value = self.compileExpr(expr)
+
+        def unbox():
+            v = value()
+            return v.value if v.__class__ in _NUMBERS else v
+
+        return unbox
+
+    def visitCallExpr(self, expr):
+        interp = self.interpreter
+        args = [self.compileExpr(arg) for arg in expr.args]
+        argc = len(args)
+
+        callValue = interp.callValue
+        callFunction = interp.callFunction
+
+        # 'obj.method(...)', see 'Interpreter.getMethod'
+        if isinstance(expr.callee, _Get):
+            obj = self.compileExpr(expr.callee.object)
+            getMethod = interp.getMethod
+            callMethod = interp.callMethod
+
+            def invoke():
+                function, instance = getMethod(obj(), expr.callee)
+                eval_args = [arg() for arg in args]
+
+                if instance is not None:
+                    return callMethod(function, instance, eval_args, expr)
+
+                return callValue(function, eval_args, expr)
+
+            return invoke
+
+        callee = self.compileExpr(expr.callee)
+
+        def call():
+            function = callee()
+            eval_args = [arg() for arg in args]
+
+            # User fns with matching arity skip the native/datatype probing in 'callValue'
+            if (type(function) is _RocketFunction) and (len(function.decleration.params) == argc):
+                return callFunction(function, eval_args, expr)
+
+            return callValue(function, eval_args, expr)
+
+        return call
+
+    def visitIndexExpr(self, expr):
+        interp = self.interpreter
+        return lambda: expr.accept(interp)
+
+    def visitConditionalExpr(self, expr):
+        cond = self.compileExpr(expr.expr)
+        thenExpr = self.compileExpr(expr.thenExpr)
+        elseExpr = self.compileExpr(expr.elseExpr)
+        isTruthy = self.interpreter.isTruthy
+
+        return lambda: thenExpr() if isTruthy(cond()) else elseExpr()
+
+    def visitGetExpr(self, expr):
+        obj = self.compileExpr(expr.object)
+        name = expr.name
+        lexeme = name.lexeme
+        getProperty = self.interpreter.getProperty
+        ref = [None, 0] # [shape, index] of the last field read here, see 'Interpreter.getProperty'
+
+        def get():
+            o = obj()
+
+            if o.__class__ is _RocketInstance:
+                shape = o.shape
+
+                if ref[0] is not shape:
+                    index = shape.names.get(lexeme)
+
+                    # Methods (or the error)
+                    if index is None:
+                        return o.get(name)
+
+                    ref[0] = shape
+                    ref[1] = index
+
+                value = o.fields[ref[1]]
+
+                if value != None:
+                    return value
+
+                return o.get(name)
+
+            # Datatypes and the rest
+            return getProperty(o, expr)
+
+        return get
+
+    def visitSetExpr(self, expr):
+        obj = self.compileExpr(expr.object)
+        value = self.compileExpr(expr.value)
+        checkSetTarget = self.interpreter.checkSetTarget
+        setProperty = self.interpreter.setProperty
+
+        def set_():
+            o = obj()
+            checkSetTarget(o, expr)
+
+            return setProperty(o, expr, value())
+
+        return set_
+
+    def visitSuperExpr(self, expr):
+        visit = self.interpreter.visitSuperExpr
+        return lambda: visit(expr)
+
+    def visitThisExpr(self, expr):
+        lookUpVariable = self.interpreter.lookUpVariable
+        keyword = expr.keyword
+
+        return lambda: lookUpVariable(keyword, expr)
+
+    def visitFunctionExpr(self, expr):
+        visit = self.interpreter.visitFunctionExpr
+        return lambda: visit(expr)
+
+    def visitGroupingExpr(self, expr):
+        # Groupings are just parens, nothing to do at runtime
+        return self.compileExpr(expr.expression)
+
+    def visitLogicalExpr(self, expr):
+        left = self.compileExpr(expr.left)
+        right = self.compileExpr(expr.right)
+        isTruthy = self.interpreter.isTruthy
+
+        if (expr.operator.type.value == _TokenType.OR.value):
+            def logical_or():
+                l = left()
+                return l if isTruthy(l) else right()
+
+            return logical_or
+
+        def logical_and():
+            l = left()
+            return right() if isTruthy(l) else l
+
+        return logical_and
+
+    def visitLiteralExpr(self, expr):
+        value = expr.value
+
+        # Raw literals are boxed fresh each time, unless their box is one of the shared (interned) ones.
+        # With '-O' they come pre-boxed (shared) and fall through to the last case
+        if type(value) == int:
+            shared = _SMALL_INTS.get(value)
+            return (lambda: shared) if shared is not None else (lambda: _RocketInt(value))
+
+        if type(value) == float:
+            return lambda: _RocketFloat(value)
+
+        if type(value) == str:
+            shared = _makeString(value)
+            return (lambda: shared) if len(value) < 2 else (lambda: _RocketString(value))
+
+        if type(value) == bool:
+            shared = _TRUE if value else _FALSE
+            return lambda: shared
+
+        return lambda: value
+
+    def visitUnaryExpr(self, expr):
+        right = self.compileExpr(expr.right)
+        operator = expr.operator
+        unaryOp = self.interpreter.unaryOp
+
+        return lambda: unaryOp(operator, right())
+
+    def visitVariableExpr(self, expr):
+        interp = self.interpreter
+        lexeme = expr.name.lexeme
+        glob = interp.globals
+        lookupName = interp.lookupName
+        slot = getattr(expr, 'slot', None)
+        ref = [0, _UNSET] # [global table version, what the table holds for the name], see 'Interpreter.lookupName'
+
+        if slot is not None:
+            depth, index = slot
+
+            def local():
+                if ref[0] != glob.version:
+                    ref[0] = glob.version
+                    ref[1] = glob.lookup(lexeme)
+
+                # Globals (natives, fns) still shadow locals
+                if ref[1] is _UNSET:
+                    env = interp.environment
+
+                    for _ in range(depth):
+                        env = env.enclosing
+
+                    value = env.slots[index]
+
+                    if value is not _UNSET:
+                        return value
+
+                return lookupName(expr)
+
+            return local
+
+        def variable():
+            # Same order as 'lookupName', globals then the env chain
+            if ref[0] != glob.version:
+                ref[0] = glob.version
+                ref[1] = glob.lookup(lexeme)
+
+            if ref[1] is not _UNSET:
+                return ref[1]
+
+            env = interp.environment
+
+            while env is not None:
+                if env.__class__ is _SlotEnvironment:
+                    index = env.layout.names.get(lexeme)
+
+                    if (index is not None) and (env.slots[index] is not _UNSET):
+                        return env.slots[index]
+
+                    if env.extras is not None:
+                        return lookupName(expr)
+
+                else:
+                    if lexeme in env.values:
+                        return env.values[lexeme]
+
+                    if lexeme in env.statics:
+                        return env.statics[lexeme]
+
+                env = env.enclosing
+
+            # Let 'lookupName' report it
+            return lookupName(expr)
+
+        return variable
+
+    # Statements
+
+    def visitBlockStmt(self, stmt):
+        interp = self.interpreter
+        body = [self.compileStmt(s) for s in stmt.statements]
+        layout = getattr(stmt, 'layout', None)
+
+        # Nothing declared, so no env of its own
+        if getattr(stmt, 'flat', False):
+            def flat_block():
+                for run in body:
+                    signal = run()
+
+                    if (signal is _RETURN) or (signal is _BREAK):
+                        return signal
+
+            return flat_block
+
+        if getattr(stmt, 'counted', None) != None:
+            return self.countedLoop(stmt, layout)
+
+        # Loop body that recycles its env, see 'releaseEnvironment'
+        if (layout is not None) and layout.reuse:
+            def reused_block():
+                previous = interp.environment
+                env = _makeEnvironment(layout, previous)
+
+                try:
+                    interp.environment = env
+
+                    for run in body:
+                        signal = run()
+
+                        if (signal is _RETURN) or (signal is _BREAK):
+                            return signal
+
+                finally:
+                    interp.environment = previous
+                    _releaseEnvironment(env)
+
+            return reused_block
+
+        def block():
+            previous = interp.environment
+
+            try:
+                interp.environment = _SlotEnvironment(layout, previous) if layout is not None else _Environment(previous)
+
+                for run in body:
+                    signal = run()
+
+                    if (signal is _RETURN) or (signal is _BREAK):
+                        return signal
+
+            finally:
+                interp.environment = previous
+
+        return block
+
+    def countedLoop(self, stmt, layout):
+        # Same as 'Interpreter.countedLoop', 'i' stays a python int and is only boxed when 'body' reads it
+        interp = self.interpreter
+        init, loop, slot, op, limit, step, body, reads = stmt.counted
+
+        init = self.compileStmt(init)
+        loop = self.compileStmt(loop)
+        limit = self.compileExpr(limit)
+        body = self.compileStmt(body)
+        compare = _COMPARISON[op]
+
+        def counted_loop():
+            previous = interp.environment
+            env = _makeEnvironment(layout, previous)
+            slots = env.slots
+
+            try:
+                interp.environment = env
+                init()
+
+                # Not an Int to start with, nothing to specialize
+                if slots[slot].__class__ is not _RocketInt:
+                    return loop()
+
+                i = slots[slot].value
+
+                while True:
+                    bound = limit()
+
+                    # I.e 'n' was re-assigned to a non number, carry on the regular way from here
+                    if bound.__class__ is not _RocketInt and bound.__class__ is not _RocketFloat:
+                        slots[slot] = _makeInt(i)
+                        return loop()
+
+                    if not compare(i, bound.value):
+                        break
+
+                    if reads:
+                        shared = _SMALL_INTS.get(i)
+                        slots[slot] = shared if shared is not None else _RocketInt(i)
+
+                    signal = body()
+
+                    if signal is _BREAK:
+                        break
+
+                    if signal is _RETURN:
+                        return signal
+
+                    i += step
+
+                slots[slot] = _makeInt(i)
+
+            finally:
+                interp.environment = previous
+                _releaseEnvironment(env)
+
+        return counted_loop
+
+    def visitExpressionStmt(self, stmt):
+        return self.compileExpr(stmt.expression)
+
+    def visitPrintStmt(self, stmt):
+        value = self.compileExpr(stmt.expression)
+        printValue = self.interpreter.printValue
+
+        return lambda: printValue(value())
+
+    def visitClassStmt(self, stmt):
+        visit = self.interpreter.visitClassStmt
+        return lambda: visit(stmt)
+
+    def visitFuncStmt(self, stmt):
+        visit = self.interpreter.visitFuncStmt
+        return lambda: visit(stmt)
+
+    def visitVarStmt(self, stmt):
+        defineVar = self.interpreter.defineVar
+
+        if (stmt.initializer is not None):
+            init = self.compileExpr(stmt.initializer)
+            return lambda: defineVar(stmt, init())
+
+        return lambda: defineVar(stmt, None)
+
+    def visitConstStmt(self, stmt):
+        init = self.compileExpr(stmt.initializer)
+        defineConst = self.interpreter.defineConst
+
+        return lambda: defineConst(stmt, init())
+
+    def visitIfStmt(self, stmt):
+        cond = self.compileExpr(stmt.condition)
+        thenBranch = self.compileStmt(stmt.thenBranch)
+        elseBranch = self.compileStmt(stmt.elseBranch) if stmt.elseBranch != None else None
+        isTruthy = self.interpreter.isTruthy
+
+        def if_():
+            if isTruthy(cond()):
+                return thenBranch()
+
+            elif elseBranch != None:
+                return elseBranch()
+
+        return if_
+
+    def visitWhileStmt(self, stmt):
+        cond = self.compileExpr(stmt.condition)
+        body = self.compileStmt(stmt.body)
+        isTruthy = self.interpreter.isTruthy
+
+        def while_():
+            while isTruthy(cond()):
+                signal = body()
+
+                if signal is _BREAK:
+                    break
+
+                if signal is _RETURN:
+                    return signal
+
+        return while_
+
+    def visitBreakStmt(self, stmt):
+        return lambda: _BREAK
+
+    def visitReturnStmt(self, stmt):
+        interp = self.interpreter
+        nin_lexeme = interp.KSL[1][_TokenType.NIN.value]
+        value = self.compileExpr(stmt.value) if stmt.value != None else (lambda: nin_lexeme)
+
+        def return_():
+            interp.returnValue = value()
+            return _RETURN
+
+        return return_
+
+    def visitImportStmt(self, stmt):
+        visit = self.interpreter.visitImportStmt
+        return lambda: visit(stmt)
+
+    def visitDelStmt(self, stmt):
+        visit = self.interpreter.visitDelStmt
+        return lambda: visit(stmt)
+
+
+class ClosureInterpreter(_Interpreter):
+    # Same as the tree-walker except nodes run through their cached closures
+    def __init__(self, KSL: list):
+        super().__init__(KSL)
+        self.closures = ClosureCompiler(self)
+
+    def execute(self, stmt: _Stmt):
+        try:
+            run = stmt.compiled
+
+        except AttributeError:
+            run = self.closures.compileStmt(stmt)
+
+        return run()
+
+    def evaluate(self, expr: _Expr):
+        try:
+            run = expr.compiled
+
+        except AttributeError:
+            run = self.closures.compileExpr(expr)
+
+        return run()
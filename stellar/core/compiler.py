@@ -0,0 +1,633 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Bytecode Compiler (C) 2018
+
+from utils.expr import ExprVisitor  as _ExprVisitor
+from utils.expr import Expr         as _Expr
+from utils.expr import Get          as _Get
+from utils.expr import Set          as _Set
+from utils.expr import Assign       as _Assign
+from utils.expr import CompoundAssign as _CompoundAssign
+from utils.expr import Postfix      as _Postfix
+from utils.expr import Binary       as _Binary
+from utils.expr import Grouping     as _Grouping
+from utils.expr import Literal      as _Literal
+from utils.expr import Unary        as _Unary
+from utils.expr import Variable     as _Variable
+
+from utils.stmt import StmtVisitor  as _StmtVisitor
+from utils.stmt import Stmt         as _Stmt
+
+from utils.tokens import TokenType  as _TokenType
+
+from utils.env import UNSET         as _UNSET
+
+from core.operators import RAW_OPS      as _RAW_OPS
+from core.operators import ARITHMETIC   as _ARITHMETIC
+from core.operators import DIVISION     as _DIVISION
+from core.operators import COMPARISON   as _COMPARISON
+from core.operators import NUMBERS      as _NUMBERS
+from core.operators import RAW_NUMBERS  as _RAW_NUMBERS
+
+from native.datatypes.rocketNumber  import RocketInt     as _RocketInt
+from native.datatypes.rocketNumber  import RocketFloat   as _RocketFloat
+from native.datatypes.rocketNumber  import SMALL_INTS    as _SMALL_INTS
+from native.datatypes.rocketString  import RocketString  as _RocketString
+from native.datatypes.rocketString  import makeString    as _makeString
+from native.datatypes.rocketBoolean import TRUE          as _TRUE
+from native.datatypes.rocketBoolean import FALSE         as _FALSE
+
+
+# Opcodes
+# Mirrors 'rluna/utils/chunk.h' naming. Each instruction is an opcode plus a single operand slot.
+# Operands are either indices into the chunk's constant pool or relative jump offsets.
+# The VM runs each one through its handler in 'VM.dispatch', which is indexed by the opcode itself.
+OP_RETURN            = 0  # leave the chunk signalling 'RETURN', top of stack is the value
+OP_CONSTANT          = 1  # push constant as is (shared boxes, raw nums of the unboxed path)
+OP_LITERAL           = 2  # (box class, raw value) in constant pool, push a freshly boxed literal
+OP_POP               = 3
+OP_GET_VAR           = 4  # (Variable expr, global cache, lexeme) in constant pool
+OP_SET_VAR           = 5  # (Assign expr, keep) in constant pool. Leaves value on stack if 'keep', see 'emitStore'
+OP_DEFINE_VAR        = 6  # (Var stmt, global cache, slot) in constant pool
+OP_DEFINE_CONST      = 7  # Const stmt in constant pool
+OP_GET_PROPERTY      = 8  # (Get expr, shape cache) in constant pool
+OP_CHECK_SET         = 9  # Set expr in constant pool. Validates the object before its value is evaluated
+OP_SET_PROPERTY      = 10 # (Set expr, shape cache, keep) in constant pool
+OP_THIS              = 11 # This expr in constant pool
+OP_BINARY            = 12 # (operator token, {operand classes: handler}) in constant pool, boxed operands ('==', '!=')
+OP_UNARY             = 13 # operator token in constant pool
+OP_CALL              = 14 # (Call expr, arg count, tail) in constant pool
+OP_PRINT             = 15
+OP_JUMP              = 16 # forward jump offset
+OP_JUMP_IF_FALSE     = 17 # forward jump offset. Leaves condition on stack
+OP_JUMP_IF_TRUE      = 18 # forward jump offset. Leaves condition on stack
+OP_POP_JUMP_IF_FALSE = 19 # forward jump offset. Pops condition
+OP_LOOP              = 20 # backward jump offset
+OP_PUSH_ENV          = 21
+OP_POP_ENV           = 22
+OP_BREAK             = 23 # 'break' outside of any loop compiled into this chunk, leave it signalling 'BREAK'
+OP_POP_LOOP_IF_TRUE  = 24 # backward jump offset. Pops condition, closes 'while' loops
+OP_EXEC              = 25 # fallback: tree-walk stmt in constant pool. Only nested multi-variable definitions end up here
+OP_GET_LOCAL         = 26 # (Variable expr, global cache, depth, slot) in constant pool
+OP_SET_LOCAL         = 27 # (Assign expr, depth, slot, keep) in constant pool. Same as 'OP_SET_VAR'
+OP_GET_METHOD        = 28 # Get expr in constant pool. Pushes callee and instance, see 'Interpreter.getMethod'
+OP_INVOKE            = 29 # (Call expr, arg count, tail) in constant pool. Like 'OP_CALL' but for callees pushed by 'OP_GET_METHOD'
+OP_COUNTED           = 30 # (counted Block stmt, {stmt: chunk}) in constant pool, see 'Interpreter.countedLoop'
+OP_GET_LOCAL_RAW     = 31 # Same as 'OP_GET_LOCAL', but numbers are pushed unboxed
+OP_GET_VAR_RAW       = 32 # Same as 'OP_GET_VAR', but numbers are pushed unboxed
+OP_UNBOX             = 33 # unbox top of stack if it is a number
+OP_BOX               = 34 # box top of stack if it is a raw number, see 'boxRaw'
+OP_ARITH             = 35 # (operator token, python fn, box) in constant pool. Raw operands, see 'rawNumberOp'. Boxes its result if 'box'
+OP_DIVIDE            = 36 # (operator token, python fn, box) in constant pool. Same as 'OP_ARITH' plus the zero check
+OP_POWER             = 37 # operator token in constant pool. Raw operands, can go complex
+OP_NEGATE            = 38 # operator token in constant pool. Raw operand
+OP_POSTFIX           = 39 # (Postfix expr, step, global cache, slot, keep) in constant pool
+OP_SUPER             = 40 # Super expr in constant pool
+OP_FUNCTION          = 41 # Function expr in constant pool, push an anonymous fn closing over the current env
+OP_DEFINE_FUNC       = 42 # Func stmt in constant pool
+OP_DEFINE_CLASS      = 43 # Class stmt in constant pool, superclass (or 'None') on the stack
+OP_IMPORT            = 44 # Import stmt in constant pool
+OP_DEL               = 45 # Del stmt in constant pool
+OP_ARITH_CONST       = 46 # (operator token, python fn, raw num, box) in constant pool. Same as 'OP_ARITH' with the right operand built in
+
+OPNAMES = {
+    OP_RETURN: 'OP_RETURN',
+    OP_CONSTANT: 'OP_CONSTANT',
+    OP_LITERAL: 'OP_LITERAL',
+    OP_POP: 'OP_POP',
+    OP_GET_VAR: 'OP_GET_VAR',
+    OP_SET_VAR: 'OP_SET_VAR',
+    OP_DEFINE_VAR: 'OP_DEFINE_VAR',
+    OP_DEFINE_CONST: 'OP_DEFINE_CONST',
+    OP_GET_PROPERTY: 'OP_GET_PROPERTY',
+    OP_CHECK_SET: 'OP_CHECK_SET',
+    OP_SET_PROPERTY: 'OP_SET_PROPERTY',
+    OP_THIS: 'OP_THIS',
+    OP_BINARY: 'OP_BINARY',
+    OP_UNARY: 'OP_UNARY',
+    OP_CALL: 'OP_CALL',
+    OP_PRINT: 'OP_PRINT',
+    OP_JUMP: 'OP_JUMP',
+    OP_JUMP_IF_FALSE: 'OP_JUMP_IF_FALSE',
+    OP_JUMP_IF_TRUE: 'OP_JUMP_IF_TRUE',
+    OP_POP_JUMP_IF_FALSE: 'OP_POP_JUMP_IF_FALSE',
+    OP_LOOP: 'OP_LOOP',
+    OP_PUSH_ENV: 'OP_PUSH_ENV',
+    OP_POP_ENV: 'OP_POP_ENV',
+    OP_BREAK: 'OP_BREAK',
+    OP_POP_LOOP_IF_TRUE: 'OP_POP_LOOP_IF_TRUE',
+    OP_EXEC: 'OP_EXEC',
+    OP_GET_LOCAL: 'OP_GET_LOCAL',
+    OP_SET_LOCAL: 'OP_SET_LOCAL',
+    OP_GET_METHOD: 'OP_GET_METHOD',
+    OP_INVOKE: 'OP_INVOKE',
+    OP_COUNTED: 'OP_COUNTED',
+    OP_GET_LOCAL_RAW: 'OP_GET_LOCAL_RAW',
+    OP_GET_VAR_RAW: 'OP_GET_VAR_RAW',
+    OP_UNBOX: 'OP_UNBOX',
+    OP_BOX: 'OP_BOX',
+    OP_ARITH: 'OP_ARITH',
+    OP_DIVIDE: 'OP_DIVIDE',
+    OP_POWER: 'OP_POWER',
+    OP_NEGATE: 'OP_NEGATE',
+    OP_POSTFIX: 'OP_POSTFIX',
+    OP_SUPER: 'OP_SUPER',
+    OP_FUNCTION: 'OP_FUNCTION',
+    OP_DEFINE_FUNC: 'OP_DEFINE_FUNC',
+    OP_DEFINE_CLASS: 'OP_DEFINE_CLASS',
+    OP_IMPORT: 'OP_IMPORT',
+    OP_DEL: 'OP_DEL',
+    OP_ARITH_CONST: 'OP_ARITH_CONST',
+}
+
+# Instructions whose operand is a jump offset rather than a constant index
+JUMPS = [OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_POP_JUMP_IF_FALSE, OP_LOOP, OP_POP_LOOP_IF_TRUE]
+
+# Backward ones
+LOOPS = [OP_LOOP, OP_POP_LOOP_IF_TRUE]
+
+# Instructions without an operand
+SIMPLE = [OP_POP, OP_PRINT, OP_POP_ENV, OP_BREAK, OP_RETURN, OP_UNBOX, OP_BOX]
+
+
+class Chunk:
+    def __init__(self):
+        self.code = [] # opcodes
+        self.args = [] # one operand per opcode
+        self.lines = [] # source line per opcode
+        self.constants = []
+        self.linked = None # '(handler, operand)' per instruction, filled in by 'VM.link' on the first run
+
+    def write(self, op: int, arg: int = 0, line: int = 0):
+        self.code.append(op)
+        self.args.append(arg)
+        self.lines.append(line)
+
+        return len(self.code) - 1
+
+    def addConstant(self, value: object):
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+
+class Compiler(_ExprVisitor, _StmtVisitor):
+    def __init__(self, KSL: list):
+        self.KSL = KSL
+        self.chunk = None
+        self.line = 0
+        self.scopeDepth = 0 # number of 'OP_PUSH_ENV' currently open
+        self.loops = [] # [(scopeDepth, [break jumps])] for each enclosing loop
+
+    def compile(self, statements: list):
+        self.chunk = Chunk()
+        self.scopeDepth = 0
+        self.loops = []
+
+        for stmt in statements:
+            if type(stmt) == list:
+                # Multi-variable definitions
+                for decl in stmt:
+                    self.compileStmt(decl)
+
+            else:
+                self.compileStmt(stmt)
+
+        return self.chunk
+
+    def compileNested(self, statements: list):
+        # Compiles 'statements' into a chunk of their own, the one being built is left as it was
+        saved = (self.chunk, self.line, self.scopeDepth, self.loops)
+
+        try:
+            return self.compile(statements)
+
+        finally:
+            self.chunk, self.line, self.scopeDepth, self.loops = saved
+
+    # Helpers
+
+    def compileStmt(self, stmt: _Stmt):
+        # 'executeBlock' would choke on a nested list the same way
+        if type(stmt) == list:
+            self.emit(OP_EXEC, self.chunk.addConstant(stmt))
+
+        else:
+            stmt.accept(self)
+
+    def compileExpr(self, expr: _Expr):
+        expr.accept(self)
+
+    def compileRaw(self, expr: _Expr, box: bool = False):
+        # Same as 'compileExpr', except Rocket numbers end up on the stack as raw python nums.
+        # Same rules as 'Interpreter.evaluateRaw', whoever starts the raw tree asks for its result boxed (see 'OP_BOX')
+        kind = expr.__class__
+
+        if kind is _Grouping:
+            return self.compileRaw(expr.expression, box)
+
+        if (kind is _Binary) and (expr.operator.type in _RAW_OPS):
+            self.compileRaw(expr.left)
+            right = self.rawConstant(expr.right)
+
+            self.markLine(expr.operator)
+
+            # I.e 'i + 1', 'n < 2'. Divisions by a '0' constant keep their zero check
+            if (right is not None) and (expr.operator.type != _TokenType.EXP) and ((right != 0) or (expr.operator.type not in _DIVISION)):
+                fn = _DIVISION.get(expr.operator.type) or _ARITHMETIC.get(expr.operator.type) or _COMPARISON[expr.operator.type]
+                return self.emitConstant(OP_ARITH_CONST, (expr.operator, fn, right, box))
+
+            self.compileRaw(expr.right)
+            return self.emitRawOp(expr.operator, box)
+
+        value = self.rawConstant(expr)
+
+        if value is not None:
+            self.emitConstant(OP_CONSTANT, value)
+
+        elif (kind is _Unary) and (expr.operator.type == _TokenType.MINUS):
+            self.compileRaw(expr.right)
+
+            self.markLine(expr.operator)
+            self.emitConstant(OP_NEGATE, expr.operator)
+
+        elif kind is _Variable:
+            self.emitRead(expr, True)
+
+        else:
+            # Already boxed (or not a number at all)
+            self.compileExpr(expr)
+            return None if box else self.emit(OP_UNBOX)
+
+        if box:
+            self.emit(OP_BOX)
+
+    def rawConstant(self, expr: _Expr):
+        # The raw python num a numeric literal stands for, 'None' for anything else
+        while expr.__class__ is _Grouping:
+            expr = expr.expression
+
+        if expr.__class__ is not _Literal:
+            return None
+
+        value = expr.value
+
+        # I.e pre-boxed under '-O'
+        if value.__class__ in _NUMBERS:
+            value = value.value
+
+        if value.__class__ in _RAW_NUMBERS:
+            return value
+
+        return None
+
+    def emitRead(self, expr: _Expr, raw: bool = False):
+        # Pushes the value of the name a 'Variable' (or a 'CompoundAssign' standing in for one) refers to.
+        # Each site gets its own '[global table version, what the table holds for the name]' cache, see 'Interpreter.lookupName'
+        self.markLine(expr.name)
+
+        if getattr(expr, 'slot', None) is not None:
+            self.emitConstant(OP_GET_LOCAL_RAW if raw else OP_GET_LOCAL, (expr, [0, _UNSET], expr.slot[0], expr.slot[1]))
+
+        else:
+            self.emitConstant(OP_GET_VAR_RAW if raw else OP_GET_VAR, (expr, [0, _UNSET], expr.name.lexeme))
+
+    def emitRawOp(self, operator: object, box: bool = False):
+        # '**' can go complex, leave it to 'rawNumberOp'
+        if operator.type == _TokenType.EXP:
+            self.emitConstant(OP_POWER, operator)
+            return self.emit(OP_BOX) if box else None
+
+        if operator.type in _DIVISION:
+            return self.emitConstant(OP_DIVIDE, (operator, _DIVISION[operator.type], box))
+
+        return self.emitConstant(OP_ARITH, (operator, _ARITHMETIC.get(operator.type) or _COMPARISON[operator.type], box))
+
+    def emit(self, op: int, arg: int = 0):
+        return self.chunk.write(op, arg, self.line)
+
+    def emitConstant(self, op: int, value: object):
+        return self.emit(op, self.chunk.addConstant(value))
+
+    def emitJump(self, op: int):
+        # Offset gets filled in by 'patchJump' once we know where to land
+        return self.emit(op, 0)
+
+    def patchJump(self, offset: int):
+        self.chunk.args[offset] = len(self.chunk.code) - offset - 1
+
+    def emitLoop(self, start: int, op: int = OP_LOOP):
+        self.emit(op, len(self.chunk.code) - start + 1)
+
+    def emitStore(self, expr: _Expr, keep: bool):
+        # Assigns the top of stack to the name of an 'Assign'/'CompoundAssign'. It stays on the stack if 'keep', assignments used as statements pop it right away
+        if getattr(expr, 'slot', None) is not None:
+            self.emitConstant(OP_SET_LOCAL, (expr, expr.slot[0], expr.slot[1], keep))
+
+        else:
+            self.emitConstant(OP_SET_VAR, (expr, keep))
+
+    def markLine(self, token: object):
+        if hasattr(token, 'line'):
+            self.line = token.line
+
+    # Expressions
+
+    def visitAssignExpr(self, expr, keep=True):
+        self.markLine(expr.name)
+        self.compileExpr(expr.value)
+        self.emitStore(expr, keep)
+
+    def visitCompoundAssignExpr(self, expr, keep=True):
+        # 'a op= b' compiles the same as 'a = a op b', the node stands in for the Variable and Assign
+        if expr.operator.type in _RAW_OPS:
+            self.emitRead(expr, True)
+            self.compileRaw(expr.value)
+
+            self.emitRawOp(expr.operator, True)
+
+        else:
+            self.emitRead(expr)
+            self.compileExpr(expr.value)
+
+            self.emitConstant(OP_BINARY, (expr.operator, {}))
+
+        self.emitStore(expr, keep)
+
+    def visitPostfixExpr(self, expr, keep=True):
+        # Pushes the old value while storing the new one
+        self.markLine(expr.name)
+        self.emitConstant(OP_POSTFIX, (expr, 1 if expr.operator.type == _TokenType.PLUS else -1, [0, _UNSET], getattr(expr, 'slot', None), keep))
+
+    def visitBinaryExpr(self, expr):
+        # Arithmetic and ordering ops run unboxed down their whole operand tree, only the final result gets boxed (ordering ops already hand back bools)
+        if expr.operator.type in _RAW_OPS:
+            self.compileRaw(expr, expr.operator.type not in _COMPARISON)
+            return
+
+        self.compileExpr(expr.left)
+        self.compileExpr(expr.right)
+
+        self.markLine(expr.operator)
+        self.emitConstant(OP_BINARY, (expr.operator, {}))
+
+    def visitCallExpr(self, expr):
+        # 'obj.method(...)' calls skip binding the method when they can
+        invoke = isinstance(expr.callee, _Get)
+
+        if invoke:
+            self.compileExpr(expr.callee.object)
+
+            self.markLine(expr.callee.name)
+            self.emitConstant(OP_GET_METHOD, expr.callee)
+
+        else:
+            self.compileExpr(expr.callee)
+
+        for arg in expr.args:
+            self.compileExpr(arg)
+
+        self.markLine(expr.paren)
+        self.emitConstant(OP_INVOKE if invoke else OP_CALL, (expr, len(expr.args), getattr(expr, 'tail', False)))
+
+    def visitConditionalExpr(self, expr):
+        self.compileExpr(expr.expr)
+        elseJump = self.emitJump(OP_POP_JUMP_IF_FALSE)
+
+        self.compileExpr(expr.thenExpr)
+        endJump = self.emitJump(OP_JUMP)
+
+        self.patchJump(elseJump)
+        self.compileExpr(expr.elseExpr)
+
+        self.patchJump(endJump)
+
+    def visitGetExpr(self, expr):
+        self.compileExpr(expr.object)
+
+        self.markLine(expr.name)
+        self.emitConstant(OP_GET_PROPERTY, (expr, [None, 0]))
+
+    def visitSetExpr(self, expr, keep=True):
+        self.compileExpr(expr.object)
+
+        self.markLine(expr.name)
+        self.emitConstant(OP_CHECK_SET, expr)
+
+        self.compileExpr(expr.value)
+
+        # '[shape before, shape after, index]' of the last store here, see 'Interpreter.setProperty'
+        self.emitConstant(OP_SET_PROPERTY, (expr, [None, None, 0], keep))
+
+    def visitSuperExpr(self, expr):
+        self.markLine(expr.keyword)
+        self.emitConstant(OP_SUPER, expr)
+
+    def visitThisExpr(self, expr):
+        self.markLine(expr.keyword)
+        self.emitConstant(OP_THIS, expr)
+
+    def visitFunctionExpr(self, expr):
+        # Closure captures the current env at runtime, body gets compiled on first call
+        self.emitConstant(OP_FUNCTION, expr)
+
+    def visitGroupingExpr(self, expr):
+        self.compileExpr(expr.expression)
+
+    def visitLogicalExpr(self, expr):
+        self.compileExpr(expr.left)
+
+        if (expr.operator.type.value == _TokenType.OR.value):
+            endJump = self.emitJump(OP_JUMP_IF_TRUE)
+
+        else:
+            endJump = self.emitJump(OP_JUMP_IF_FALSE)
+
+        self.emit(OP_POP)
+        self.compileExpr(expr.right)
+
+        self.patchJump(endJump)
+
+    def visitLiteralExpr(self, expr):
+        # Raw literals get boxed on each run unless their box is one of the shared ones, values already boxed by the optimizer are shared as is.
+        # Same rules as the closure engine's literals
+        value = expr.value
+
+        if type(value) == int:
+            shared = _SMALL_INTS.get(value)
+
+            if shared is not None:
+                self.emitConstant(OP_CONSTANT, shared)
+
+            else:
+                self.emitConstant(OP_LITERAL, (_RocketInt, value))
+
+        elif type(value) == float:
+            self.emitConstant(OP_LITERAL, (_RocketFloat, value))
+
+        elif type(value) == str:
+            if len(value) < 2:
+                self.emitConstant(OP_CONSTANT, _makeString(value))
+
+            else:
+                self.emitConstant(OP_LITERAL, (_RocketString, value))
+
+        elif type(value) == bool:
+            self.emitConstant(OP_CONSTANT, _TRUE if value else _FALSE)
+
+        else:
+            self.emitConstant(OP_CONSTANT, value)
+
+    def visitUnaryExpr(self, expr):
+        self.compileExpr(expr.right)
+
+        self.markLine(expr.operator)
+        self.emitConstant(OP_UNARY, expr.operator)
+
+    def visitVariableExpr(self, expr):
+        self.emitRead(expr)
+
+    # Statements
+
+    def visitBlockStmt(self, stmt):
+        # Nothing declared, so no env of its own
+        if getattr(stmt, 'flat', False):
+            for s in stmt.statements:
+                self.compileStmt(s)
+
+            return
+
+        # 'for' loops over an int counter. The VM hands these to 'Interpreter.countedLoop', with each piece compiled to its own chunk
+        if getattr(stmt, 'counted', None) != None:
+            init, loop, _, _, _, _, body, _ = stmt.counted
+            chunks = {s: self.compileNested([s]) for s in (init, loop, body)}
+
+            self.emitConstant(OP_COUNTED, (stmt, chunks))
+            return
+
+        self.emitConstant(OP_PUSH_ENV, getattr(stmt, 'layout', None))
+        self.scopeDepth += 1
+
+        for s in stmt.statements:
+            self.compileStmt(s)
+
+        self.scopeDepth -= 1
+        self.emit(OP_POP_ENV)
+
+    def visitExpressionStmt(self, stmt):
+        expr = stmt.expression
+
+        # Stores used as statements drop their value themselves
+        if expr.__class__ is _Assign:
+            self.visitAssignExpr(expr, False)
+
+        elif expr.__class__ is _CompoundAssign:
+            self.visitCompoundAssignExpr(expr, False)
+
+        elif expr.__class__ is _Set:
+            self.visitSetExpr(expr, False)
+
+        elif expr.__class__ is _Postfix:
+            self.visitPostfixExpr(expr, False)
+
+        else:
+            self.compileExpr(expr)
+            self.emit(OP_POP)
+
+    def visitPrintStmt(self, stmt):
+        self.compileExpr(stmt.expression)
+        self.emit(OP_PRINT)
+
+    def visitClassStmt(self, stmt):
+        self.markLine(stmt.name)
+
+        if stmt.superclass != None:
+            self.compileExpr(stmt.superclass)
+
+        else:
+            self.emitConstant(OP_CONSTANT, None)
+
+        self.emitConstant(OP_DEFINE_CLASS, stmt)
+
+    def visitFuncStmt(self, stmt):
+        self.markLine(stmt.name)
+        self.emitConstant(OP_DEFINE_FUNC, stmt)
+
+    def visitVarStmt(self, stmt):
+        self.markLine(stmt.name)
+
+        if (stmt.initializer is not None):
+            self.compileExpr(stmt.initializer)
+
+        else:
+            self.emitConstant(OP_CONSTANT, None)
+
+        # '[global table version, whether the table holds the name]', see 'Interpreter.defineVar'
+        self.emitConstant(OP_DEFINE_VAR, (stmt, [0, False], getattr(stmt, 'slot', None)))
+
+    def visitConstStmt(self, stmt):
+        self.markLine(stmt.name)
+        self.compileExpr(stmt.initializer)
+        self.emitConstant(OP_DEFINE_CONST, stmt)
+
+    def visitIfStmt(self, stmt):
+        self.compileExpr(stmt.condition)
+        elseJump = self.emitJump(OP_POP_JUMP_IF_FALSE)
+
+        self.compileStmt(stmt.thenBranch)
+
+        if (stmt.elseBranch != None):
+            endJump = self.emitJump(OP_JUMP)
+            self.patchJump(elseJump)
+
+            self.compileStmt(stmt.elseBranch)
+            self.patchJump(endJump)
+
+        else:
+            self.patchJump(elseJump)
+
+    def visitWhileStmt(self, stmt):
+        # Condition goes after the body, so each iteration only takes the one jump back
+        condJump = self.emitJump(OP_JUMP)
+        start = len(self.chunk.code)
+
+        self.loops.append((self.scopeDepth, []))
+        self.compileStmt(stmt.body)
+        _, breaks = self.loops.pop()
+
+        self.patchJump(condJump)
+        self.compileExpr(stmt.condition)
+        self.emitLoop(start, OP_POP_LOOP_IF_TRUE)
+
+        for jump in breaks:
+            self.patchJump(jump)
+
+    def visitBreakStmt(self, stmt):
+        if not self.loops:
+            # No loop in this chunk, so just signal it like the tree-walker does
+            self.emit(OP_BREAK)
+            return
+
+        depth, breaks = self.loops[-1]
+
+        # Unwind any block envs opened inside the loop body before leaving it
+        for _ in range(self.scopeDepth - depth):
+            self.emit(OP_POP_ENV)
+
+        breaks.append(self.emitJump(OP_JUMP))
+
+    def visitReturnStmt(self, stmt):
+        self.markLine(stmt.keyword)
+
+        if stmt.value != None:
+            self.compileExpr(stmt.value)
+
+        else:
+            self.emitConstant(OP_CONSTANT, self.KSL[1][_TokenType.NIN.value]) # "nin"
+
+        self.emit(OP_RETURN)
+
+    def visitImportStmt(self, stmt):
+        self.emitConstant(OP_IMPORT, stmt)
+
+    def visitDelStmt(self, stmt):
+        self.emitConstant(OP_DEL, stmt)
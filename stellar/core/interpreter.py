@@ -7,6 +7,8 @@ import os  as _os
 
 from utils.expr import Expr         as _Expr
 from utils.expr import Assign       as _Assign
+from utils.expr import CompoundAssign as _CompoundAssign
+from utils.expr import Postfix      as _Postfix
 from utils.expr import Variable     as _Variable
 from utils.expr import ExprVisitor  as _ExprVisitor
 from utils.expr import Binary       as _Binary
@@ -23,8 +25,9 @@ from utils.expr import Unary        as _Unary
 from utils.expr import Literal      as _Literal
 
 from utils.reporter import runtimeError      as _RuntimeError
-from utils.reporter import BreakException    as _BreakException
-from utils.reporter import ReturnException   as _ReturnException
+from utils.reporter import BREAK             as _BREAK
+from utils.reporter import RETURN            as _RETURN
+from utils.reporter import TAIL_CALL         as _TAIL_CALL
 
 from utils.tokens import Token        as _Token
 from utils.tokens import TokenType    as _TokenType
@@ -46,11 +49,15 @@ from utils.stmt import Print          as _Print
 from utils.stmt import Expression     as _Expression
 
 from utils.env import Environment     as _Environment
+from utils.env import GlobalEnvironment as _GlobalEnvironment
+from utils.env import makeEnvironment as _makeEnvironment
+from utils.env import releaseEnvironment as _releaseEnvironment
+from utils.env import UNSET           as _UNSET
 
-from native.datastructs.rocketClass import RocketCallable  as _RocketCallable
 from native.datastructs.rocketClass import RocketFunction  as _RocketFunction
 from native.datastructs.rocketClass import RocketClass     as _RocketClass
 from native.datastructs.rocketClass import RocketInstance  as _RocketInstance
+from native.datastructs.rocketClass import NativeMethod    as _NativeMethod
 
 from core.scanner import Scanner as _Scanner
 
@@ -77,20 +84,49 @@ from utils.misc import importCodeStmts   as _importCodeStmts
 # to assert rocket datatypes
 from utils.misc import isType              as _isType
 
-# Array arithmetic fns
-from utils.misc import opOverArray        as _opOverArray
-from utils.misc import addArrays          as _addArrays
+# Runtime type tags
+import utils.tags as _tags
+
+# (operator, left type, right type) -> handler
+from core.operators import BINARY_OPS     as _BINARY_OPS
+from core.operators import implicitConcat as _implicitConcat
+from core.operators import concatLists    as _concatLists
+
+# Unboxed number fast path, see 'evaluateRaw'
+from core.operators import RAW_OPS        as _RAW_OPS
+from core.operators import NUMBERS        as _NUMBERS
+from core.operators import RAW_NUMBERS    as _RAW_NUMBERS
+from core.operators import COMPARISON     as _COMPARISON
+from core.operators import rawNumberOp    as _rawNumberOp
+from core.operators import boxRaw         as _boxRaw
+from core.operators import ONE            as _ONE
+
+# Callee kinds remembered by a call site's inline cache
+CALL_FUNCTION = 0 # user fn or method, keyed by its decleration
+CALL_CLASS    = 1 # user class, keyed by the class itself
+CALL_NATIVE   = 2 # native fn/type (i.e 'Print', 'List'), keyed by the python class
+CALL_METHOD   = 3 # bound native datatype method, keyed by its table entry
+
+
+# Default limit on nested Rocket calls, see 'Interpreter.setMaxCallDepth'
+MAX_CALL_DEPTH = 1000
+
+# Python frames a single Rocket call can nest (call -> invoke -> block -> stmt -> expr -> ...), with room for deeply nested bodies
+FRAMES_PER_CALL = 64
 
 
 class Interpreter(_ExprVisitor, _StmtVisitor):
     def __init__(self, KSL: list):
-        self.globals = _Environment() # For the native functions
+        self.globals = _GlobalEnvironment() # For the native functions
         self.environment = _Environment() # Functions / classes
         self.locals = {}
         self.errors = []
         self.KSL = KSL
-        self.stackCount = 0 # tracks stmt repetitions, 'stackoverflow' errs
-        self.fnCallee = None # Tracks current fn callee
+        self.callDepth = 0 # Rocket calls currently running, tail calls don't add to it
+        self.returnValue = None # Set by 'return' right before it signals 'RETURN'
+        self.tailCall = None # (fn, args, instance) behind the last 'TAIL_CALL'
+
+        self.setMaxCallDepth(MAX_CALL_DEPTH)
 
         # Statically define 'native' functions
         # random n between '0-1' {insecure}
@@ -144,200 +180,208 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
                 if not error.willDup: self.errors.append(error)
 
     def visitLiteralExpr(self, expr: _Literal):
-        if type(expr.value) == int:
-            return _rocketNumber.Int().call(self, [expr.value])
+        return self.literal(expr.value)
 
-        if type(expr.value) == float:
-            return _rocketNumber.Float().call(self, [expr.value])
+    def literal(self, value: object):
+        # Boxes a raw literal value into its Rocket datatype
+        if type(value) == int:
+            return _rocketNumber.makeInt(value)
 
-        if type(expr.value) == str:
-            return _rocketString.String().call(self, [expr.value])
+        if type(value) == float:
+            return _rocketNumber.RocketFloat(value)
 
-        if type(expr.value) == bool:
-            return _rocketBoolean.Bool().call(self, [expr.value])
+        if type(value) == str:
+            return _rocketString.String().call(self, [value])
 
-        return expr.value
+        if type(value) == bool:
+            return _rocketBoolean.Bool().call(self, [value])
+
+        return value
 
     def visitGroupingExpr(self, expr: _Grouping):
         return self.evaluate(expr.expression)
 
     def visitUnaryExpr(self, expr: _Unary):
-        right = self.sanitizeNum(self.evaluate(expr.right))
+        return self.unaryOp(expr.operator, self.evaluate(expr.right))
+
+    def unaryOp(self, operator: _Token, right: object):
+        right = self.sanitizeNum(right)
 
         # Handle '~' bit shifter
-        if (expr.operator.type == _TokenType.TILDE):
-            self.checkNumberOperand(expr.operator, right.value)
-            sum = -right.value - 1
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
+        if (operator.type == _TokenType.TILDE):
+            self.checkNumberOperand(operator, right.value)
+            return _boxRaw(-right.value - 1)
 
-        if (expr.operator.type == _TokenType.MINUS):
-            self.checkNumberOperand(expr.operator, right.value)
-            sum = -right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
+        if (operator.type == _TokenType.MINUS):
+            self.checkNumberOperand(operator, right.value)
+            return _boxRaw(-right.value)
 
-        if (expr.operator.type == _TokenType.BANG):
+        if (operator.type == _TokenType.BANG):
             return not (self.isTruthy(right.value))
 
         # If can't be matched return nothing
         return None
 
     def visitBinaryExpr(self, expr: _Binary):
-        # Sanitize to get nums if avail
-        left = self.sanitizeNum(self.evaluate(expr.left))
-        right = self.sanitizeNum(self.evaluate(expr.right))
+        # Arithmetic and ordering ops run unboxed down their whole operand tree, only the final result gets boxed
+        if expr.operator.type in _RAW_OPS:
+            return _boxRaw(self.evaluateRaw(expr))
 
-        # Catches all ops over an Array with a num
-        # That is '+', '-', '*', '/', '//', '%', '**'
-        if (expr.operator.lexeme in ['+', '-', '*', '/', '//', '%', '**']):
-            if (self.isRocketArray(left)) and (self.isRocketNumber(right)):
-                if (self.isNumberArray(left)) and not left.isEmpty:
-                    return _rocketArray.Array().call(self, _opOverArray(left, right, self.sanitizeNum, expr.operator.lexeme))
+        return self.binaryOp(expr.operator, self.evaluate(expr.left), self.evaluate(expr.right))
 
-                else:
-                    raise _RuntimeError(expr.operator, "Array must contain Number elements.", False)
+    def evaluateRaw(self, expr: _Expr):
+        # Same as 'evaluate', except that Rocket numbers come back as raw python nums
+        kind = expr.__class__
 
-            if (self.isRocketArray(right)) and (self.isRocketNumber(left)):
-                if (self.isNumberArray(right)) and not right.isEmpty:
-                    return _rocketArray.Array().call(self, _opOverArray(right, left, self.sanitizeNum, expr.operator.lexeme))
+        if (kind is _Binary) and (expr.operator.type in _RAW_OPS):
+            return _rawNumberOp(self, expr.operator, self.evaluateRaw(expr.left), self.evaluateRaw(expr.right))
 
-                else:
-                    raise _RuntimeError(expr.operator, "Array must contain Number elements.", False)
-
-        # overloaded operator '+' that performs:
-        # basic arithmetic addition (between numbers)
-        # string and implicit concatenation, i.e. String + [other type] = String
-        # list concatenation, i.e. [4,2,1] + [4,6] = [4,2,1,4,6]
-        # Array addition, i.e. [4,3,5] + [3,1,0] = [7,4,5]
-        if (expr.operator.type == _TokenType.PLUS):
-            # basic arithmetic addition
-            if self.is_number(left) and self.is_number(right):
-                sum = left.value + right.value
-                return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-            # String concatenation
-            if (isinstance(left, _rocketString.RocketString) and isinstance(right, _rocketString.RocketString)):
-                return _rocketString.String().call(self, [str(left.value) + str(right.value)])
-
-            # To support implicit string concactination
-            # E.g "Hailey" + 4 -> "Hailey4"
-            # No need to allow this anymore. We make 'String' compulsory
-            if ((isinstance(left, _rocketString.RocketString)) or (isinstance(right, _rocketString.RocketString))):
+        if kind is _Grouping:
+            return self.evaluateRaw(expr.expression)
+
+        if (kind is _Unary) and (expr.operator.type == _TokenType.MINUS):
+            right = self.evaluateRaw(expr.right)
+
+            return -right if right.__class__ in _RAW_NUMBERS else self.unaryOp(expr.operator, self.sanitizeNum(right))
+
+        if kind is _Literal:
+            value = expr.value
+
+            # I.e pre-boxed under '-O'
+            if value.__class__ in _NUMBERS:
+                return value.value
+
+            if value.__class__ in _RAW_NUMBERS:
+                return value
+
+        value = self.evaluate(expr)
+
+        return value.value if value.__class__ in _NUMBERS else value
+
+    def binaryOp(self, operator: _Token, left: object, right: object):
+        # Every Int/Float/String/List/Array pairing the ops take goes straight to its handler
+        handler = _BINARY_OPS.get((operator.type, left.__class__, right.__class__))
+
+        if handler != None:
+            return handler(self, operator, left, right)
+
+        # Raw python nums get boxed and looked up again
+        if (left.__class__ in _RAW_NUMBERS) or (right.__class__ in _RAW_NUMBERS):
+            return self.binaryOp(operator, self.sanitizeNum(left), self.sanitizeNum(right))
+
+        # What's left is 'nin', bools, instances, mismatched types and the equality ops
+        ltag = _tags.tagOf(left)
+        rtag = _tags.tagOf(right)
+
+        if (operator.type == _TokenType.PLUS):
+            # Implicit string concatenation, i.e. String + [other type] = String
+            if (ltag == _tags.STRING) or (rtag == _tags.STRING):
                 # Concatenation of 'nin' is prohibited!
-                if (type(left) == type(None)) or (type(right) == type(None)):
-                    raise _RuntimeError(expr.operator.lexeme, "Operands must be either both strings or both numbers.", False)
+                if (left == None) or (right == None):
+                    raise _RuntimeError(operator.lexeme, "Operands must be either both strings or both numbers.", False)
 
-                return _rocketString.String().call(self, [self.sanitizeString(left) + self.sanitizeString(right)])
+                return _implicitConcat(self, operator, left, right)
 
-            # allow python style list concatenation
-            if (isinstance(left, _rocketList.RocketList) or isinstance(right, _rocketList.RocketList)):
-                concat_tok = _Token(_TokenType.STRING, 'concat', 'concat', 0)
+            # Lets the List's 'concat' report whatever it can't take
+            if (ltag == _tags.LIST) or (rtag == _tags.LIST):
+                return _concatLists(self, operator, left, right)
 
-                # return new concatenated list
-                return left.get(concat_tok).call(self, [right])
+            if (left == None) or (right == None):
+                raise _RuntimeError(operator, "Operands must be either both strings or both numbers.", False)
 
-            if (self.isRocketArray(left)) and (self.isRocketArray(right)):
-                if (self.isNumberArray(left) and self.isNumberArray(right)) and not (left.isEmpty or right.isEmpty):
-                    return _rocketArray.Array().call(self, _addArrays(left, right, self.sanitizeNum))
+            # I.e 'true + true'
+            return None
 
-                else:
-                    raise _RuntimeError(expr.operator, "Cannot concat empty Array(s).", False)
-
-            if (type(left) == type(None)) or (type(right) == type(None)):
-                raise _RuntimeError(expr.operator, "Operands must be either both strings or both numbers.", False)
-
-        # Arithmetic operators "-", "/", "%", "//", "*", "**"
-        if (expr.operator.type == _TokenType.MINUS):
-            self.checkNumberOperands(expr.operator, left, right)
-            sum = left.value - right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.DIV):
-            self.checkNumberOperands(expr.operator, left, right)
-            if right.value == 0:
-                raise _RuntimeError(right, "ZeroDivError: Can't divide by zero", False)
-
-            sum = left.value / right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.MOD):
-            self.checkNumberOperands(expr.operator, left, right)
-            if right.value == 0:
-                raise _RuntimeError(right, "ZeroDivError: Can't divide by zero", False)
-
-            sum = left.value % right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.FLOOR):
-            self.checkNumberOperands(expr.operator, left, right)
-            if right.value == 0:
-                raise _RuntimeError(right, "ZeroDivError: Can't divide by zero", False)
-
-            sum = left.value // right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.MULT):
-            self.checkNumberOperands(expr.operator, left, right)
-            sum = left.value * right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.EXP):
-            self.checkNumberOperands(expr.operator, left, right)
-            sum = left.value ** right.value
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        # bitshifters "<<", ">>"
-        if (expr.operator.type == _TokenType.LESS_LESS):
-            self.checkNumberOperands(expr.operator, left, right)
-            sum = left.value * (2 ** right.value)
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        if (expr.operator.type == _TokenType.GREATER_GREATER):
-            self.checkNumberOperands(expr.operator, left, right)
-            sum = left.value // (2 ** right.value)
-            return _rocketNumber.Int().call(self, [sum]) if type(sum) == int else _rocketNumber.Float().call(self, [sum])
-
-        # Comparison operators ">", "<", ">=", "<=", "!=", "=="
-        if (expr.operator.type == _TokenType.GREATER):
-            self.checkNumberOperands(expr.operator, left, right)
-            return left.value > right.value
-
-        if (expr.operator.type == _TokenType.LESS):
-            self.checkNumberOperands(expr.operator, left, right)
-            return left.value < right.value
-
-        if (expr.operator.type == _TokenType.GREATER_EQUAL):
-            self.checkNumberOperands(expr.operator, left, right)
-            return left.value >= right.value
-
-        if (expr.operator.type == _TokenType.LESS_EQUAL):
-            self.checkNumberOperands(expr.operator, left, right)
-            return left.value <= right.value
-
-        if (expr.operator.type == _TokenType.BANG_EQUAL):
-            self.checkValidOperands(expr.operator, left, right)
+        # The other arithmetic and ordering ops only take numbers
+        if operator.type in _RAW_OPS:
+            raise _RuntimeError(operator.lexeme, "Operands must be numbers.", False)
+
+        if (operator.type == _TokenType.BANG_EQUAL):
+            self.checkValidOperands(operator, left, right)
             return not (self.isEqual(left, right))
 
-        if (expr.operator.type == _TokenType.EQUAL_EQUAL):
+        if (operator.type == _TokenType.EQUAL_EQUAL):
             if left == None or right == None:
                 return self.isEqual(left, right)
 
             if isinstance(left, _rocketBoolean.Bool) or isinstance(right, _rocketBoolean.Bool):
                 return self.isEqual(left, right)
 
-            self.checkValidOperands(expr.operator, left, right)
+            self.checkValidOperands(operator, left, right)
             return self.isEqual(left, right)
 
         # If can't be matched return None
         return None
 
     def visitCallExpr(self, expr: _Call):
-        callee = self.evaluate(expr.callee)
+        instance = None
+
+        # 'obj.method(...)', try to skip binding 'method' to 'obj'
+        if isinstance(expr.callee, _Get):
+            callee, instance = self.getMethod(self.evaluate(expr.callee.object), expr.callee)
+
+        else:
+            callee = self.evaluate(expr.callee)
 
         eval_args = []
         for arg in expr.args:
             # Fix passing expr and stmt to 'stdlib' functions
             eval_args.append(self.evaluate(arg))
 
+        if instance is not None:
+            return self.callMethod(callee, instance, eval_args, expr)
+
+        return self.callValue(callee, eval_args, expr)
+
+    def getMethod(self, object: object, expr: _Get):
+        # Like 'getProperty', but a plain method of a user class instance comes back unbound along with its instance (else instance is 'None').
+        # The call then runs it with 'callMethod' instead of allocating a bound fn first.
+        # NOTE: 'init' is left to 'getProperty' since 'RocketInstance.get' binds it twice
+        if (object.__class__ is _RocketInstance) and not (object.field(expr.name.lexeme) != None):
+            method = object._class.findMethod(expr.name.lexeme)
+
+            if (method != None) and not method.isInit:
+                return method, object
+
+        return self.getProperty(object, expr), None
+
+    def callMethod(self, method: _RocketFunction, instance: _RocketInstance, eval_args: list, expr: _Call):
+        if len(eval_args) == len(method.decleration.params):
+            return self.callFunction(method, eval_args, expr, instance)
+
+        # Let the regular path bind it and report the arity error
+        return self.callValue(method.bind(instance, expr.callee.name.lexeme), eval_args, expr)
+
+    def callValue(self, callee: object, eval_args: list, expr: _Call):
+        # Fast path, the call site already saw this target. Any mismatch (new target or arity) drops to the slow path below
+        cache = getattr(expr, 'inline', None)
+
+        if cache is not None:
+            kind, key, overideArity = cache
+
+            if kind == CALL_FUNCTION:
+                if (callee.__class__ is _RocketFunction) and (callee.decleration is key) and (len(eval_args) == len(key.params)):
+                    return self.callFunction(callee, eval_args, expr)
+
+            elif kind == CALL_CLASS:
+                # Arity is worked out once the class is defined, see 'RocketClass.countArity'
+                if (callee is key) and (len(eval_args) == callee.initArity):
+                    return self.callFunction(callee, eval_args, expr)
+
+            elif kind == CALL_NATIVE:
+                if callee is key:
+                    function = callee()
+
+                    if overideArity:
+                        return function.call(self, eval_args)
+
+                    if len(eval_args) == function.arity():
+                        return self.callFunction(function, eval_args, expr)
+
+            elif kind == CALL_METHOD:
+                if (callee.__class__ is _NativeMethod) and (callee.spec is key) and (len(eval_args) == key[1]):
+                    return self.callFunction(callee, eval_args, expr)
+
         # Well, native functions in 'native/' have a special 'nature' field to distinguish them from user defined funcs.
         isNotNative = True
         isNotDatatype = True
@@ -354,7 +398,7 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
                 isNotDatatype = False
 
         # Specially inject check for 'rocketClass' and 'rocketCallable'
-        isNotCallable = not self.isRocketCallable(callee) #isinstance(callee, _RocketCallable)
+        isNotCallable = not self.isRocketCallable(callee)
         isNotClass = not self.isRocketClass(callee) # isinstance(callee, _RocketClass)
 
         if isNotCallable and isNotClass and isNotNative and isNotDatatype:
@@ -387,40 +431,91 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         if hasattr(function, 'inc'):
             return function.call(self, eval_args, function.inc)
 
+        # Arity checks out, remember the target kind for the next call from this site
+        # NOTE: 'slice'/'splice' change their arity per call so they always take the slow path
+        if not (hasattr(function, 'slice') or hasattr(function, 'splice')):
+            if not isNotNative:
+                expr.inline = (CALL_NATIVE, callee, overideArity)
+
+            elif function.__class__ is _RocketFunction:
+                expr.inline = (CALL_FUNCTION, function.decleration, False)
+
+            elif function.__class__ is _RocketClass:
+                expr.inline = (CALL_CLASS, function, False)
+
+            elif function.__class__ is _NativeMethod:
+                expr.inline = (CALL_METHOD, function.spec, False)
+
         if overideArity:
             return function.call(self, eval_args)
 
         else:
-            try:
-                if (hasattr(expr.callee, 'name')):
-                    # fns do not have 'name' so be careful
-                    # Monitor recursive calls to same function
-                    # set current function
-                    if (self.stackCount == 66):
-                        # Reset counter
-                        self.stackCount = 0
+            return self.callFunction(function, eval_args, expr)
 
-                        raise _RuntimeError(expr.callee.name.lexeme, f"Maximum recursion depth reached from calls to '{expr.callee.name.lexeme}' fn.", False)
+    def setMaxCallDepth(self, depth: int):
+        # Every Rocket call nests a bunch of Python frames, so make sure Python's own limit won't trip first
+        self.maxCallDepth = depth
+        _sys.setrecursionlimit(max(_sys.getrecursionlimit(), depth * FRAMES_PER_CALL + 1000))
+
+    def callFunction(self, function: object, eval_args: list, expr: _Call, instance: _RocketInstance = None):
+        # Arity already checked, just track the stack and call.
+        # 'instance' is only set for unbound methods handed out by 'getMethod'
+
+        # 'return f(...)', the resolver marks these. Don't call here, hand the target to the running 'RocketFunction.invoke' instead
+        if getattr(expr, 'tail', False) and (function.__class__ is _RocketFunction) and not function.isInit:
+            self.tailCall = (function, eval_args, instance)
+            return _TAIL_CALL
+
+        try:
+            if (self.callDepth >= self.maxCallDepth):
+                name = expr.callee.name.lexeme if hasattr(expr.callee, 'name') else function
 
-                    # We increment our stack counter if same fn called from previous call
-                    if (self.fnCallee == expr.callee.name.lexeme):
-                        self.stackCount += 1
+                raise _RuntimeError(name, f"Maximum recursion depth reached from calls to '{name}' fn.", False)
 
-                    # Set new fn callee
-                    else:
-                        self.fnCallee = expr.callee.name.lexeme
+            self.callDepth += 1
+
+            try:
+                if instance is not None:
+                    return self.sanitizeNum(function.callBound(self, eval_args, instance))
 
                 return self.sanitizeNum(function.call(self, eval_args))
 
-            except Exception as err:
-                self.errors.append(err)
-                # Trip the interpreter to halt it from printing/returning 'nin'
-                raise err
+            finally:
+                self.callDepth -= 1
+
+        except Exception as err:
+            self.errors.append(err)
+            # Trip the interpreter to halt it from printing/returning 'nin'
+            raise err
 
     def visitGetExpr(self, expr: _Get):
-        object = self.evaluate(expr.object)
+        return self.getProperty(self.evaluate(expr.object), expr)
+
+    def getProperty(self, object: object, expr: _Get):
+        # Fields of user instances. The site remembers the last '(shape, index)' it read from, so objects of that shape skip the name lookup
+        if object.__class__ is _RocketInstance:
+            cache = getattr(expr, 'shapeCache', None)
+            shape = object.shape
+
+            if (cache is None) or (cache[0] is not shape):
+                index = shape.names.get(expr.name.lexeme)
+
+                # Methods (or the error)
+                if index is None:
+                    return object.get(expr.name)
+
+                cache = expr.shapeCache = (shape, index)
+
+            value = object.fields[cache[1]]
 
-        if isinstance(object, _RocketInstance):
+            # Same 'nin' fields fall through to methods as in 'RocketInstance.get'
+            if value != None:
+                return value
+
+            return object.get(expr.name)
+
+        # Instances and datatypes
+        if _tags.INT <= _tags.tagOf(object) <= _tags.INSTANCE:
             return object.get(expr.name)
 
         # Another special check for datatypes
@@ -435,15 +530,42 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
 
     def visitSetExpr(self, expr: _Set):
         obj = self.evaluate(expr.object)
+        self.checkSetTarget(obj, expr)
 
-        if hasattr(obj, 'kind'):
-            if ('List' in obj.kind):
-                raise _RuntimeError('List', f"Cannot assign external attribute to native datatype 'List'", False)
+        return self.setProperty(obj, expr, self.evaluate(expr.value))
 
-        if not isinstance(obj, _RocketInstance):
+    def checkSetTarget(self, obj: object, expr: _Set):
+        tag = _tags.tagOf(obj)
+
+        if tag == _tags.LIST:
+            raise _RuntimeError('List', f"Cannot assign external attribute to native datatype 'List'", False)
+
+        if not (_tags.INT <= tag <= _tags.INSTANCE):
             raise _RuntimeError(expr.name, "Only instances have fields.", False)
 
-        value = self.evaluate(expr.value)
+    def setProperty(self, obj: object, expr: _Set, value: object):
+        # Stores into user instances. The site remembers '(shape before, shape after, index)', a new field just gets appended and moves the instance to the next shape
+        if obj.__class__ is _RocketInstance:
+            cache = getattr(expr, 'shapeCache', None)
+            shape = obj.shape
+
+            if (cache is None) or (cache[0] is not shape):
+                obj.set(expr.name, value)
+                expr.shapeCache = (shape, obj.shape, obj.shape.names[expr.name.lexeme])
+
+                return value
+
+            _, after, index = cache
+
+            if after is shape:
+                obj.fields[index] = value
+
+            else:
+                obj.fields.append(value)
+                obj.shape = after
+
+            return value
+
         obj.set(expr.name, value)
 
         return value
@@ -477,6 +599,9 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return self.lookUpVariable(expr.keyword, expr)
 
     def visitSuperExpr(self, expr: _Super):
+        return self.lookupSuper(expr)
+
+    def lookupSuper(self, expr: _Super):
         this_lexeme = self.KSL[1][_TokenType.THIS.value]
         super_lexeme = self.KSL[1][_TokenType.SUPER.value]
 
@@ -501,21 +626,13 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
 
     def visitDelStmt(self, stmt: _Del):
         # patch env
-        glob = self.globals.values
-        var_env = self.environment.values
-        const_env = self.environment.statics
-
         for name in stmt.names:
-            if name in glob.keys():
-                del glob[name]
-                return None
-
-            if name in var_env.keys():
-                del var_env[name]
+            if name in self.globals.values:
+                self.globals.remove(name)
                 return None
 
-            if name in const_env.keys():
-                del const_env[name]
+            # Checks vars then consts in the current env
+            if self.environment.remove(name):
                 return None
 
             else:
@@ -527,32 +644,36 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitIfStmt(self, stmt: _If):
+         # Pass on any 'break'/'return' signal from the branch taken
          if (self.isTruthy(self.evaluate(stmt.condition))):
-             self.execute(stmt.thenBranch)
+             return self.execute(stmt.thenBranch)
 
          #if (stmt.elifCondition != None):
          #    if (self.isTruthy(self.evaluate(stmt.elifCondition))):
          #        self.execute(stmt.elifThenBranch)
 
          elif (stmt.elseBranch != None):
-             self.execute(stmt.elseBranch)
+             return self.execute(stmt.elseBranch)
 
          return None
 
     def visitWhileStmt(self, stmt: _While):
-        try:
-            while (self.isTruthy(self.evaluate(stmt.condition))):
-                self.execute(stmt.body)
+        # TODO: Add support to cover Python's stack trace when CTRL-C is used to exit REPL
+        while (self.isTruthy(self.evaluate(stmt.condition))):
+            signal = self.execute(stmt.body)
+
+            if signal is _BREAK:
+                break
 
-            # TODO: Add support to cover Python's stack trace when CTRL-C is used to exit REPL
-        except _BreakException:
-            pass
+            # Leave the loop and let the enclosing fn pick up the value
+            if signal is _RETURN:
+                return signal
 
         return None
 
     def visitBreakStmt(self, stmt: _Break):
-        # Just raises 'BreakExveption' to signal 'break'
-        raise _BreakException()
+        # Signal 'break' to the closest loop
+        return _BREAK
 
     def visitReturnStmt(self, stmt: _Return):
         value = self.KSL[1][_TokenType.NIN.value] # Grab nin lexeme from the KSL
@@ -560,7 +681,9 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         if stmt.value != None:
             value = self.evaluate(stmt.value)
 
-        raise _ReturnException(value)
+        self.returnValue = value
+
+        return _RETURN
 
     def visitImportStmt(self, stmt: _Import):
         import_lexeme = self.KSL[1][_TokenType.IMPORT.value]
@@ -606,7 +729,9 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitPrintStmt(self, stmt: _Print):
-        value = self.evaluate(stmt.expression)
+        return self.printValue(self.evaluate(stmt.expression))
+
+    def printValue(self, value: object):
         val, color = self.stringify(value)
 
         if color:
@@ -628,15 +753,39 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         else:
             value = None
 
+        self.defineVar(stmt, value)
+
+    def defineVar(self, stmt: _Var, value: object):
         # To avoid redifining vars with the same name as consts, functions, or classes
         if not (self.globals.isTaken(stmt.name)):
-            self.environment.define(stmt.name.lexeme, value)
+            slot = getattr(stmt, 'slot', None)
+
+            # Resolver already made sure this name is never a 'const' in this scope
+            if slot is not None:
+                self.environment.slots[slot] = value
+
+            else:
+                self.environment.define(stmt.name.lexeme, value)
 
         else:
             raise _RuntimeError(stmt.name.lexeme, "Name already defined as 'class' or 'function'", False)
 
     def visitConstStmt(self, stmt: _Const):
-        value = self.evaluate(stmt.initializer)
+        self.defineConst(stmt, self.evaluate(stmt.initializer))
+
+    def defineConst(self, stmt: _Const, value: object):
+        slot = getattr(stmt, 'slot', None)
+
+        # Resolver already made sure this name is never a 'var' in this scope
+        if slot is not None:
+            if self.environment.slots[slot] is not _UNSET:
+                raise _RuntimeError(stmt.name.lexeme, "Name already used as const.", False)
+
+            elif self.globals.isTaken(stmt.name):
+                raise _RuntimeError(stmt.name.lexeme, "Name already used as 'class' or 'function' name.", False)
+
+            self.environment.slots[slot] = value
+            return
 
         # check for variable before definition to avoid passing in 'const' redefinitions
         if self.environment.constExists(stmt.name):
@@ -661,12 +810,18 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitClassStmt(self, stmt: _Class):
+        superclass = None
+
+        if (stmt.superclass != None):
+            superclass = self.evaluate(stmt.superclass)
+
+        return self.defineClass(stmt, superclass)
+
+    def defineClass(self, stmt: _Class, superclass: object):
         super_lexeme = self.KSL[1][_TokenType.SUPER.value]
         this_lexeme = self.KSL[1][_TokenType.THIS.value]
 
-        superclass = None
         if (stmt.superclass != None):
-            superclass = self.evaluate(stmt.superclass)
             if not isinstance(superclass, _RocketClass):
                 raise _RuntimeError(stmt.superclass.name, "Superclass must be a class.", False)
 
@@ -692,167 +847,163 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitBlockStmt(self, stmt: _Block):
-        self.executeBlock(stmt.statements, _Environment(self.environment))
-        return None
+        # Blocks without declerations run in the current env, see 'Resolver.visitBlockStmt'
+        if getattr(stmt, 'flat', False):
+            for s in stmt.statements:
+                signal = self.execute(s)
 
-    def visitAssignExpr(self, expr: _Assign):
-        if type(expr.value) == list:
-            init_value = self.environment.get(expr.value[0])
-            var_value = expr.value[1] if type(expr.value[1]) != _Literal else self.evaluate(expr.value[1])
+                if (signal is _RETURN) or (signal is _BREAK):
+                    return signal
 
-            ### Lets handle our post fix arithmetic ops
+            return None
 
-            # First lets start with '++'
-            if expr.value[2] == 'inc':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform arithmetic increment on string.", False)
+        env = _makeEnvironment(getattr(stmt, 'layout', None), self.environment)
 
-                value = _rocketNumber.Int().call(self, [init_value.value + 1]) if type(init_value.value) == int else _rocketNumber.Float().call(self, [init_value.value + 1])
+        if getattr(stmt, 'counted', None) != None:
+            signal = self.countedLoop(stmt.counted, env)
 
-                self.environment.assign(expr.name, value)
+        else:
+            signal = self.executeBlock(stmt.statements, env)
 
-                # I.e :-
-                #       var p = 2;
-                #       print p++; /// returns '2'
-                return init_value
+        _releaseEnvironment(env)
 
-            # For our decrement post fix operator '--'
-            if expr.value[2] == 'dec':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform arithmetic decrement on string.", False)
+        return signal
 
-                value = _rocketNumber.Int().call(self, [init_value.value - 1]) if type(init_value) == int else _rocketNumber.Float().call(self, [init_value.value - 1])
+    def countedLoop(self, counted: tuple, env: object, run=None):
+        # 'for (var i = a; i < n; i = i + k) body', see 'Resolver.countedLoop'.
+        # 'i' lives here as a python int and is only boxed into its slot when 'body' reads it (and once more at the end)
+        # 'run' executes 'init', 'loop' and 'body', the VM passes one that runs their compiled chunks instead
+        init, loop, slot, op, limit, step, body, reads = counted
+        run = self.execute if run == None else run
+        compare = _COMPARISON[op]
+        makeInt = _rocketNumber.makeInt
+        slots = env.slots
 
-                self.environment.assign(expr.name, value)
+        previous = self.environment
 
-                # I.e :-
-                #       var p = 2;
-                #       print p--; /// returns '2'
-                return init_value
+        try:
+            self.environment = env
+            run(init)
 
-            ### END of post arithmetic ops
+            # Not an Int to start with, nothing to specialize
+            if slots[slot].__class__ is not _rocketNumber.RocketInt:
+                return run(loop)
 
-            ### Beginning of assignment arithmetic ops
+            i = slots[slot].value
 
-            # Perform op check to determine arithmetic operation to perform
-            # Check for '+='
-            # also works in cases were string concatenation is intended 'home += "/Github;"'
-            if expr.value[2] == 'add':
-                value = init_value.value + var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+            while True:
+                bound = self.evaluate(limit)
 
-                self.environment.assign(expr.name, value)
+                # I.e 'n' was re-assigned to a non number, carry on the regular way from here
+                if bound.__class__ not in _NUMBERS:
+                    slots[slot] = makeInt(i)
+                    return run(loop)
 
-                return value
+                if not compare(i, bound.value):
+                    break
 
-            # Check for '-='
-            if expr.value[2] == 'sub':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform subtraction arithmetic assignment on string.", False)
+                if reads:
+                    slots[slot] = makeInt(i)
 
-                value = init_value.value - var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+                signal = run(body)
 
-                self.environment.assign(expr.name, value)
+                if signal is _BREAK:
+                    break
 
-                return value
+                if signal is _RETURN:
+                    return signal
 
-            # Check for '*='
-            if expr.value[2] == 'mul':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform multiplication arithmetic assignment on string.", False)
+                i += step
 
-                value = init_value.value * var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+            slots[slot] = makeInt(i)
 
-                self.environment.assign(expr.name, value)
+        finally:
+            self.environment = previous
 
-                return value
+    def visitAssignExpr(self, expr: _Assign):
+        return self.assignName(expr, self.evaluate(expr.value))
 
-            # Check for '/='
-            if expr.value[2] == 'div':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform division arithmetic assignment on string.", False)
+    def visitCompoundAssignExpr(self, expr: _CompoundAssign):
+        # 'a op= b' is just 'a = a op b', i.e:- '+=' also concats strings 'home += "/Github";'
+        return self.assignName(expr, self.binaryOp(expr.operator, self.lookupName(expr), self.evaluate(expr.value)))
 
-                value = init_value.value / var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+    def visitPostfixExpr(self, expr: _Postfix):
+        value = self.lookupName(expr)
 
-                self.environment.assign(expr.name, value)
+        self.checkNumberOperand(expr.operator, value)
+        self.assignName(expr, self.binaryOp(expr.operator, value, _ONE))
 
-                return value
+        # I.e :-
+        #       var p = 2;
+        #       print p++; /// returns '2'
+        return value
 
-            # Check for '//='
-            if expr.value[2] == 'flo':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform floor division arithmetic assignment on string.", False)
+    def assignName(self, expr: _Assign, value: object):
+        slot = getattr(expr, 'slot', None)
 
-                value = init_value.value // var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+        if slot is not None:
+            env = self.environment
 
-                self.environment.assign(expr.name, value)
+            for _ in range(slot[0]):
+                env = env.enclosing
 
+            # Unset slots (not defined yet or 'del'eted) take the slow path
+            if env.slots[slot[1]] is not _UNSET:
+                env.slots[slot[1]] = value
                 return value
 
-            # Check for '%='
-            if expr.value[2] == 'mod':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform modulo arithmetic assignment on string.", False)
+        try:
+            self.environment.assign(expr.name, value)
 
-                value = init_value.value % var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+        except _RuntimeError as error:
+            if ('ReferenceError:' in error.msg) or ('AssignmentError: ' in error.msg):
+                self.errors.append(error)
 
-                self.environment.assign(expr.name, value)
+            else:
+                pass
 
-                return value
+        return value
 
-            # Check for '**='
-            if expr.value[2] == 'exp':
-                if type(init_value) == str:
-                    raise _RuntimeError(expr.name, "cannot perform exponent arithmetic assignment on string.", False)
+    def visitVariableExpr(self, expr: _Variable):
+        return self.lookupName(expr)
 
-                value = init_value.value ** var_value
-                value = _rocketNumber.Int().call(self, [value]) if type(value) == int else _rocketNumber.Float().call(self, [value])
+    def lookupName(self, expr: _Variable):
+        glob = self.globals
+        cache = getattr(expr, 'globalCache', None)
 
-                self.environment.assign(expr.name, value)
+        # Globals (natives, fns) shadow everything else. What the table holds for the name is cached on the node until the table's version moves
+        if (cache is None) or (cache[0] != glob.version):
+            cache = expr.globalCache = (glob.version, glob.lookup(expr.name.lexeme))
 
-                return value
+        if cache[1] is not _UNSET:
+            return cache[1]
 
-            ### END of assignment arithmetic ops
+        slot = getattr(expr, 'slot', None)
 
-        else:
-            value = self.evaluate(expr.value)
+        # Resolved locals are read straight from their slot
+        if slot is not None:
+            env = self.environment
 
-            try:
-                self.environment.assign(expr.name, value)
+            for _ in range(slot[0]):
+                env = env.enclosing
 
-            except _RuntimeError as error:
-                if ('ReferenceError:' in error.msg) or ('AssignmentError: ' in error.msg):
-                    self.errors.append(error)
+            value = env.slots[slot[1]]
 
-                else:
-                    pass
-
-            return value
+            if value is not _UNSET:
+                return value
 
-    def visitVariableExpr(self, expr: _Variable):
         # NOTE: 'const' variables get retrieved from this call also
         try:
-            return self.globals.get(expr.name)
+            return self.environment.get(expr.name)
 
-        except:
-            # We try to see if its in either 'envs'
-            # if not we raise the exception for our interpreter to catch
-            try:
-                return self.environment.get(expr.name)
-
-            except _RuntimeError as err:
-                print(err, file=_sys.stderr)
-                raise _RuntimeError(err.token, err.msg)
-
-        #return self.lookUpVariable(expr.name, expr)
+        except _RuntimeError as err:
+            print(err, file=_sys.stderr)
+            raise _RuntimeError(err.token, err.msg)
 
     def execute(self, stmt: _Stmt):
-        stmt.accept(self)
+        # Hands back 'BREAK'/'RETURN' when the stmt completes abruptly
+        # NOTE: Other engines may hand back anything else (i.e expr values) for normal completion, so always check signals by identity
+        return stmt.accept(self)
 
     def executeBlock(self, stmts: list, env: _Environment):
         # Save global environment state
@@ -862,7 +1013,11 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
             self.environment = env
 
             for stmt in stmts:
-                self.execute(stmt)
+                signal = self.execute(stmt)
+
+                # Stop at 'break'/'return' and pass it on
+                if (signal is _RETURN) or (signal is _BREAK):
+                    return signal
 
         finally:
             # Resume global environment state
@@ -904,11 +1059,11 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return True
 
     def isEqual(self, left_obj: object, right_obj: object):
-        # get values
-        if (hasattr(left_obj, 'value')):
+        # get values (Int, Float, String and Bool)
+        if _tags.INT <= _tags.tagOf(left_obj) <= _tags.BOOL:
             left_obj = left_obj.value
 
-        if (hasattr(right_obj, 'value')):
+        if _tags.INT <= _tags.tagOf(right_obj) <= _tags.BOOL:
             right_obj = right_obj.value
 
         if ((left_obj == None) and (right_obj == None)):
@@ -921,13 +1076,12 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return left_obj == right_obj
 
     def sanitizeNum(self, n):
-        # Returns a Rocket num if number received
-        if (self.is_number(n)):
-            if (isinstance(n, int)):
-                return _rocketNumber.Int().call(self, [n])
-            
-            if (isinstance(n, float)):
-                return _rocketNumber.Float().call(self, [n])
+        # Returns a Rocket num if (raw python) number received
+        if type(n) == int:
+            return _rocketNumber.makeInt(n)
+
+        if type(n) == float:
+            return _rocketNumber.RocketFloat(n)
 
         # otherwise it returns it unchanged
         return n
@@ -937,11 +1091,11 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         return n.raw_string()
 
     def is_number(self, obj: object):
-        if (type(obj) in [int, float, _rocketNumber.RocketInt, _rocketNumber.RocketFloat]):
+        # Raw python nums or Rocket ones
+        if (obj.__class__ is int) or (obj.__class__ is float):
             return True
 
-        else:
-            return False
+        return _tags.INT <= _tags.tagOf(obj) <= _tags.FLOAT
 
     def checkNumberOperand(self, operator: _Token, right: object):
         if self.is_number(right): return
@@ -974,13 +1128,12 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         if (value == True and type(value) == bool): return "true", "\033[1m"
         if (value == False and type(value) == bool): return "false", "\033[1m"
 
-        if isinstance(value, _rocketString.RocketString):
-            if value == '':
-                return value, None
+        tag = _tags.tagOf(value)
 
+        if tag == _tags.STRING:
             return value, "\033[32m"
 
-        elif isinstance(value, _rocketNumber.RocketInt) or isinstance(value, _rocketNumber.RocketFloat):
+        elif _tags.INT <= tag <= _tags.FLOAT:
             return value, "\033[36m"
 
         else:
@@ -994,37 +1147,38 @@ class Interpreter(_ExprVisitor, _StmtVisitor):
         # Child fns
 
     def isRocketArray(self, obj):
-        return _isType(obj, _rocketArray.RocketArray)
+        return _tags.tagOf(obj) == _tags.ARRAY
 
     def isRocketList(self, obj):
-        return _isType(obj, _rocketList.RocketList)
+        return _tags.tagOf(obj) == _tags.LIST
 
     def isRocketFlatList(self, obj):
         return _isType(obj, _rocketArray.Array) or _isType(obj, _rocketList.List)
 
     def isRocketClass(self, obj):
-        return _isType(obj, _RocketClass)
+        return _tags.tagOf(obj) == _tags.CLASS
 
     def isRocketClassInst(self, obj):
-        return _isType(obj, _RocketInstance)
+        return _tags.INT <= _tags.tagOf(obj) <= _tags.INSTANCE
 
     def isRocketCallable(self, obj):
-        return _isType(obj, _RocketCallable)
+        return _tags.CLASS <= _tags.tagOf(obj) <= _tags.NATIVE
 
     def isRocketString(self, obj):
-        return _isType(obj, _rocketString.RocketString)
+        return _tags.tagOf(obj) == _tags.STRING
 
     def isRocketInt(self, obj):
-        return _isType(obj, _rocketNumber.RocketInt)
+        return _tags.tagOf(obj) == _tags.INT
 
     def isRocketFloat(self, obj):
-        return _isType(obj, _rocketNumber.RocketFloat)
+        return _tags.tagOf(obj) == _tags.FLOAT
 
     def isNumberArray(self, obj):
-        return (obj.arrayType == _rocketNumber.RocketFloat) or (obj.arrayType == _rocketNumber.RocketInt)
+        # 'arrayType' is the elms' class, so its tag is a class attr
+        return _tags.INT <= getattr(obj.arrayType, 'tag', _tags.NONE) <= _tags.FLOAT
 
     def isRocketNumber(self, obj):
-        return _isType(obj, _rocketNumber.RocketFloat) or _isType(obj, _rocketNumber.RocketInt)
+        return _tags.INT <= _tags.tagOf(obj) <= _tags.FLOAT
 
     def isRocketBool(self, obj):
-        return _isType(obj, _rocketBoolean.RocketBool)
+        return _tags.tagOf(obj) == _tags.BOOL
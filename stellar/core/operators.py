@@ -0,0 +1,213 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Binary Operator Table (C) 2018
+
+import operator as _operator
+
+from utils.reporter import runtimeError as _RuntimeError
+
+from utils.tokens import Token      as _Token
+from utils.tokens import TokenType  as _TokenType
+
+from utils.misc import opOverArray  as _opOverArray
+from utils.misc import opUnderArray as _opUnderArray
+from utils.misc import opArrays     as _opArrays
+
+from native.datatypes.rocketNumber  import RocketInt     as _RocketInt
+from native.datatypes.rocketNumber  import RocketFloat   as _RocketFloat
+from native.datatypes.rocketNumber  import makeInt       as _makeInt
+from native.datatypes.rocketNumber  import Float         as _Float
+from native.datatypes.rocketString  import RocketString  as _RocketString
+from native.datastructs.rocketList  import RocketList    as _RocketList
+from native.datastructs.rocketArray import RocketArray   as _RocketArray
+from native.datastructs.rocketArray import Array         as _Array
+
+
+# (operator type, left type, right type) -> handler(interpreter, operator, left, right)
+# Built once at import. 'Interpreter.binaryOp' looks operands up here first and only runs its generic (slow) chain on a miss.
+# Each handler does exactly what that chain would do for those operand types.
+BINARY_OPS = {}
+
+NUMBERS = (_RocketInt, _RocketFloat)
+
+RAW_NUMBERS = (int, float)
+
+# Ops that broadcast over a number Array
+ARRAY_OPS = [_TokenType.PLUS, _TokenType.MINUS, _TokenType.MULT, _TokenType.DIV, _TokenType.FLOOR, _TokenType.MOD, _TokenType.EXP]
+
+CONCAT_TOKEN = _Token(_TokenType.STRING, 'concat', 'concat', 0)
+
+# What the postfix ops '++' and '--' add/subtract
+ONE = _makeInt(1)
+
+
+def boxNumber(interpreter: object, value: object):
+    if type(value) == int:
+        return _makeInt(value)
+
+    if type(value) == float:
+        return _RocketFloat(value)
+
+    # I.e complex results, let 'Float' report them
+    return _Float().call(interpreter, [value])
+
+
+def boxRaw(value: object):
+    # Boxes raw results of the unboxed fast paths, anything else (i.e bools from comparisons) is left as is
+    if value.__class__ == int:
+        return _makeInt(value)
+
+    if value.__class__ == float:
+        return _RocketFloat(value)
+
+    return value
+
+
+def rawNumberOp(interpreter: object, operator: _Token, left: object, right: object):
+    # Same as the number handlers below, but over raw python nums and the result stays raw.
+    # Lets the engines run whole arithmetic trees unboxed and only box the final result (see 'boxRaw')
+    if (left.__class__ in RAW_NUMBERS) and (right.__class__ in RAW_NUMBERS):
+        op = operator.type
+
+        if op in ARITHMETIC:
+            value = ARITHMETIC[op](left, right)
+
+            # I.e complex results from '**', let 'boxNumber' report them
+            return value if value.__class__ in RAW_NUMBERS else boxNumber(interpreter, value)
+
+        if op in DIVISION:
+            if right == 0:
+                raise _RuntimeError(boxNumber(interpreter, right), "ZeroDivError: Can't divide by zero", False)
+
+            return DIVISION[op](left, right)
+
+        return COMPARISON[op](left, right)
+
+    # Not (both) numbers, box them back up for the generic path
+    return interpreter.binaryOp(operator, interpreter.sanitizeNum(left), interpreter.sanitizeNum(right))
+
+
+def arithmetic(op):
+    def handler(interpreter, operator, left, right):
+        return boxNumber(interpreter, op(left.value, right.value))
+
+    return handler
+
+
+def division(op):
+    def handler(interpreter, operator, left, right):
+        if right.value == 0:
+            raise _RuntimeError(right, "ZeroDivError: Can't divide by zero", False)
+
+        return boxNumber(interpreter, op(left.value, right.value))
+
+    return handler
+
+
+def comparison(op):
+    # Comparisons hand back raw python bools
+    def handler(interpreter, operator, left, right):
+        return op(left.value, right.value)
+
+    return handler
+
+
+def concatStrings(interpreter, operator, left, right):
+    return _RocketString(str(left.value) + str(right.value))
+
+
+def implicitConcat(interpreter, operator, left, right):
+    # E.g "Hailey" + 4 -> "Hailey4"
+    return _RocketString(left.raw_string() + right.raw_string())
+
+
+def concatLists(interpreter, operator, left, right):
+    return left.get(CONCAT_TOKEN).call(interpreter, [right])
+
+
+def combineArrays(interpreter, operator, left, right):
+    # Element-wise 'Array op Array'
+    if (interpreter.isNumberArray(left) and interpreter.isNumberArray(right)) and not (left.isEmpty or right.isEmpty):
+        return _Array().call(interpreter, _opArrays(left, right, interpreter.sanitizeNum, operator))
+
+    if operator.type == _TokenType.PLUS:
+        raise _RuntimeError(operator, "Cannot concat empty Array(s).", False)
+
+    raise _RuntimeError(operator, "Arrays must contain Number elements.", False)
+
+
+def broadcastLeft(interpreter, operator, left, right):
+    # 'Array op Number'
+    if interpreter.isNumberArray(left) and not left.isEmpty:
+        return _Array().call(interpreter, _opOverArray(left, right, interpreter.sanitizeNum, operator))
+
+    raise _RuntimeError(operator, "Array must contain Number elements.", False)
+
+
+def broadcastRight(interpreter, operator, left, right):
+    # 'Number op Array'
+    if interpreter.isNumberArray(right) and not right.isEmpty:
+        return _Array().call(interpreter, _opUnderArray(left, right, interpreter.sanitizeNum, operator))
+
+    raise _RuntimeError(operator, "Array must contain Number elements.", False)
+
+
+# Raw python fns behind each number op
+ARITHMETIC = {
+    _TokenType.PLUS: _operator.add,
+    _TokenType.MINUS: _operator.sub,
+    _TokenType.MULT: _operator.mul,
+    _TokenType.EXP: _operator.pow,
+    _TokenType.LESS_LESS: lambda a, b: a * (2 ** b),
+    _TokenType.GREATER_GREATER: lambda a, b: a // (2 ** b),
+}
+
+# These have to check for zero first
+DIVISION = {
+    _TokenType.DIV: _operator.truediv,
+    _TokenType.MOD: _operator.mod,
+    _TokenType.FLOOR: _operator.floordiv,
+}
+
+# Comparisons hand back raw python bools
+COMPARISON = {
+    _TokenType.GREATER: _operator.gt,
+    _TokenType.LESS: _operator.lt,
+    _TokenType.GREATER_EQUAL: _operator.ge,
+    _TokenType.LESS_EQUAL: _operator.le,
+    _TokenType.BANG_EQUAL: _operator.ne,
+    _TokenType.EQUAL_EQUAL: _operator.eq,
+}
+
+# Ops the engines run unboxed (see 'rawNumberOp'). Leaves out '==' and '!=', which mostly compare non numbers
+RAW_OPS = set(ARITHMETIC) | set(DIVISION) | {_TokenType.GREATER, _TokenType.LESS, _TokenType.GREATER_EQUAL, _TokenType.LESS_EQUAL}
+
+NUMBER_OPS = {}
+
+for op, fn in ARITHMETIC.items():
+    NUMBER_OPS[op] = arithmetic(fn)
+
+for op, fn in DIVISION.items():
+    NUMBER_OPS[op] = division(fn)
+
+for op, fn in COMPARISON.items():
+    NUMBER_OPS[op] = comparison(fn)
+
+for op, handler in NUMBER_OPS.items():
+    for left in NUMBERS:
+        for right in NUMBERS:
+            BINARY_OPS[(op, left, right)] = handler
+
+for op in ARRAY_OPS:
+    BINARY_OPS[(op, _RocketArray, _RocketArray)] = combineArrays
+
+    for number in NUMBERS:
+        BINARY_OPS[(op, _RocketArray, number)] = broadcastLeft
+        BINARY_OPS[(op, number, _RocketArray)] = broadcastRight
+
+for number in NUMBERS:
+    BINARY_OPS[(_TokenType.PLUS, _RocketString, number)] = implicitConcat
+    BINARY_OPS[(_TokenType.PLUS, number, _RocketString)] = implicitConcat
+
+BINARY_OPS[(_TokenType.PLUS, _RocketString, _RocketString)] = concatStrings
+BINARY_OPS[(_TokenType.PLUS, _RocketList, _RocketList)] = concatLists
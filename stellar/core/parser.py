@@ -4,6 +4,8 @@
 
 from utils.expr import Variable      as _Variable
 from utils.expr import Assign        as _Assign
+from utils.expr import CompoundAssign as _CompoundAssign
+from utils.expr import Postfix       as _Postfix
 from utils.expr import Binary        as _Binary
 from utils.expr import Call          as _Call
 from utils.expr import Get           as _Get
@@ -17,6 +19,8 @@ from utils.expr import Logical       as _Logical
 from utils.expr import Grouping      as _Grouping
 from utils.expr import Literal       as _Literal
 
+import itertools as _itertools
+
 from utils.tokens import Token       as _Token
 from utils.tokens import TokenType   as _TokenType
 
@@ -37,14 +41,87 @@ from utils.stmt import Return        as _Return
 from utils.stmt import Del           as _Del
 
 
+# Arithmetic assignment ops and the binary op each one applies, i.e 'a += b' is 'a = a + b'
+# NOTE: Keyed by the '_TokenType' values, see 'check' on why
+COMPOUND_OPS = {
+    _TokenType.PLUS_INC.value: (_TokenType.PLUS, '+'),
+    _TokenType.MINUS_INC.value: (_TokenType.MINUS, '-'),
+    _TokenType.MULT_INC.value: (_TokenType.MULT, '*'),
+    _TokenType.DIV_INC.value: (_TokenType.DIV, '/'),
+    _TokenType.MOD_INC.value: (_TokenType.MOD, '%'),
+    _TokenType.FLOOR_INC.value: (_TokenType.FLOOR, '//'),
+    _TokenType.EXP_INC.value: (_TokenType.EXP, '**'),
+}
+
+COMPOUND_TYPES = [_TokenType.PLUS_INC, _TokenType.MINUS_INC, _TokenType.MULT_INC, _TokenType.DIV_INC, _TokenType.MOD_INC, _TokenType.FLOOR_INC, _TokenType.EXP_INC]
+
+# How many tokens are pulled from a token stream at a time
+CHUNK = 256
+
+# Binding powers of the infix ops, loosest first. See 'Parser.binary'
+OR_POWER          = 1
+AND_POWER         = 2
+CONDITIONAL_POWER = 3
+EQUALITY_POWER    = 4
+COMPARISON_POWER  = 5
+ADDITION_POWER    = 6
+MULT_POWER        = 7
+
+# Infix op -> (binding power, node it builds)
+# NOTE: Keyed by the '_TokenType' values, see 'check' on why
+INFIX_OPS = {
+    _TokenType.OR.value: (OR_POWER, _Logical),
+    _TokenType.AND.value: (AND_POWER, _Logical),
+
+    # 'a ? b : c', see 'Parser.conditional'
+    _TokenType.Q_MARK.value: (CONDITIONAL_POWER, _Conditional),
+
+    _TokenType.BANG_EQUAL.value: (EQUALITY_POWER, _Binary),
+    _TokenType.EQUAL_EQUAL.value: (EQUALITY_POWER, _Binary),
+
+    _TokenType.GREATER.value: (COMPARISON_POWER, _Binary),
+    _TokenType.GREATER_EQUAL.value: (COMPARISON_POWER, _Binary),
+    _TokenType.LESS.value: (COMPARISON_POWER, _Binary),
+    _TokenType.LESS_EQUAL.value: (COMPARISON_POWER, _Binary),
+
+    _TokenType.PLUS.value: (ADDITION_POWER, _Binary),
+    _TokenType.MINUS.value: (ADDITION_POWER, _Binary),
+    _TokenType.LESS_LESS.value: (ADDITION_POWER, _Binary),
+    _TokenType.GREATER_GREATER.value: (ADDITION_POWER, _Binary),
+
+    # NOTE: '**' is left associative too
+    _TokenType.DIV.value: (MULT_POWER, _Binary),
+    _TokenType.FLOOR.value: (MULT_POWER, _Binary),
+    _TokenType.MOD.value: (MULT_POWER, _Binary),
+    _TokenType.MULT.value: (MULT_POWER, _Binary),
+    _TokenType.EXP.value: (MULT_POWER, _Binary),
+}
+
+UNARY_OPS = {_TokenType.BANG.value, _TokenType.MINUS.value, _TokenType.TILDE.value}
+
+
 class Parser:
+    # 'tokens' is either a (full) list of tokens, or an iterable of them, i.e 'Scanner.tokenize()'.
+    # Streamed tokens are pulled in chunks as the parser gets to them, and the ones already parsed are dropped. So 'self.tokens' only holds a window of the stream.
+    # NOTE: 'self.current' is relative to that window, the window's first token is token number 'self.start' in the stream.
     def __init__(self, tokens, vw_Dict):
-        self.tokens = tokens
         self.vw_Dict = vw_Dict
         self.current = 0
         self.errors = []
         self.loopDepth = 0
 
+        self.start = 0
+        self.marks = []
+
+        if type(tokens) == list:
+            self.tokens = tokens
+            self.stream = None
+
+        else:
+            self.tokens = []
+            self.stream = iter(tokens)
+            self.fill()
+
     def parse(self):
         statements = []
         while not (self.isAtEnd()):
@@ -118,65 +195,38 @@ class Parser:
 
         return self.expressionStmt()
 
-    def conditional(self):
-        expr = self.equality()
-
-        if self.match(_TokenType.Q_MARK):
-            thenExpr = self.expression()
-            self.consume(_TokenType.COLON, "Expected ':' after then expression branch of the conditional expression")
-
-            elseExpr = self.conditional()
-            expr = _Conditional(expr, thenExpr, elseExpr)
-
-        return expr
-
-    def equality(self):
-        expr = self.comparison() # Type: Expr
-
-        while (self.match(_TokenType.BANG_EQUAL, _TokenType.EQUAL_EQUAL)):
-            operator = self.previous() # Type: Token
-
-            right = self.comparison()
-            expr = _Binary(expr, operator, right)
-
-        return expr
-
-    def comparison(self):
-        expr = self.addition()
-
-        while (self.match(_TokenType.GREATER, _TokenType.GREATER_EQUAL, _TokenType.LESS, _TokenType.LESS_EQUAL)):
-            operator = self.previous()
-
-            right = self.addition()
-            expr = _Binary(expr, operator, right)
-
-        return expr
+    def binary(self, power):
+        # Parses an operand, then every infix op binding at least as tight as 'power' (and their right operands)
+        # I.e 'binary(ADDITION_POWER)' on 'a * b + c == d' stops before the '=='
+        expr = self.unary()
 
-    def addition(self):
-        expr = self.mult()
+        while True:
+            infix = INFIX_OPS.get(self.peek().type.value)
 
-        while (self.match(_TokenType.PLUS, _TokenType.MINUS, _TokenType.LESS_LESS, _TokenType.GREATER_GREATER)):
-            operator = self.previous()
+            if (infix == None) or (infix[0] < power):
+                return expr
 
-            right = self.mult()
-            expr = _Binary(expr, operator, right)
+            operator = self.advance()
 
-        return expr
+            if infix[1] is _Conditional:
+                expr = self.conditional(expr)
 
-    def mult(self):
-        expr = self.unary()
+            # All left associative, so the right operand only takes the tighter ops
+            else:
+                expr = infix[1](expr, operator, self.binary(infix[0] + 1))
 
-        while (self.match(_TokenType.DIV, _TokenType.FLOOR, _TokenType.MOD, _TokenType.MULT, _TokenType.EXP)):
-            operator = self.previous()
+    def conditional(self, expr):
+        # The '?' is already matched
+        thenExpr = self.expression()
+        self.consume(_TokenType.COLON, "Expected ':' after then expression branch of the conditional expression")
 
-            right = self.unary()
-            expr = _Binary(expr, operator, right)
+        elseExpr = self.binary(CONDITIONAL_POWER)
 
-        return expr
+        return _Conditional(expr, thenExpr, elseExpr)
 
     def unary(self):
-        if (self.match(_TokenType.BANG, _TokenType.MINUS, _TokenType.TILDE)):
-            operator = self.previous()
+        if self.peek().type.value in UNARY_OPS:
+            operator = self.advance()
 
             right = self.unary()
 
@@ -189,14 +239,14 @@ class Parser:
 
         if isinstance(expr, _Variable):
             if self.peek().type.value == _TokenType.PLUS.value and self.peekNext().type.value == _TokenType.PLUS.value:
-                expr = _Assign(expr.name, [expr.name, 1, 'inc'])
+                expr = _Postfix(expr.name, self.arithmeticOp(self.peek(), (_TokenType.PLUS, '+')))
 
                 # Continue parsing after post inc expr '++'
                 self.advance()
                 self.advance()
 
             if self.peek().type.value == _TokenType.MINUS.value and self.peekNext().type.value == _TokenType.MINUS.value:
-                expr = _Assign(expr.name, [expr.name, -1, 'dec'])
+                expr = _Postfix(expr.name, self.arithmeticOp(self.peek(), (_TokenType.MINUS, '-')))
 
                 # Continue parsing after post inc expr '--'
                 self.advance()
@@ -255,7 +305,7 @@ class Parser:
                 pass
 
             if self.previous().type.value == _TokenType.LEFT_PAREN.value and self.peek().type.value == _TokenType.RIGHT_PAREN.value:
-                self.current += 1
+                self.advance()
                 return _Literal(None)
 
             expr = self.expression()
@@ -275,36 +325,36 @@ class Parser:
         # for '!=', '=='
         if (self.match(_TokenType.BANG_EQUAL, _TokenType.EQUAL_EQUAL)):
             self.error(self.previous(), "Left-hand operand missing.")
-            self.equality()
+            self.binary(EQUALITY_POWER)
             return None
 
         # '>', '<', '>=', '<='
         if (self.match(_TokenType.GREATER, _TokenType.LESS, _TokenType.GREATER_EQUAL, _TokenType.LESS_EQUAL)):
             self.error(self.previous(), "Left-hamd operand missing.")
-            self.comparison()
+            self.binary(COMPARISON_POWER)
             return None
 
         # '+', '-'
         if (self.match(_TokenType.PLUS)): # _TokenType.MINUS
             self.error(self.previous(), "Left-hand operand missing.")
-            self.addition()
+            self.binary(ADDITION_POWER)
             return None
 
         # '/', '//', '%', '*', '**'
         if (self.match(_TokenType.DIV, _TokenType.FLOOR, _TokenType.MOD, _TokenType.MULT, _TokenType.EXP)):
             self.error(self.previous(), "Left-hand operand missing.")
-            self.mult()
+            self.binary(MULT_POWER)
             return None
 
         # '<<', '>>' bitshifters
         if (self.match(_TokenType.LESS_LESS, _TokenType.GREATER_GREATER)):
             self.error(self.previous(), "Left-hand operand missing.")
-            self.addition()
+            self.binary(ADDITION_POWER)
             return None
 
         if (self.match(_TokenType.GREATER_GREATER)):
             self.error(self.previous(), "Left-hand operand missing.")
-            self.addition()
+            self.binary(ADDITION_POWER)
             return None
 
         # The mother of all bugs!!
@@ -312,27 +362,6 @@ class Parser:
         # This is what was causing problems
         raise self.error(self.peek(), "Expected expression.")
 
-    def OR(self):
-        expr = self.AND()
-
-        while (self.match(_TokenType.OR)):
-            operator = self.previous()
-            right = self.AND()
-            expr = _Logical(expr, operator, right)
-
-        return expr
-
-    def AND(self):
-        expr = self.conditional() # self.equality()
-
-        while (self.match(_TokenType.AND)):
-            operator = self.previous()
-            right = self.conditional() # self.equality()
-
-            expr = _Logical(expr, operator, right)
-
-        return expr
-
     def ifStmt(self):
         if_lexeme = self.vw_Dict[_TokenType.IF.value]
         self.consume(_TokenType.LEFT_PAREN, f"Expected '(' after '{if_lexeme}'.")
@@ -460,12 +489,6 @@ class Parser:
 
         self.consume(_TokenType.SEMICOLON, f"'{del_lexeme}' expected ';' after names")
 
-        if self.tokens[-1].type != _TokenType.DEL:
-            return _Del(names)
-
-        if len(names) == 0:
-            self.error(_TokenType.DEL, f"'{del_lexeme}' requires atleast one identifier")
-
         return _Del(names)
 
     def importStmt(self):
@@ -655,91 +678,23 @@ class Parser:
         return _Expression(value)
 
     def assignment(self):
-        # Short circuit
-        expr = self.OR()
+        # Everything but assignment, see 'binary'
+        expr = self.binary(OR_POWER)
 
         # Were we handle our arithmetic assignment ops
         # I.e:- '+=', '-=', '*=', '/=', '%=', '//=', '**='
-        if self.match(_TokenType.PLUS_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                return _Assign(name, [name, value, 'add'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 += 1'
-
-        if self.match(_TokenType.MINUS_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home -= "/Github";'
-
-                return _Assign(name, [name, value, 'sub'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 -= 1'
-
-        if self.match(_TokenType.MULT_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home *= "/Github";'
-
-                return _Assign(name, [name, value, 'mul'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 *= 1'
-
-        if self.match(_TokenType.DIV_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home/-= "/Github";'
-
-                return _Assign(name, [name, value, 'div'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 /= 1'
-
-        if self.match(_TokenType.MOD_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home %= "/Github";'
-
-                return _Assign(name, [name, value, 'mod'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 %= 1'
-
-        if self.match(_TokenType.FLOOR_INC):
+        if self.match(*COMPOUND_TYPES):
+            compound = self.previous()
             value = self.assignment()
-            name = expr.name
 
             if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home //= "/Github";'
+                # Only '+=' doubles as string concatenation
+                if (compound.type.value != _TokenType.PLUS_INC.value) and isinstance(value, _Literal) and (type(value.value) == str):
+                    self.error(compound, 'Invalid assignment target for string concatenation') # E.g 'home -= "/Github";'
 
-                return _Assign(name, [name, value, 'flo'])
+                return _CompoundAssign(expr.name, self.arithmeticOp(compound, COMPOUND_OPS[compound.type.value]), value)
 
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 //= 1'
-
-        if self.match(_TokenType.EXP_INC):
-            value = self.assignment()
-            name = expr.name
-
-            if isinstance(expr, _Variable):
-                if not isinstance(value, _Variable) and type(value.value) == str:
-                    self.error(self.previous(), 'Invalid assignment target for string concatenation') # E.g 'home **= "/Github";'
-
-                return _Assign(name, [name, value, 'exp'])
-
-            self.error(self.previous(), 'Invalid assignment target') # E.g '9 **= 1'
+            self.error(compound, 'Invalid assignment target') # E.g '9 += 1'
 
         # END
 
@@ -784,7 +739,7 @@ class Parser:
 
     def arrowFunc(self, kind):
         func_lexeme = self.vw_Dict[_TokenType.FUNC.value]
-        lockedIndex = self.current
+        lockedIndex = self.mark()
 
         params = []
 
@@ -804,9 +759,13 @@ class Parser:
 
         if self.peek().type.value != _TokenType.ARROW.value:
             # Reset pointer
-            self.current = lockedIndex
+            self.reset(lockedIndex)
+            self.release(lockedIndex)
             raise _ParseError(None, None)
 
+        # It is an arrow fn, so there's no going back from here
+        self.release(lockedIndex)
+
         self.consume(_TokenType.ARROW, None)
 
         # chew '{' to indecate start block
@@ -866,23 +825,68 @@ class Parser:
         if not self.isAtEnd():
             self.current += 1
 
+            # Keep the next token ('peekNext') in the window
+            if (self.current + 1 >= len(self.tokens)) and (self.stream != None):
+                self.fill()
+
         return self.previous()
 
+    def fill(self):
+        # Drop what's been parsed (bar the 'previous' token, and anything a 'mark' might go back to), then pull the next chunk of the stream
+        keep = min(self.marks + [self.start + self.current]) - 1
+
+        drop = keep - self.start
+
+        if drop > 0:
+            del self.tokens[:drop]
+            self.start += drop
+            self.current -= drop
+
+        while (self.stream != None) and (self.current + 1 >= len(self.tokens)):
+            self.tokens.extend(_itertools.islice(self.stream, CHUNK))
+
+            # Nothing left to pull once 'EOF' is in
+            if self.tokens[-1].type == _TokenType.EOF:
+                self.stream = None
+
+    def mark(self):
+        # Remembers where the parser is (as a position in the whole stream), so it can 'reset' back to it. Tokens from there on are kept until it is 'release'd
+        position = self.start + self.current
+        self.marks.append(position)
+
+        return position
+
+    def reset(self, position):
+        self.current = position - self.start
+
+    def release(self, position):
+        self.marks.remove(position)
+
     def match(self, *types: _TokenType):
+        # Same as 'check'ing each type, but the current token is only looked at once
+        current = self.tokens[self.current].type
+
+        if current == _TokenType.EOF:
+            return False
+
+        current = current.value
+
         for type in types:
-            if self.check(type):
+            if type.value == current:
                 self.advance()
                 return True
 
         return False
 
     def check(self, type: _TokenType):
-        if self.isAtEnd():
+        current = self.tokens[self.current].type
+
+        if current == _TokenType.EOF:
             return False
 
         # Right, so the KSL hack is easier when the _TokenType's 'values' are compared and not the object themselves
         # Should still be consostent since the fake 'Enum's are uniquely identified with numbers
-        return self.peek().type.value == type.value
+        return current.value == type.value
 
     def checkNext(self, type: _TokenType):
         if self.isAtEnd(): return False
@@ -900,6 +904,10 @@ class Parser:
         else:
             self.advance()
 
+    def arithmeticOp(self, token: _Token, op: tuple):
+        # The binary op token applied by a compound assignment or postfix op, i.e the '+' in 'a += 1' and 'a++'
+        return _Token(op[0], op[1], None, token.line)
+
     def error(self, token: _Token, message: str):
         err = _ParseError(token, message)
         self.errors.append(err)
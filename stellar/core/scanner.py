@@ -2,7 +2,8 @@
 # LICENSE: RLOL
 # Rocket Lang (Stellar) Scanner (C) 2018
 
-import re as _re
+import re  as _re
+import sys as _sys
 
 from utils.reporter import ScanError    as _ScanError
 
@@ -10,7 +11,79 @@ from utils.tokens import Token          as _Token
 from utils.tokens import TokenType      as _TokenType
 
 
+# Operator lexeme -> token type
+OPERATORS = {
+    "(": _TokenType.LEFT_PAREN,
+    ")": _TokenType.RIGHT_PAREN,
+    "{": _TokenType.LEFT_BRACE,
+    "}": _TokenType.RIGHT_BRACE,
+    ";": _TokenType.SEMICOLON,
+    ",": _TokenType.COMMA,
+    "?": _TokenType.Q_MARK,
+    ":": _TokenType.COLON,
+    ".": _TokenType.DOT,
+    "~": _TokenType.TILDE,
+
+    "+": _TokenType.PLUS,
+    "+=": _TokenType.PLUS_INC,
+    "-": _TokenType.MINUS,
+    "-=": _TokenType.MINUS_INC,
+    "*": _TokenType.MULT,
+    "*=": _TokenType.MULT_INC,
+    "**": _TokenType.EXP,
+    "**=": _TokenType.EXP_INC,
+    "%": _TokenType.MOD,
+    "%=": _TokenType.MOD_INC,
+    "/": _TokenType.DIV,
+    "/=": _TokenType.DIV_INC,
+    "//=": _TokenType.FLOOR_INC,
+
+    # Comparison tokens
+    "!": _TokenType.BANG,
+    "!=": _TokenType.BANG_EQUAL,
+    "=": _TokenType.EQUAL,
+    "==": _TokenType.EQUAL_EQUAL,
+    "=>": _TokenType.ARROW,
+    "<": _TokenType.LESS,
+    "<=": _TokenType.LESS_EQUAL,
+    "<<": _TokenType.LESS_LESS,
+    ">": _TokenType.GREATER,
+    ">=": _TokenType.GREATER_EQUAL,
+    ">>": _TokenType.GREATER_GREATER,
+}
+
+# One alternative per kind of lexeme, tried in order. 'Scanner.scan' dispatches on the name of the group that matched.
+# NOTE: The order matters, i.e '//5' has to be tried as 'FLOOR' before it can be a 'COMMENT', and operators go longest first
+TOKEN_PATTERN = _re.compile("|".join([
+    r"(?P<SPACE>[ \t\r\n]+)",
+    r"(?P<IDENTIFIER>[A-Za-z_][A-Za-z0-9_]*)",
+    # NOTE: 'HEX', 'OCT' and 'BIN' digits are only ever [0-9], see 'number'
+    r"(?P<NUMBER>[0-9][xXoObB]?[0-9_]*)",
+    # '//' is only floor division when there's a number (right) after it, i.e 'a // 2'
+    r"(?P<FLOOR>//(?!=)(?=[\s\S]?[0-9]))",
+    # Yes, we use Python styled single comments
+    # NOTE: single line comment can also begin with "///". A lone '//' is skipped
+    r"(?P<COMMENT>#[^\n]*|///[^\n]*|//(?!=))",
+    # C styled '/**/' multi-line comment
+    r"(?P<BLOCK>/\*)",
+    # NOTE: strings start with double (") or single (') quotes, the closing one is left off unterminated strings
+    r"(?P<STRING>\"[^\"]*\"?|'[^']*'?)",
+    r"(?P<OPERATOR>" + "|".join(_re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True)) + ")",
+    r"(?P<UNKNOWN>[\s\S])",
+]))
+
+# The fractional part of a float, picked up by 'number'
+FRACTION = _re.compile(r"\.[0-9][0-9_]*")
+
+BINARY = _re.compile(r"[0-1]*")
+
+DIGITS = "0123456789"
+
+
 class Scanner:
+    # Single pass over the source with one compiled pattern ('TOKEN_PATTERN'), instead of one char at a time.
+    # Keywords come from the (possibly custom) KSL map, see 'tools/custom_syntax.py'
+    # 'tokenize' hands the tokens out lazily (the 'Parser' can consume it as a stream), 'scan' collects them all up front
     def __init__(self, source, wk_Dict):
         self.wk_Dict = wk_Dict
         self.source = source
@@ -20,282 +93,99 @@ class Scanner:
         self.errors = []
 
     def scan(self):
-        while not (self.isAtEnd()):
-            c = self.advance()
-
-            # Check for lexemes
-            # Starting with single character tokens
-            if c == "(":
-                tok_type = _TokenType.LEFT_PAREN
-                self.addSingleToken(tok_type)
-
-            elif c == ")":
-                tok_type = _TokenType.RIGHT_PAREN
-                self.addSingleToken(tok_type)
-
-            elif c == "{":
-                tok_type = _TokenType.LEFT_BRACE
-                self.addSingleToken(tok_type)
-
-            elif c == "}":
-                tok_type = _TokenType.RIGHT_BRACE
-                self.addSingleToken(tok_type)
-
-            elif c == ";":
-                tok_type = _TokenType.SEMICOLON
-                self.addSingleToken(tok_type)
-
-            elif c == ",":
-                tok_type = _TokenType.COMMA
-                self.addSingleToken(tok_type)
-
-            elif c == "?":
-                tok_type = _TokenType.Q_MARK
-                self.addSingleToken(tok_type)
-
-            elif c == ':':
-                tok_type = _TokenType.COLON
-                self.addSingleToken(tok_type)
-
-            elif c == ".":
-                tok_type = _TokenType.DOT
-                self.addSingleToken(tok_type)
-
-            elif c == "+":
-                if self.match("="):
-                    self.addDoubleToken(_TokenType.PLUS_INC)
-
-                else:
-                    tok_type = _TokenType.PLUS
-                    self.addSingleToken(tok_type)
-
-            elif c == "-":
-                if self.match("="):
-                    self.addDoubleToken(_TokenType.MINUS_INC)
-
-                else:
-                    tok_type = _TokenType.MINUS
-                    self.addSingleToken(tok_type)
-
-            elif c == "~":
-                tok_type = _TokenType.TILDE
-                self.addSingleToken(tok_type)
-
-            elif c == "*":
-                if self.match("*"):
-                    if self.peek() == '=':
-                        self.addTripleToken(_TokenType.EXP_INC)
-                        self.advance()
-
-                    else: self.addDoubleToken(_TokenType.EXP)
-
-                else:
-                    if self.match("="):
-                        self.addDoubleToken(_TokenType.MULT_INC)
-
-                    else:
-                        tok_type = _TokenType.MULT
-                        self.addSingleToken(tok_type)
-
-            elif c == "%":
-                if self.match("="):
-                    self.addDoubleToken(_TokenType.MOD_INC)
-
-                else:
-                    tok_type = _TokenType.MOD
-                    self.addSingleToken(tok_type)
-
-            # Yes, we use Pytjon styled single comments
-            elif c == "#":
-                while ((self.peek() != "\n") and not (self.isAtEnd())):
-                    self.advance()
-
-            # Double character tokens
-            # check for div and comment
-            # NOTE: single line comment can also begin with "///"
-            elif c == "/":
-                if self.match("/"):
-                    if self.peek() == '=':
-                        self.addTripleToken(_TokenType.FLOOR_INC)
-                        self.advance()
-
-                    elif (self.futureNumberPeek()):
-                        self.addDoubleToken(_TokenType.FLOOR) # "FLOOR"
-                        # AddSingleToken can't do the job so we might aswell
-
-                    elif (self.peek() == '/'):
-                        while ((self.peek() != "\n") and not (self.isAtEnd())):
-                            self.advance()
-
-                elif self.match("="):
-                    self.addDoubleToken(_TokenType.DIV_INC)
-
-                # C styled '/**/' multi-line comment
-                elif self.match("*"):
-                    while ((self.doublePeek() != "*/")):
-                        if not self.isAtEnd():
-                            self.advance()
-
-                        else:
-                            err = _ScanError(self.line, "Unterminated comment: couldn't find matching '*/' for '/*'").report()
-                            self.errors.append(err)
-                            break
-
-                    # Continue ignoring comments
-                    if self.doublePeek() == "*/":
-                        # Adnavce twice to ignore '*/'
-                        self.advance()
-                        self.advance()
-
-                elif self.match("="):
-                    self.addDoubleToken(_TokenType.DIV_INC)
-
-                else:
-                    self.addSingleToken(_TokenType.DIV) # DIV
-
-
-            # Comparison tokens
-            elif c == "!":
-                if not self.match("="):
-                     self.addSingleToken(_TokenType.BANG) # "BANG"
-
-                else:
-                    self.addDoubleToken(_TokenType.BANG_EQUAL) # "BANG_EQUAL"
-
-            elif c == "=":
-                if self.match('='):
-                    self.addDoubleToken(_TokenType.EQUAL_EQUAL) # "EQUAL_EQUAL"
-
-                else:
-                    if self.match(">"):
-                        self.addDoubleToken(_TokenType.ARROW)
-
-                    else:
-                        self.addSingleToken( _TokenType.EQUAL) # "EQUAL"
-
-
-
-            elif c == "<":
-                if self.match("="):
-                    self.addDoubleToken(_TokenType.LESS_EQUAL) # "LESS_EQUAL"
-
-                elif self.match("<"):
-                    self.addDoubleToken(_TokenType.LESS_LESS) # "LESS_LESS" "<<" left bitshift
-
-                else:
-                    self.addSingleToken(_TokenType.LESS) # "LESS"
+        self.tokens.extend(self.tokenize())
+        return self.tokens
 
-            elif c == ">":
-                if self.match("="):
-                    self.addDoubleToken(_TokenType.GREATER_EQUAL) # "GREATER_EQUAL"
 
-                elif self.match(">"):
-                    self.addDoubleToken(_TokenType.GREATER_GREATER) # "GREATER_GREATER" ">>" right bitshift
+    def tokenize(self):
+        # NOTE: The position and line are kept in locals here and only synced back to 'self' around the (rare) helpers that need them
+        # NOTE: Errors are only all in 'self.errors' once the last token ('EOF') has been handed out
+        source = self.source
+        length = len(source)
+        wk_Dict = self.wk_Dict
+        match = TOKEN_PATTERN.match
+        identifier = _TokenType.IDENTIFIER
+        intern = _sys.intern
+        number = _TokenType.NUMBER
+        pos = self.current
+        line = self.line
+
+        while pos < length:
+            lexeme = match(source, pos)
+            kind = lexeme.lastgroup
+            text = lexeme.group()
+            pos = lexeme.end()
+
+            # Most common first
+            if kind == "SPACE":
+                line += text.count("\n")
+
+            # Names repeat a lot, so every token of one name shares a single lexeme string
+            elif kind == "IDENTIFIER":
+                text = intern(text)
+                yield _Token(wk_Dict.get(text, identifier), text, None, line)
+
+            elif kind == "OPERATOR":
+                yield _Token(OPERATORS[text], text, None, line)
+
+            # Plain ints, anything else (floats, 'HEX', ...) is left to 'number'
+            elif kind == "NUMBER" and text.isdigit() and not source.startswith('.', pos):
+                yield _Token(number, text, int(text), line)
+
+            elif kind == "BLOCK":
+                end = source.find("*/", pos)
+
+                if end == -1:
+                    err = _ScanError(line, "Unterminated comment: couldn't find matching '*/' for '/*'").report()
+                    self.errors.append(err)
+                    pos = length
 
+                # NOTE: lines inside '/**/' comments aren't counted
                 else:
-                    self.addSingleToken(_TokenType.GREATER) # "GREATER"
+                    pos = end + 2
 
-            # literals
-            elif c == "":
-                self.addSingleToken(_TokenType.IDENTIFIER) # "IDENTIFIER"
+            elif kind == "UNKNOWN":
+                err = _ScanError(line, f"Unrecognized symbol '{text}'").report()
+                self.errors.append(err)
 
-            # string
-            # NOTE: strings start with double (") or single (') quotes
-            elif c == '"' or c == "'":
-                if c == '"': self.string('"')
-                else: self.string("'")
+            elif kind != "COMMENT":
+                self.current = pos
+                self.line = line
 
-            # Skip tabs, spaces, etc
-            elif c == " " or c == "\t" or c == "\r":
-                pass
+                if kind == "NUMBER":
+                    token = self.number(text)
 
-            elif c == "\n":
-                self.line += 1
-
-            # Check for unhandled symbols
-            else:
-                if (self.isDigit(c)):
-                    self.number()
-
-                elif (self.isAlpha(c)):
-                    self.identifier()
+                elif kind == "STRING":
+                    token = self.string(text)
 
                 else:
-                    err = _ScanError(self.line, f"Unrecognized symbol '{c}'").report()
-                    self.errors.append(err)
-
-        self.addToken(_TokenType.EOF, '', None)
-        return self.tokens
+                    token = self.makeToken(_TokenType.FLOOR, text, None)
 
+                pos = self.current
+                line = self.line
 
-    def advance(self):
-        self.current += 1
-        index = self.current - 1
-        return self.source[index]
+                # Malformed numbers and strings are only reported
+                if token != None:
+                    yield token
 
+        self.current = pos
+        self.line = line
 
-    def peek(self):
-        if self.isAtEnd():
-            return "\0"
+        yield self.makeToken(_TokenType.EOF, '', None)
 
-        return self.source[self.current]
 
-    def doublePeek(self):
-        if self.wouldBeAtEnd():
-            return "\0"
+    def string(self, text):
+        # Strings may span lines, the token gets the line they end on
+        self.line += text.count("\n")
 
-        return self.source[self.current:self.current + 2]
-
-    def futureNumberPeek(self):
-        doublePeeked = self.doublePeek()
-        future_character = self.source[self.source.index(doublePeeked) + 1]
-        short_future_character = self.source[self.source.index(doublePeeked)]
-
-        if (self.isDigit(future_character) or self.isDigit(short_future_character)):
-            return True
-
-        else:
-            return False
-
-
-    def peekNext(self):
-        if ((self.current + 1) >= (len(self.source) - 1)):
-            return '\0'
-
-        return self.source[self.current + 1]
-
-
-    def match(self, symbol):
-        if not self.isAtEnd():
-            if self.source[self.current] != symbol or self.isAtEnd():
-                return False
-
-            else:
-                self.current += 1
-                return True
-
-
-    def string(self, beg):
-        start = self.current
-
-        while ((self.peek() != beg) and not self.isAtEnd()):
-            if (self.peek() == '\n'):
-                self.line += 1
-
-            self.advance()
-
-        if (self.isAtEnd()):
+        if (len(text) < 2) or (text[-1] != text[0]):
             err = _ScanError(self.line, "Unterminated string").report()
             self.errors.append(err)
             return
 
-        # seek next ' or "
-        self.advance()
+        value = text[1:-1]
 
-        value = self.source[start:self.current - 1]
-        text = self.source[start:self.current - 1]
-
-        self.addToken(_TokenType.STRING, text, value)
+        return self.makeToken(_TokenType.STRING, value, value)
 
 
     def fromBase(self, val: str, base=16):
@@ -324,138 +214,50 @@ class Scanner:
         return total
 
 
-    def number(self):
-        start = self.current
-        value = float()
-        is_seperated = False
-
-        # Lets scan and transform 'HEX' into an int
-        if self.peek().lower() == 'x' or self.peek().lower() == 'o' or self.peek().lower() == 'b':
-            # We continue along and transform it later
-            self.advance()
-
-        while (self.isDigit(self.peek())):
-            self.advance()
-
-        while (self.isDigit(self.peek()) or self.peek() == '_'):
-            is_seperated = True
-            self.advance()
+    def number(self, text):
+        source = self.source
+        start = self.current - len(text)
 
         # decimal part of number of any
-        if ((self.peek() == '.') and (self.isDigit(self.peekNext()))):
-            # chew the decimal point
-            self.advance()
+        if (self.current < len(source)) and (source[self.current] == '.'):
+            # NOTE: A digit right at the end of the source doesn't count
+            if (self.current + 1 < len(source) - 1) and (source[self.current + 1] in DIGITS):
+                # chew the decimal point and the rest
+                self.current = FRACTION.match(source, self.current).end()
 
-            # chew the rest
-            while (self.isDigit(self.peek()) or self.peek() == '_'):
-                self.advance()
+                text = source[start:self.current]
+                value = float(text.replace('_', ''))
 
-            # When we are done chewing through the float we grab its value from the source
-            value_str = self.source[start - 1:self.current]
-            if '_' in value_str:
-                value = float(''.join(value_str.split('_')))
-            else: value = float(value_str)
+                return self.makeToken(_TokenType.NUMBER, text, value)
 
-        elif ((self.peek() == '.') and not (self.isDigit(self.peekNext()))):
+            # The '.' is left for the next token
             err = _ScanError(self.line, "Expected number after '.'. Did you mean float or int?").report()
             self.errors.append(err)
             return
 
-        else:
-            # Keep track of whether we have reached the end of the digit we are parsing
-            # Inorder to aviod 'IndexError'
-            atDigitEnd = True if len(self.source) == start else False
-
-            # if no point found, we know we have an 'int'
-            if not atDigitEnd and self.source[start].lower() == 'x':
-                value = self.fromBase(self.source[start-1:self.current])
+        base = text[1:2].lower()
 
-            elif not atDigitEnd and self.source[start].lower() == 'o':
-                value = self.fromBase(self.source[start-1:self.current], 8)
+        # Lets transform 'HEX', 'OCT' and 'BIN' into an int
+        if base == 'x':
+            value = self.fromBase(text)
 
-            elif not atDigitEnd and self.source[start].lower() == 'b':
-                # Our best would be to use regex
-                match = re.compile('[0-1]*')
-                isFull = match.fullmatch(self.source[start+1:self.current])
-
-                if isFull:
-                    value = self.fromBase(self.source[start-1:self.current], 2)
-                else:
-                    err = _ScanError(self.line, "Expected number to be complete base '2' number")
-                    self.errors.append(err)
+        elif base == 'o':
+            value = self.fromBase(text, 8)
 
-            elif is_seperated:
-                value = int(''.join(self.source[start-1:self.current].split('_')))
+        elif base == 'b':
+            if BINARY.fullmatch(text[2:]):
+                value = self.fromBase(text, 2)
 
             else:
-                value = int(self.source[start - 1:self.current])
-
-        text = self.source[start - 1:self.current]
-
-        self.addToken(_TokenType.NUMBER, text, value)
-
-
-    def identifier(self):
-        start = self.current
-        wk_Dict = self.wk_Dict
-
-        while (self.isAlphaNum(self.peek())):
-            self.advance()
-
-        value = self.source[start - 1:self.current]
-
-        if value in wk_Dict:
-            keyword = wk_Dict[value]
-            self.addToken(keyword, value, None)
+                value = float()
+                err = _ScanError(self.line, "Expected number to be complete base '2' number").report()
+                self.errors.append(err)
 
         else:
-            self.addToken(_TokenType.IDENTIFIER, value, None)
-
-
-    def isDigit(self, c):
-        return ((c >= '0') and (c <= '9'))
-
-
-    def isAlpha(self, c):
-        between_lower_case = c >= 'a' and c <= 'z'
-        between_upper_case = c >= 'A' and c <= 'Z'
-        isUnderscore = c == '_'
-
-        return between_lower_case or between_upper_case or isUnderscore
-
-
-    def isAlphaNum(self, c):
-        return self.isAlpha(c) or self.isDigit(c)
-
-
-    def isAtEnd(self):
-        if self.current > len(self.source) - 1:
-            return True
-        else:
-            return False
-
-    def wouldBeAtEnd(self):
-        if self.current + 1 > len(self.source) - 1:
-            return True
-        else:
-            return False
-
-
-    def addSingleToken(self, lex_type):
-        text = self.source[self.current-1:self.current]
-        self.addToken(lex_type, text, None)
-
-
-    def addDoubleToken(self, lex_type):
-        text = self.source[self.current - 2:self.current]
-        self.addToken(lex_type, text, None)
-
+            value = int(text.replace('_', ''))
 
-    def addTripleToken(self, lex_type):
-        text = self.source[self.current - 2:self.current + 1]
-        self.addToken(lex_type, text, None)
+        return self.makeToken(_TokenType.NUMBER, text, value)
 
 
-    def addToken(self, lex_type, text, literal):
-        token = _Token(lex_type, text, literal, self.line)
-        self.tokens.append(token)
+    def makeToken(self, lex_type, text, literal):
+        return _Token(lex_type, text, literal, self.line)
@@ -0,0 +1,879 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Stack VM (C) 2018
+
+import sys as _sys
+
+from utils.reporter import runtimeError      as _RuntimeError
+from utils.reporter import BREAK             as _BREAK
+from utils.reporter import RETURN            as _RETURN
+from utils.reporter import TAIL_CALL         as _TAIL_CALL
+
+from utils.tokens import TokenType    as _TokenType
+
+from utils.env import Environment     as _Environment
+from utils.env import SlotEnvironment as _SlotEnvironment
+from utils.env import UNSET           as _UNSET
+from utils.env import makeEnvironment    as _makeEnvironment
+from utils.env import releaseEnvironment as _releaseEnvironment
+
+from core.interpreter import Interpreter  as _Interpreter
+from core.operators   import BINARY_OPS   as _BINARY_OPS
+from core.operators   import RAW_NUMBERS  as _RAW_NUMBERS
+from core.operators   import rawNumberOp  as _rawNumberOp
+
+from native.datastructs.rocketClass import RocketFunction  as _RocketFunction
+from native.datastructs.rocketClass import RocketClass     as _RocketClass
+from native.datastructs.rocketClass import RocketInstance  as _RocketInstance
+
+from native.datatypes.rocketNumber  import RocketInt     as _RocketInt
+from native.datatypes.rocketNumber  import RocketFloat   as _RocketFloat
+from native.datatypes.rocketNumber  import SMALL_INTS    as _SMALL_INTS
+
+from core.compiler import Compiler  as _Compiler
+from core.compiler import JUMPS     as _JUMPS
+from core.compiler import LOOPS     as _LOOPS
+from core.compiler import SIMPLE    as _SIMPLE
+from core.compiler import OP_RETURN, OP_CONSTANT, OP_LITERAL, OP_POP, OP_GET_VAR, OP_SET_VAR, OP_DEFINE_VAR, OP_DEFINE_CONST
+from core.compiler import OP_GET_PROPERTY, OP_CHECK_SET, OP_SET_PROPERTY, OP_THIS, OP_BINARY, OP_UNARY, OP_CALL, OP_PRINT
+from core.compiler import OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_POP_JUMP_IF_FALSE, OP_LOOP, OP_POP_LOOP_IF_TRUE
+from core.compiler import OP_PUSH_ENV, OP_POP_ENV, OP_BREAK, OP_EXEC, OP_GET_LOCAL, OP_SET_LOCAL
+from core.compiler import OP_GET_METHOD, OP_INVOKE, OP_COUNTED
+from core.compiler import OP_GET_LOCAL_RAW, OP_GET_VAR_RAW, OP_UNBOX, OP_BOX, OP_ARITH, OP_DIVIDE, OP_POWER, OP_NEGATE
+from core.compiler import OP_POSTFIX, OP_SUPER, OP_FUNCTION, OP_DEFINE_FUNC, OP_DEFINE_CLASS, OP_IMPORT, OP_DEL, OP_ARITH_CONST
+
+
+# What a handler hands back instead of the next 'ip' to leave the chunk, see 'VM.run'
+RETURNED = _sys.maxsize
+BROKE    = _sys.maxsize - 1
+
+
+class VM(_Interpreter):
+    # Runs compiled chunks instead of walking the AST.
+    # Each opcode has a handler in 'dispatch' (indexed by the opcode). A handler gets the frame's stack, its operand and the next 'ip', and hands back the 'ip' to carry on from.
+    # User fns, methods and classes run their compiled bodies in a fresh frame (see 'callCompiled'), everything else shares the tree-walker's runtime helpers so both engines behave the same.
+    def __init__(self, KSL: list):
+        super().__init__(KSL)
+        self.compiler = _Compiler(KSL)
+        self.chunks = {} # id(body) -> (body, len(body), chunk)
+        self.thisLexeme = KSL[1][_TokenType.THIS.value]
+        self.ninLexeme = KSL[1][_TokenType.NIN.value]
+
+        handlers = {
+            OP_RETURN: self.opReturn,
+            OP_CONSTANT: self.opConstant,
+            OP_LITERAL: self.opLiteral,
+            OP_POP: self.opPop,
+            OP_GET_VAR: self.opGetVar,
+            OP_SET_VAR: self.opSetVar,
+            OP_DEFINE_VAR: self.opDefineVar,
+            OP_DEFINE_CONST: self.opDefineConst,
+            OP_GET_PROPERTY: self.opGetProperty,
+            OP_CHECK_SET: self.opCheckSet,
+            OP_SET_PROPERTY: self.opSetProperty,
+            OP_THIS: self.opThis,
+            OP_BINARY: self.opBinary,
+            OP_UNARY: self.opUnary,
+            OP_CALL: self.opCall,
+            OP_PRINT: self.opPrint,
+            OP_JUMP: self.opJump,
+            OP_JUMP_IF_FALSE: self.opJumpIfFalse,
+            OP_JUMP_IF_TRUE: self.opJumpIfTrue,
+            OP_POP_JUMP_IF_FALSE: self.opPopJumpIfFalse,
+            OP_LOOP: self.opJump,
+            OP_PUSH_ENV: self.opPushEnv,
+            OP_POP_ENV: self.opPopEnv,
+            OP_BREAK: self.opBreak,
+            OP_POP_LOOP_IF_TRUE: self.opPopLoopIfTrue,
+            OP_EXEC: self.opExec,
+            OP_GET_LOCAL: self.opGetLocal,
+            OP_SET_LOCAL: self.opSetLocal,
+            OP_GET_METHOD: self.opGetMethod,
+            OP_INVOKE: self.opInvoke,
+            OP_COUNTED: self.opCounted,
+            OP_GET_LOCAL_RAW: self.opGetLocalRaw,
+            OP_GET_VAR_RAW: self.opGetVarRaw,
+            OP_UNBOX: self.opUnbox,
+            OP_BOX: self.opBox,
+            OP_ARITH: self.opArith,
+            OP_DIVIDE: self.opDivide,
+            OP_POWER: self.opPower,
+            OP_NEGATE: self.opNegate,
+            OP_POSTFIX: self.opPostfix,
+            OP_SUPER: self.opSuper,
+            OP_FUNCTION: self.opFunction,
+            OP_DEFINE_FUNC: self.opDefineFunc,
+            OP_DEFINE_CLASS: self.opDefineClass,
+            OP_IMPORT: self.opImport,
+            OP_DEL: self.opDel,
+            OP_ARITH_CONST: self.opArithConst,
+        }
+
+        # Handler per opcode, indexed by the opcode itself
+        self.dispatch = [handlers[op] for op in range(len(handlers))]
+
+    def interpret(self, statements: list):
+        try:
+            self.run(self.compiler.compile(statements))
+
+        except _RuntimeError as error:
+            # Same reporting rules as the tree-walker
+            if not (hasattr(error, 'willDup')):
+                self.errors.append(error)
+
+            else:
+                if not error.willDup: self.errors.append(error)
+
+    def bodyChunk(self, stmts: list):
+        # Fn bodies are compiled on their first call and reused after that
+        cached = self.chunks.get(id(stmts))
+
+        # NOTE: 'merge_inits' grows 'init' bodies in place, so recompile when the length changes
+        if (cached == None) or (cached[0] is not stmts) or (cached[1] != len(stmts)):
+            cached = (stmts, len(stmts), self.compiler.compile(stmts))
+            self.chunks[id(stmts)] = cached
+
+        return cached[2]
+
+    def executeBlock(self, stmts: list, env: _Environment):
+        # Called by 'RocketFunction.call' when a fn is called from outside the VM's own call ops (i.e natives calling back into Rocket fns)
+        return self.run(self.bodyChunk(stmts), env)
+
+    def link(self, chunk):
+        # Pairs each instruction with its handler and operand once, so running it is a single lookup.
+        # Constant operands are fetched from the pool and jump offsets turned into the 'ip' they land on
+        dispatch = self.dispatch
+        constants = chunk.constants
+        linked = []
+
+        for ip, (op, arg) in enumerate(zip(chunk.code, chunk.args)):
+            if op in _LOOPS:
+                operand = ip + 1 - arg
+
+            elif op in _JUMPS:
+                operand = ip + 1 + arg
+
+            elif op in _SIMPLE:
+                operand = None
+
+            else:
+                operand = constants[arg]
+
+            linked.append((dispatch[op], operand))
+
+        chunk.linked = linked
+
+        return linked
+
+    def run(self, chunk, env=None):
+        # Runs 'chunk' as a frame of its own (own stack), in 'env' if given.
+        # Hands back 'RETURN'/'BREAK' if the chunk is left through 'OP_RETURN'/'OP_BREAK', else 'None'
+        code = chunk.linked
+
+        if code is None:
+            code = self.link(chunk)
+
+        stack = []
+        ip = 0
+        end = len(code)
+
+        # Restore env in case an error escapes from inside a block
+        previous = self.environment
+
+        if env is not None:
+            self.environment = env
+
+        try:
+            while ip < end:
+                handler, operand = code[ip]
+                ip = handler(stack, operand, ip + 1)
+
+        finally:
+            self.environment = previous
+
+        if ip == RETURNED:
+            return _RETURN
+
+        if ip == BROKE:
+            return _BREAK
+
+    # Calls
+
+    def callCompiled(self, function: _RocketFunction, args: list, expr: object, tail: bool, instance: _RocketInstance = None):
+        # 'callFunction' and 'RocketFunction.invoke' in one. Arity is already checked, and the body runs as a compiled chunk in a frame of its own.
+        # 'instance' is only set for methods called unbound, see 'Interpreter.getMethod'
+        if tail and not function.isInit:
+            self.tailCall = (function, args, instance)
+            return _TAIL_CALL
+
+        if (self.callDepth >= self.maxCallDepth):
+            name = expr.callee.name.lexeme if hasattr(expr.callee, 'name') else function
+            error = _RuntimeError(name, f"Maximum recursion depth reached from calls to '{name}' fn.", False)
+
+            self.errors.append(error)
+            raise error
+
+        chunks = self.chunks
+        self.callDepth += 1
+
+        try:
+            # Same as 'RocketFunction.boundClosure'
+            if instance is None:
+                closure = function.closure
+
+            else:
+                closure = _Environment(function.closure)
+                closure.values[function.this_lexeme] = instance
+
+            # Trampoline, same as 'RocketFunction.invoke'
+            while True:
+                body = function.decleration.body
+                cached = chunks.get(id(body))
+
+                if (cached is not None) and (cached[0] is body) and (cached[1] == len(body)):
+                    chunk = cached[2]
+
+                else:
+                    chunk = self.bodyChunk(body)
+
+                try:
+                    layout = function.layout
+
+                    # Same as 'RocketFunction.newEnv'
+                    if layout is not None:
+                        env = _SlotEnvironment(layout, closure)
+                        slots = env.slots
+
+                        for i, index in enumerate(layout.params):
+                            slots[index] = args[i]
+
+                    else:
+                        env = function.newEnv(args, closure)
+
+                    signal = self.run(chunk, env)
+
+                # Errors raised inside the fn body are handed back as its value
+                except Exception as err:
+                    return err
+
+                if signal is _RETURN:
+                    value = self.returnValue
+
+                    if value is not _TAIL_CALL:
+                        return value
+
+                    function, args, instance = self.tailCall
+
+                    if instance is None:
+                        closure = function.closure
+
+                    else:
+                        closure = _Environment(function.closure)
+                        closure.values[function.this_lexeme] = instance
+
+                    continue
+
+                if function.isInit:
+                    return closure.getAt(0, function.this_lexeme)
+
+                return self.ninLexeme
+
+        finally:
+            self.callDepth -= 1
+
+    def construct(self, klass: _RocketClass, args: list, expr: object):
+        # Same as 'RocketClass.call', with 'init' run unbound on the new instance
+        instance = _RocketInstance(klass)
+
+        if klass.init != None:
+            self.callCompiled(klass.init, args, expr, False, instance)
+
+        return instance
+
+    def callAny(self, callee: object, args: list, site: tuple):
+        expr, argc, tail = site
+        kind = callee.__class__
+
+        if kind is _RocketFunction:
+            if len(callee.decleration.params) == argc:
+                return self.callCompiled(callee, args, expr, tail)
+
+        elif kind is _RocketClass:
+            if callee.initArity == argc:
+                return self.construct(callee, args, expr)
+
+        # Natives, datatype methods and arity errors
+        return self.callValue(callee, args, expr)
+
+    # Handlers
+
+    def opConstant(self, stack, value, ip):
+        stack.append(value)
+        return ip
+
+    def opLiteral(self, stack, literal, ip):
+        box, value = literal
+        stack.append(box(value))
+        return ip
+
+    def opPop(self, stack, _, ip):
+        stack.pop()
+        return ip
+
+    def opGetLocal(self, stack, site, ip):
+        expr, ref, depth, index = site
+        glob = self.globals
+
+        if ref[0] != glob.version:
+            ref[0] = glob.version
+            ref[1] = glob.lookup(expr.name.lexeme)
+
+        value = ref[1]
+
+        # Globals (natives, fns) still shadow locals
+        if value is _UNSET:
+            env = self.environment
+
+            while depth:
+                env = env.enclosing
+                depth -= 1
+
+            value = env.slots[index]
+
+            if value is _UNSET:
+                value = self.lookupName(expr)
+
+        stack.append(value)
+        return ip
+
+    def opGetLocalRaw(self, stack, site, ip):
+        self.opGetLocal(stack, site, ip)
+
+        value = stack[-1]
+
+        if (value.__class__ is _RocketInt) or (value.__class__ is _RocketFloat):
+            stack[-1] = value.value
+
+        return ip
+
+    def readName(self, expr: object, ref: list):
+        # Same order as 'lookupName', globals then the env chain
+        glob = self.globals
+
+        if ref[0] != glob.version:
+            ref[0] = glob.version
+            ref[1] = glob.lookup(expr.name.lexeme)
+
+        if ref[1] is not _UNSET:
+            return ref[1]
+
+        lexeme = expr.name.lexeme
+        env = self.environment
+
+        while env is not None:
+            if env.__class__ is _SlotEnvironment:
+                index = env.layout.names.get(lexeme)
+
+                if (index is not None) and (env.slots[index] is not _UNSET):
+                    return env.slots[index]
+
+                if env.extras is not None:
+                    return self.lookupName(expr)
+
+            else:
+                if lexeme in env.values:
+                    return env.values[lexeme]
+
+                if lexeme in env.statics:
+                    return env.statics[lexeme]
+
+            env = env.enclosing
+
+        # Let 'lookupName' report it
+        return self.lookupName(expr)
+
+    def opGetVar(self, stack, site, ip):
+        expr, ref, lexeme = site
+        env = self.environment
+
+        # Names in the innermost plain env (i.e top-level vars) skip the walk
+        if (env.__class__ is _Environment) and (lexeme in env.values) and (ref[0] == self.globals.version) and (ref[1] is _UNSET):
+            stack.append(env.values[lexeme])
+
+        else:
+            stack.append(self.readName(expr, ref))
+
+        return ip
+
+    def opGetVarRaw(self, stack, site, ip):
+        expr, ref, lexeme = site
+        env = self.environment
+
+        if (env.__class__ is _Environment) and (lexeme in env.values) and (ref[0] == self.globals.version) and (ref[1] is _UNSET):
+            value = env.values[lexeme]
+
+        else:
+            value = self.readName(expr, ref)
+
+        if (value.__class__ is _RocketInt) or (value.__class__ is _RocketFloat):
+            value = value.value
+
+        stack.append(value)
+        return ip
+
+    def opSetLocal(self, stack, site, ip):
+        expr, depth, index, keep = site
+        value = stack[-1] if keep else stack.pop()
+        env = self.environment
+
+        while depth:
+            env = env.enclosing
+            depth -= 1
+
+        if env.slots[index] is not _UNSET:
+            env.slots[index] = value
+
+        else:
+            self.assignName(expr, value)
+
+        return ip
+
+    def opSetVar(self, stack, site, ip):
+        expr, keep = site
+        lexeme = expr.name.lexeme
+        value = stack[-1] if keep else stack.pop()
+        env = self.environment
+
+        # Same walk as 'Environment.assign', anything unusual (consts, extras, errors) goes through 'assignName'
+        while env is not None:
+            if env.__class__ is _SlotEnvironment:
+                index = env.layout.names.get(lexeme)
+
+                if (env.extras is not None) or (lexeme in env.layout.consts):
+                    break
+
+                if (index is not None) and (env.slots[index] is not _UNSET):
+                    env.slots[index] = value
+                    return ip
+
+            else:
+                if lexeme in env.statics:
+                    break
+
+                if lexeme in env.values:
+                    env.values[lexeme] = value
+                    return ip
+
+            env = env.enclosing
+
+        self.assignName(expr, value)
+        return ip
+
+    def opDefineVar(self, stack, site, ip):
+        stmt, ref, slot = site
+        glob = self.globals
+
+        # Whether a class/fn already took the name, only looked up again once the global table changes
+        if ref[0] != glob.version:
+            ref[0] = glob.version
+            ref[1] = glob.isTaken(stmt.name)
+
+        if ref[1]:
+            raise _RuntimeError(stmt.name.lexeme, "Name already defined as 'class' or 'function'", False)
+
+        if slot is not None:
+            self.environment.slots[slot] = stack.pop()
+
+        else:
+            self.environment.define(stmt.name.lexeme, stack.pop())
+
+        return ip
+
+    def opDefineConst(self, stack, stmt, ip):
+        self.defineConst(stmt, stack.pop())
+        return ip
+
+    def opGetProperty(self, stack, site, ip):
+        expr, ref = site
+        obj = stack[-1]
+
+        # Fields of user instances, '[shape, index]' of the last field read here. See 'Interpreter.getProperty'
+        if obj.__class__ is _RocketInstance:
+            shape = obj.shape
+
+            if ref[0] is not shape:
+                index = shape.names.get(expr.name.lexeme)
+
+                # Methods (or the error)
+                if index is None:
+                    stack[-1] = obj.get(expr.name)
+                    return ip
+
+                ref[0] = shape
+                ref[1] = index
+
+            value = obj.fields[ref[1]]
+            stack[-1] = value if value is not None else obj.get(expr.name)
+
+            return ip
+
+        stack[-1] = self.getProperty(obj, expr)
+        return ip
+
+    def opCheckSet(self, stack, expr, ip):
+        if stack[-1].__class__ is not _RocketInstance:
+            self.checkSetTarget(stack[-1], expr)
+
+        return ip
+
+    def opSetProperty(self, stack, site, ip):
+        expr, cache, keep = site
+        value = stack.pop()
+        obj = stack[-1] if keep else stack.pop()
+
+        # Same as 'Interpreter.setProperty', '[shape before, shape after, index]' of the last store from here
+        if obj.__class__ is _RocketInstance:
+            shape = obj.shape
+
+            if cache[0] is shape:
+                if cache[1] is shape:
+                    obj.fields[cache[2]] = value
+
+                else:
+                    obj.fields.append(value)
+                    obj.shape = cache[1]
+
+            else:
+                obj.set(expr.name, value)
+
+                cache[0] = shape
+                cache[1] = obj.shape
+                cache[2] = obj.shape.names[expr.name.lexeme]
+
+        else:
+            obj.set(expr.name, value)
+
+        if keep:
+            stack[-1] = value
+
+        return ip
+
+    def opThis(self, stack, expr, ip):
+        # 'this' is always found right outside the method's own env, see 'Interpreter.lookUpVariable'
+        if expr.keyword.lexeme == self.thisLexeme:
+            env = self.environment.enclosing
+
+            # Same as 'getAt(0, ...)'
+            if env.__class__ is _Environment:
+                stack.append(env.values.get(self.thisLexeme))
+
+            else:
+                stack.append(self.environment.getAt(0, self.thisLexeme))
+
+        else:
+            stack.append(self.lookUpVariable(expr.keyword, expr))
+
+        return ip
+
+    def opBinary(self, stack, site, ip):
+        # Each site keeps the 'BINARY_OPS' handler per pair of operand classes it saw, so it never hashes the token type again
+        operator, handlers = site
+        right = stack.pop()
+        left = stack[-1]
+        key = (left.__class__, right.__class__)
+
+        if key in handlers:
+            handler = handlers[key]
+
+        else:
+            handler = handlers[key] = _BINARY_OPS.get((operator.type, key[0], key[1]))
+
+        stack[-1] = handler(self, operator, left, right) if handler is not None else self.binaryOp(operator, left, right)
+        return ip
+
+    def opUnary(self, stack, operator, ip):
+        stack[-1] = self.unaryOp(operator, stack[-1])
+        return ip
+
+    def opCall(self, stack, site, ip):
+        expr, argc, tail = site
+
+        if argc:
+            args = stack[-argc:]
+            del stack[-argc:]
+
+        else:
+            args = []
+
+        callee = stack[-1]
+
+        if (callee.__class__ is _RocketFunction) and (len(callee.decleration.params) == argc):
+            stack[-1] = self.callCompiled(callee, args, expr, tail)
+
+        else:
+            stack[-1] = self.callAny(callee, args, site)
+
+        return ip
+
+    def opGetMethod(self, stack, expr, ip):
+        # Same as 'Interpreter.getMethod', plain methods of user instances are pushed unbound along with their instance (else 'None')
+        obj = stack[-1]
+
+        if (obj.__class__ is _RocketInstance) and (obj.field(expr.name.lexeme) is None):
+            method = obj.shape.klass.findMethod(expr.name.lexeme)
+
+            if (method != None) and not method.isInit:
+                stack.append(obj)
+                stack[-2] = method
+                return ip
+
+        stack[-1] = self.getProperty(obj, expr)
+        stack.append(None)
+        return ip
+
+    def opInvoke(self, stack, site, ip):
+        expr, argc, tail = site
+
+        if argc:
+            args = stack[-argc:]
+            del stack[-argc:]
+
+        else:
+            args = []
+
+        instance = stack.pop()
+        method = stack[-1]
+
+        if instance is None:
+            stack[-1] = self.callAny(method, args, site)
+
+        elif len(method.decleration.params) == argc:
+            stack[-1] = self.callCompiled(method, args, expr, tail, instance)
+
+        else:
+            # Let it report the arity error
+            stack[-1] = self.callMethod(method, instance, args, expr)
+
+        return ip
+
+    def opPrint(self, stack, _, ip):
+        self.printValue(stack.pop())
+        return ip
+
+    # Only 'nin' and 'false' are falsy, see 'Interpreter.isTruthy'
+
+    def opJump(self, stack, target, ip):
+        return target
+
+    def opJumpIfFalse(self, stack, target, ip):
+        value = stack[-1]
+        return target if (value is None) or (value is False) else ip
+
+    def opJumpIfTrue(self, stack, target, ip):
+        value = stack[-1]
+        return ip if (value is None) or (value is False) else target
+
+    def opPopJumpIfFalse(self, stack, target, ip):
+        value = stack.pop()
+        return target if (value is None) or (value is False) else ip
+
+    def opPopLoopIfTrue(self, stack, target, ip):
+        value = stack.pop()
+        return ip if (value is None) or (value is False) else target
+
+    def opPushEnv(self, stack, layout, ip):
+        self.environment = _makeEnvironment(layout, self.environment)
+        return ip
+
+    def opPopEnv(self, stack, _, ip):
+        env = self.environment
+        self.environment = env.enclosing
+        _releaseEnvironment(env)
+
+        return ip
+
+    def opBreak(self, stack, _, ip):
+        return BROKE
+
+    def opReturn(self, stack, _, ip):
+        self.returnValue = stack.pop()
+        return RETURNED
+
+    def opExec(self, stack, stmt, ip):
+        self.execute(stmt)
+        return ip
+
+    def opCounted(self, stack, loop, ip):
+        stmt, chunks = loop
+        env = _makeEnvironment(stmt.layout, self.environment)
+        signal = self.countedLoop(stmt.counted, env, lambda s: self.run(chunks[s]))
+        _releaseEnvironment(env)
+
+        return RETURNED if signal is _RETURN else ip
+
+    # Unboxed number path, see 'Interpreter.evaluateRaw'
+
+    def opUnbox(self, stack, _, ip):
+        value = stack[-1]
+
+        if (value.__class__ is _RocketInt) or (value.__class__ is _RocketFloat):
+            stack[-1] = value.value
+
+        return ip
+
+    def opBox(self, stack, _, ip):
+        # Same as 'boxRaw'
+        value = stack[-1]
+
+        if value.__class__ is int:
+            shared = _SMALL_INTS.get(value)
+            stack[-1] = shared if shared is not None else _RocketInt(value)
+
+        elif value.__class__ is float:
+            stack[-1] = _RocketFloat(value)
+
+        return ip
+
+    def opArith(self, stack, site, ip):
+        operator, fn, box = site
+        right = stack.pop()
+        left = stack[-1]
+
+        if (left.__class__ in _RAW_NUMBERS) and (right.__class__ in _RAW_NUMBERS):
+            value = fn(left, right)
+
+            # Same as 'OP_BOX'
+            if box:
+                if value.__class__ is int:
+                    shared = _SMALL_INTS.get(value)
+                    value = shared if shared is not None else _RocketInt(value)
+
+                elif value.__class__ is float:
+                    value = _RocketFloat(value)
+
+            stack[-1] = value
+
+        else:
+            stack[-1] = _rawNumberOp(self, operator, left, right)
+
+        return ip
+
+    def opArithConst(self, stack, site, ip):
+        operator, fn, right, box = site
+        left = stack[-1]
+
+        if left.__class__ in _RAW_NUMBERS:
+            value = fn(left, right)
+
+            if box:
+                if value.__class__ is int:
+                    shared = _SMALL_INTS.get(value)
+                    value = shared if shared is not None else _RocketInt(value)
+
+                elif value.__class__ is float:
+                    value = _RocketFloat(value)
+
+            stack[-1] = value
+
+        else:
+            stack[-1] = _rawNumberOp(self, operator, left, right)
+
+        return ip
+
+    def opDivide(self, stack, site, ip):
+        operator, fn, box = site
+        right = stack.pop()
+        left = stack[-1]
+
+        if (left.__class__ in _RAW_NUMBERS) and (right.__class__ in _RAW_NUMBERS) and (right != 0):
+            value = fn(left, right)
+
+            if box:
+                if value.__class__ is int:
+                    shared = _SMALL_INTS.get(value)
+                    value = shared if shared is not None else _RocketInt(value)
+
+                elif value.__class__ is float:
+                    value = _RocketFloat(value)
+
+            stack[-1] = value
+
+        else:
+            # Reports the zero division too
+            stack[-1] = _rawNumberOp(self, operator, left, right)
+
+        return ip
+
+    def opPower(self, stack, operator, ip):
+        right = stack.pop()
+        stack[-1] = _rawNumberOp(self, operator, stack[-1], right)
+        return ip
+
+    def opNegate(self, stack, operator, ip):
+        right = stack[-1]
+        stack[-1] = -right if right.__class__ in _RAW_NUMBERS else self.unaryOp(operator, self.sanitizeNum(right))
+        return ip
+
+    # The rest
+
+    def opPostfix(self, stack, site, ip):
+        expr, step, ref, slot, keep = site
+
+        # Ints in slots get bumped in place, anything else (unset slots, globals of the same name, floats) takes the long way
+        if slot is not None:
+            glob = self.globals
+
+            if ref[0] != glob.version:
+                ref[0] = glob.version
+                ref[1] = glob.lookup(expr.name.lexeme)
+
+            if ref[1] is _UNSET:
+                depth, index = slot
+                env = self.environment
+
+                while depth:
+                    env = env.enclosing
+                    depth -= 1
+
+                current = env.slots[index]
+
+                if current.__class__ is _RocketInt:
+                    n = current.value + step
+                    shared = _SMALL_INTS.get(n)
+                    env.slots[index] = shared if shared is not None else _RocketInt(n)
+
+                    if keep:
+                        stack.append(current)
+
+                    return ip
+
+        current = self.visitPostfixExpr(expr)
+
+        if keep:
+            stack.append(current)
+
+        return ip
+
+    def opSuper(self, stack, expr, ip):
+        stack.append(self.lookupSuper(expr))
+        return ip
+
+    def opFunction(self, stack, expr, ip):
+        stack.append(_RocketFunction(expr, self.environment, False, self.thisLexeme, True))
+        return ip
+
+    def opDefineFunc(self, stack, stmt, ip):
+        self.globals.define(stmt.name.lexeme, _RocketFunction(stmt, self.environment, False, self.thisLexeme))
+        return ip
+
+    def opDefineClass(self, stack, stmt, ip):
+        self.defineClass(stmt, stack.pop())
+        return ip
+
+    def opImport(self, stack, stmt, ip):
+        self.visitImportStmt(stmt)
+        return ip
+
+    def opDel(self, stack, stmt, ip):
+        self.visitDelStmt(stmt)
+        return ip
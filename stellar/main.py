@@ -7,11 +7,14 @@ import sys       as _sys
 import os        as _os
 import readline  as _readline
 
-from utils.resolver import Resolver     as _Resolver
+from utils.resolver  import Resolver     as _Resolver
+from utils.optimizer import Optimizer    as _Optimizer
 
 from core.scanner import Scanner             as _Scanner
 from core.parser  import Parser              as _Parser
 from core.interpreter import Interpreter     as _Interpreter
+from core.vm          import VM              as _VM
+from core.closures    import ClosureInterpreter  as _ClosureInterpreter
 
 # to scan for 'config.rckt' file
 from tools.custom_syntax import Scanner  as _Dante
@@ -20,6 +23,9 @@ from tools.custom_syntax import Parser   as _Virgil
 # For REPL Auto completion
 from tools.autocompleter import AutoComp as _AutoComp
 
+# For '--dump-ast'
+from tools.astprinter import LispAstPrinter as _AstPrinter
+
 
 # Version info
 header = "Rocket 0.6.3 | [Stellar 0.4.4]"
@@ -113,6 +119,10 @@ def usage():
     -h     : print this help message and exit (also --help)
     -q     : don't print version and copyright messages on interactive startup
     -v     : print the Rocket version number and exit (also --version)
+    -O     : optimize the AST before running it (constant folding, shared literals, dead 'if' branches)
+    --engine=<name> : execution engine to run code with; 'tree' (default), 'closure' or 'vm'
+    --dump-ast : print the program's AST (after '-O' if given) instead of running it
+    --max-depth=<n> : max nested fn calls before a recursion error (default 1000). Tail calls ('return f(...)') don't count
 
     file   : program read from script file
 
@@ -121,11 +131,33 @@ def usage():
 
     return info
 
+# Execution engines, picked with '--engine='
+# 'tree' walks the AST, 'closure' turns each node into a cached Python closure, 'vm' compiles it to bytecode first
+engines = {
+    'tree': _Interpreter,
+    'closure': _ClosureInterpreter,
+    'vm': _VM,
+}
+
 # So that global env is static throughout execution. Especially in REPL
 # Get and pass KSL
 KSL = assemble_ksl()
 interpreter = _Interpreter(KSL)
 
+# Set from the command line, see 'main'
+optimize = False
+dump_ast = False
+
+
+def set_engine(name):
+    global interpreter
+
+    if name not in engines:
+        print(f"Error: unknown engine '{name}'. Available engines: {', '.join(engines)}")
+        _sys.exit(1)
+
+    interpreter = engines[name](KSL)
+
 
 def run_file(path):
     with open(path, encoding='utf-8') as f:
@@ -180,14 +212,17 @@ def run_prompt(prompt, headerless=False):
         UpdateAuto(autoCmp)
 
 
-def run(source, mode=None):
+def run(source, mode=None, engine=None):
     # To avoid running resolver on statements
     hadError = False
 
-    scanner = _Scanner(source, KSL[0])
-    tokens = scanner.scan()
+    # Switch execution engine if asked to
+    if engine != None:
+        set_engine(engine)
 
-    parser = _Parser(tokens, KSL[1])
+    # The parser pulls tokens from the scanner as it goes
+    scanner = _Scanner(source, KSL[0])
+    parser = _Parser(scanner.tokenize(), KSL[1])
     statements = parser.parse()
 
     errors = scanner.errors + parser.errors
@@ -200,6 +235,13 @@ def run(source, mode=None):
         # We don't bother resolving already 'error'ful code
         return
 
+    if optimize:
+        statements = _Optimizer(interpreter).optimize(statements)
+
+    if dump_ast:
+        print(_AstPrinter().printStmts(statements))
+        return
+
     resolver = _Resolver(interpreter, KSL[1])
     resolver.resolveStmts(statements)
     resolution_errs = resolver.errors
@@ -223,9 +265,38 @@ def run(source, mode=None):
 
 
 def main():
+    global optimize, dump_ast
+
+    max_depth = None
+
     valids = ['-q', '--quite', '-v', '--version', '-h', '--help', '-c']
     prompt = get_env() if get_env() != None else "><> "
 
+    # Pull out engine selection and optimizer flags before looking at the rest of the args
+    for arg in _sys.argv[1:]:
+        if arg.startswith('--engine='):
+            set_engine(arg.split('=', 1)[1])
+            _sys.argv.remove(arg)
+
+        elif arg == '-O':
+            optimize = True
+            _sys.argv.remove(arg)
+
+        elif arg == '--dump-ast':
+            dump_ast = True
+            _sys.argv.remove(arg)
+
+        elif arg.startswith('--max-depth='):
+            max_depth = arg.split('=', 1)[1]
+            _sys.argv.remove(arg)
+
+    if max_depth != None:
+        if not max_depth.isdigit() or int(max_depth) == 0:
+            print(f"Error: '--max-depth' expects a positive number, got '{max_depth}'")
+            _sys.exit(1)
+
+        interpreter.setMaxCallDepth(int(max_depth))
+
     if len(_sys.argv) == 1:
         try:
             run_prompt(prompt)
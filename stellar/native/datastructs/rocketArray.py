@@ -1,3 +1,9 @@
+import math     as _math
+import operator as _operator
+
+from array     import array      as _array
+from itertools import accumulate as _accumulate
+
 from utils.reporter    import runtimeError   as _RuntimeError
 
 from utils.tokens import Token     as _Token
@@ -7,15 +13,15 @@ from utils.misc   import isValNeg       as _isValNeg
 from utils.misc   import isType         as _isType
 from utils.misc   import isAllSameType  as _isAllSameType
 
+import utils.tags as _tags
+
 from native.datastructs.rocketClass import RocketCallable as _RocketCallable
 from native.datastructs.rocketClass import RocketInstance as _RocketInstance
+from native.datastructs.rocketClass import NativeMethods  as _NativeMethods
 
 from native.datatypes import rocketBoolean as _boolean
-from native.datatypes import rocketString  as _string
 from native.datatypes import rocketNumber  as _number
 
-from native.datastructs import rocketList  as _list
-
 
 class Array(_RocketCallable):
     def __init__(self):
@@ -60,603 +66,440 @@ class Array(_RocketCallable):
         return "<native type 'Array'>"
 
 
-class RocketArray(_RocketInstance):
-    def __init__(self, elms, arrayType, nin_lexeme):
-        self.elements = elms
-        self.arrayType = arrayType
-        self.isEmpty = arrayType == type(None)
-        self.nin_lexeme = nin_lexeme
-        self.nature = 'datatype'
-        self.kind = "<native type 'Array'>"
-
-    def get(self, name: _Token):
-        # Note: 'edna' is what we use to manipulate arity for 'slice' function from '1' to '2'
-        if name.lexeme == 'get':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                index = args[0].value
-
-                if index >= len(self.elements):
-                    raise _RuntimeError('Array', "IndexError: list index out of range")
-
-                return self.elements[index]
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'get' of array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'insert':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 2
-
-            def call(interpreter, args):
-                # This fn expects input like the standard Python 'insert' list method
-                # 'insert(index, item)'
-                # It requires two args exactly
-                # where if 'index' is -1 it translates to secone to the last not the last
-                # to add an item at the end we need to pass the length of the array as the index
-                # i.e. [array].insert([array].length(), [item]) 
-                self.elements[args[0].value] = args[1]
-
-                return self
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'Array'
-            rocketCallable.toString = "<native method 'insert' of Array>"
-            rocketCallable.insert = True
-
-            return rocketCallable
-
-        if name.lexeme == 'slice':
-            rocketCallable = _RocketCallable(self)
-
-            def arity(inc=False):
-                if inc:
-                    return 2
-
-                return 1
-
-            def call(interpreter, args, inc=False):
-                if inc:
-                    if args[0].value >= len(self.elements) or args[1].value >= len(self.elements):
-                        raise _RuntimeError('Array', "IndexError: list index out of range")
-
-                    # Special case
-                    if (args[0].value >= args[1].value):
-                        return Array().call(self, [])
-
-                    else:
-                        return Array().call(self, self.elements[args[0].value:args[1].value])
-
-                return Array().call(self, self.elements[args[0].value:])
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'Array'
-            rocketCallable.toString = "<native method 'slice' of Array>"
-            rocketCallable.slice = True
-            rocketCallable.inc = False
-
-            return rocketCallable
-
-        if name.lexeme == 'splice':
-            rocketCallable = _RocketCallable(self)
-
-            def arity(inc=False):
-                if inc:
-                    return 2
-
-                return 1
-
-            def call(interpreter, args, inc=False):
-                # If initial index is beyond the limit then nothing is returned
-                if args[0].value >= len(self.elements):
-                    return Array().call(self, [])
-
-                removed_array = []
-                is_negative_index = False
-
-                if inc:
-                    # Please note, if the item count is zero then nothing is returned
-                    if args[1].value == 0:
-                        return Array().call(self, [])
-
-                    # Negative steps return nothing irrespective of the index
-                    # ... so we need to perform a negativivty test on the input
-                    if _isValNeg(args[1].value):
-                        return Array().call(self, [])
-
-                    # Handle Positive and negative index
-                    # count is always positive
-                    # Run positivity test for index to determine behaviour (adapted from test above)
-                    if not _isValNeg(args[0].value):
-                        removed_array = self.elements[args[0].value:args[0].value + args[1].value:]
-
-                    else:
-                        # I.e. when index is negative
-                        idx = args[0].value
-                        # step is the index of the starting elm to the next subseq. 'n' (args[1]) elms
-                        step = (len(self.elements) + args[0].value) + args[1].value
-
-                        removed_array = self.elements[idx:step:]
-                        is_negative_index = True
-
-                else:
-                    # if only index provided then the entire list from the index to end is returned
-                    removed_array = Array().call(self, self.elements[args[0].value:])
-
-                # Remove array items
-                # Remember the slices are contiguously stored so we can safely use indexing
-                # ... by cutting out the first chunk and last chunk then attaching them (surgically)
-                head = self.elements[0:len(self.elements) + args[0].value] if is_negative_index else self.elements[0:args[0].value]
-                tail = self.elements[len(self.elements) + args[0].value + args[1].value:] if is_negative_index else self.elements[args[0].value + args[1].value:]
-
-                self.elements = head + tail
-
-                # return removed array slice
-                return Array().call(self, removed_array)
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'Array'
-            rocketCallable.toString = "<native method 'splice' of Array>"
-            rocketCallable.splice = True
-            rocketCallable.inc = False
-
-            return rocketCallable
-
-        if (name.lexeme == 'append') or (name.lexeme == 'push'):
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
+class NumberBuffer:
+    # Unboxed storage for Int and Float Arrays.
+    # Raw values live in an 'array' buffer ('q' for Int, 'd' for Float) and are only boxed when read, so it quacks like the list of boxed elms it replaces
+    # NOTE: If an Int outgrows 64 bits the buffer falls back to a plain list of (still raw) values
+    __slots__ = ('box', 'buffer')
 
-            def call(interpreter, args):
-                # Internally add new elm
-                self.elements.append(args[0])
+    typecodes = { _number.RocketInt: 'q', _number.RocketFloat: 'd' }
 
-                # we return the appended array
-                return self
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'append' of Array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'length':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return len(self.elements)
-                else:
-                    return 0
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'length' of Array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'pop':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    last = self.elements[-1]
-                    self.elements.remove(last)
-                    return last
-                else:
-                    raise _RuntimeError('Array', "IndexError: cannot pop empty list")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'pop' of Array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+    def __init__(self, box, buffer):
+        self.box = box
+        self.buffer = buffer
 
-        if name.lexeme == 'remove':
-            rocketCallable = _RocketCallable(self)
+    @classmethod
+    def pack(cls, box, values):
+        # Materialize first, so a failed (overflowing) attempt doesn't eat the values
+        values = list(values)
 
-            def arity():
-                return 1
+        try:
+            return cls(box, _array(cls.typecodes[box], values))
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    removed_index = -1
+        except OverflowError:
+            return cls(box, list(values))
 
-                    for i in range(len(self.elements) - 1):
-                        if args[0].value == self.elements[i].value:
-                            self.elements.remove(self.elements[i])
-                            removed_index = i
+    @classmethod
+    def fromElements(cls, elms, box):
+        # Only exact (non 'nin') elms of the Array's type can be stored unboxed
+        if box not in cls.typecodes:
+            return None
 
-                    if removed_index == -1:
-                        raise _RuntimeError('Array', "IndexError: Item not in list")
-                
-                    else:
-                        return _number.Int().call(self, [removed_index])
+        for elm in elms:
+            if (type(elm) != box) or (box == _number.RocketFloat and type(elm.value) != float):
+                return None
 
-                else:
-                    raise _RuntimeError('Array', "IndexError: cannot remove items from an empty list")
+        return cls.pack(box, [elm.value for elm in elms])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'remove' of Array>"
-            rocketCallable.nature = 'native'
+    def fits(self, elm):
+        return (type(elm) == self.box) and (self.box != _number.RocketFloat or type(elm.value) == float)
 
-            return rocketCallable
+    def update(self, values):
+        # Swap in new raw values, i.e after 'cumsum'
+        self.buffer = self.pack(self.box, values).buffer
 
-        if name.lexeme == 'sort':
-            rocketCallable = _RocketCallable(self)
+    def store(self, index, value):
+        try:
+            self.buffer[index] = value
 
-            def arity():
-                return 0
+        except OverflowError:
+            self.buffer = list(self.buffer)
+            self.buffer[index] = value
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    self.elements.sort()
-                    return None
-                else:
-                    return None
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'sort' of Array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+    def __len__(self):
+        return len(self.buffer)
 
-        if name.lexeme == 'reverse':
-            rocketCallable = _RocketCallable(self)
+    def __iter__(self):
+        return map(self.box, self.buffer)
 
-            def arity():
-                return 0
+    def __getitem__(self, index):
+        if type(index) == slice:
+            return NumberBuffer(self.box, self.buffer[index])
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    # internally change and return mutation
-                    self.elements.reverse()
-                    return self
+        return self.box(self.buffer[index])
 
-                else:
-                    return Array().call(self, [])
+    def __setitem__(self, index, elm):
+        self.store(index, elm.value)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'reverse' of Array>"
-            rocketCallable.nature = 'native'
+    def __delitem__(self, index):
+        del self.buffer[index]
 
-            return rocketCallable
+    def __add__(self, other):
+        return self.pack(self.box, list(self.buffer) + list(other.buffer))
 
-        if name.lexeme == 'min':
-            rocketCallable = _RocketCallable(self)
+    def append(self, elm):
+        try:
+            self.buffer.append(elm.value)
 
-            def arity():
-                return 0
+        except OverflowError:
+            self.buffer = list(self.buffer)
+            self.buffer.append(elm.value)
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+    def pop(self):
+        return self.box(self.buffer.pop())
 
-                if len(self.elements) == 0:
-                    return _RuntimeError(self, "Can't get min of empty an Array.")
+    def remove(self, elm):
+        self.buffer.remove(elm.value)
 
-                min = self.elements[0].value
+    def reverse(self):
+        self.buffer.reverse()
 
-                for i in range(1, len(self.elements)):
-                    if min > self.elements[i].value:
-                        min = self.elements[i].value
+    def sort(self):
+        self.buffer = self.pack(self.box, sorted(self.buffer)).buffer
 
-                return _number.Int().call(self, [min])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'min' of Array>"
-            rocketCallable.nature = 'native'
+class RocketArray(_RocketInstance):
+    __slots__ = ('elements', 'arrayType', 'isEmpty', 'nin_lexeme')
 
-            return rocketCallable
+    nativeMethods = _NativeMethods('Array')
+    nature = 'datatype'
+    kind = "<native type 'Array'>"
+    tag = _tags.ARRAY
 
-        if name.lexeme == 'max':
-            rocketCallable = _RocketCallable(self)
+    def __init__(self, elms, arrayType, nin_lexeme):
+        # Int and Float Arrays keep their elms unboxed (see 'NumberBuffer')
+        if type(elms) != NumberBuffer:
+            buffer = NumberBuffer.fromElements(elms, arrayType)
+            elms = buffer if buffer != None else elms
 
-            def arity():
-                return 0
+        self.elements = elms
+        self.arrayType = arrayType
+        self.isEmpty = arrayType == type(None)
+        self.nin_lexeme = nin_lexeme
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+    def get(self, name: _Token):
+        return self.nativeMethods.bind(self, name)
 
-                if len(self.elements) == 0:
-                    return _RuntimeError(self, "Can't get max of empty an Array.")
+    @nativeMethods.method('get', 1, toString="<native method 'get' of array>")
+    def _get(self, interpreter, args):
+        index = args[0].value
 
-                max = self.elements[0].value
+        if index >= len(self.elements):
+            raise _RuntimeError('Array', "IndexError: list index out of range")
 
-                for i in range(1, len(self.elements)):
-                    if max < self.elements[i].value:
-                        max = self.elements[i].value
+        return self.elements[index]
 
-                return _number.Int().call(self, [max])
+    @nativeMethods.method('insert', 2)
+    def _insert(self, interpreter, args):
+        # This fn expects input like the standard Python 'insert' list method
+        # 'insert(index, item)'
+        # It requires two args exactly
+        # where if 'index' is -1 it translates to secone to the last not the last
+        # to add an item at the end we need to pass the length of the array as the index
+        # i.e. [array].insert([array].length(), [item]) 
+        self.admit(args[1])
+        self.elements[args[0].value] = args[1]
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'max' of Array>"
-            rocketCallable.nature = 'native'
+        return self
 
-            return rocketCallable
+    @nativeMethods.method('slice', 1, variadic='slice')
+    def _slice(self, interpreter, args, inc=False):
+        if inc:
+            if args[0].value >= len(self.elements) or args[1].value >= len(self.elements):
+                raise _RuntimeError('Array', "IndexError: list index out of range")
 
-        if name.lexeme == 'mean':
-            rocketCallable = _RocketCallable(self)
+            # Special case
+            if (args[0].value >= args[1].value):
+                return self.like([])
 
-            def arity():
-                return 0
+            else:
+                return self.like(self.elements[args[0].value:args[1].value])
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+        return self.like(self.elements[args[0].value:])
 
-                if len(self.elements) == 0:
-                    return _RuntimeError(self, "Can't get mean of empty an Array.")
+    @nativeMethods.method('splice', 1, variadic='splice')
+    def _splice(self, interpreter, args, inc=False):
+        # If initial index is beyond the limit then nothing is returned
+        if args[0].value >= len(self.elements):
+            return Array().call(self, [])
 
-                sum = 0
+        removed_array = []
+        is_negative_index = False
 
-                for i in range(0, len(self.elements)):
-                    sum += self.elements[i].value
+        if inc:
+            # Please note, if the item count is zero then nothing is returned
+            if args[1].value == 0:
+                return Array().call(self, [])
 
-                return _number.Float().call(self, [sum / len(self.elements)])
+            # Negative steps return nothing irrespective of the index
+            # ... so we need to perform a negativivty test on the input
+            if _isValNeg(args[1].value):
+                return Array().call(self, [])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'mean' of Array>"
-            rocketCallable.nature = 'native'
+            # Handle Positive and negative index
+            # count is always positive
+            # Run positivity test for index to determine behaviour (adapted from test above)
+            if not _isValNeg(args[0].value):
+                removed_array = self.elements[args[0].value:args[0].value + args[1].value:]
 
-            return rocketCallable
+            else:
+                # I.e. when index is negative
+                idx = args[0].value
+                # step is the index of the starting elm to the next subseq. 'n' (args[1]) elms
+                step = (len(self.elements) + args[0].value) + args[1].value
 
-        if name.lexeme == 'dot':
-            rocketCallable = _RocketCallable(self)
+                removed_array = self.elements[idx:step:]
+                is_negative_index = True
 
-            def arity():
-                return 1
+        else:
+            # if only index provided then the entire list from the index to end is returned
+            removed_array = Array().call(self, self.elements[args[0].value:])
 
-            def call(interpreter, args):
-                if _isType(args[0], _number.RocketInt):
-                    for i in range(len(self.elements)):
-                        prod = args[0].value * self.elements[i].value
-                        self.elements[i].value = prod
+        # Remove array items
+        # Remember the slices are contiguously stored so we can safely use indexing
+        # ... by cutting out the first chunk and last chunk then attaching them (surgically)
+        head = self.elements[0:len(self.elements) + args[0].value] if is_negative_index else self.elements[0:args[0].value]
+        tail = self.elements[len(self.elements) + args[0].value + args[1].value:] if is_negative_index else self.elements[args[0].value + args[1].value:]
 
-                    return self
-                
-                else:
-                    raise _RuntimeError(self, "Expected an Int.")
+        self.elements = head + tail
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'dot' of Array>"
-            rocketCallable.nature = 'native'
+        # return removed array slice
+        return Array().call(self, removed_array)
 
-            return rocketCallable
+    @nativeMethods.method('append', 1, aliases=('push',))
+    def _append(self, interpreter, args):
+        # Internally add new elm
+        self.admit(args[0])
+        self.elements.append(args[0])
 
-        if name.lexeme == 'fill':
-            rocketCallable = _RocketCallable(self)
+        # we return the appended array
+        return self
 
-            def arity():
-                return 1
+    @nativeMethods.method('length', 0)
+    def _length(self, interpreter, args):
+        if self.notEmpty():
+            return len(self.elements)
+        else:
+            return 0
 
-            def call(interpreter, args):
-                if _isType(args[0], _number.RocketInt):
-                    for i in range(len(self.elements)):
-                        self.elements[i] = args[0]
+    @nativeMethods.method('pop', 0)
+    def _pop(self, interpreter, args):
+        if self.notEmpty():
+            return self.elements.pop()
+        else:
+            raise _RuntimeError('Array', "IndexError: cannot pop empty list")
 
-                    return self
-                
-                else:
-                    raise _RuntimeError(self, "Expected an Int.")
+    @nativeMethods.method('remove', 1)
+    def _remove(self, interpreter, args):
+        if self.notEmpty():
+            removed_index = -1
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'fill' of Array>"
-            rocketCallable.nature = 'native'
+            for i in range(len(self.elements) - 1):
+                if args[0].value == self.elements[i].value:
+                    self.elements.remove(self.elements[i])
+                    removed_index = i
 
-            return rocketCallable
+            if removed_index == -1:
+                raise _RuntimeError('Array', "IndexError: Item not in list")
+        
+            else:
+                return _number.Int().call(self, [removed_index])
 
-        if name.lexeme == 'sum':
-            rocketCallable = _RocketCallable(self)
+        else:
+            raise _RuntimeError('Array', "IndexError: cannot remove items from an empty list")
 
-            def arity():
-                return 0
+    @nativeMethods.method('sort', 0)
+    def _sort(self, interpreter, args):
+        if self.notEmpty():
+            self.elements.sort()
+            return None
+        else:
+            return None
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+    @nativeMethods.method('reverse', 0)
+    def _reverse(self, interpreter, args):
+        if self.notEmpty():
+            # internally change and return mutation
+            self.elements.reverse()
+            return self
 
-                if len(self.elements) == 0:
-                    return _number.Int().call(self, [0])
+        else:
+            return Array().call(self, [])
 
-                sum = 0
+    @nativeMethods.method('min', 0)
+    def _min(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-                for i in range(len(self.elements)):
-                    sum += self.elements[i].value
+        if len(self.elements) == 0:
+            return _RuntimeError(self, "Can't get min of empty an Array.")
 
-                return _number.Int().call(self, [sum])
+        return _number.Int().call(self, [min(self.values())])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'sum' of Array>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('max', 0)
+    def _max(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-            return rocketCallable
+        if len(self.elements) == 0:
+            return _RuntimeError(self, "Can't get max of empty an Array.")
 
-        if name.lexeme == 'cumsum':
-            rocketCallable = _RocketCallable(self)
+        return _number.Int().call(self, [max(self.values())])
 
-            def arity():
-                return 0
+    @nativeMethods.method('mean', 0)
+    def _mean(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+        if len(self.elements) == 0:
+            return _RuntimeError(self, "Can't get mean of empty an Array.")
 
-                sum = 0
+        return _number.Float().call(self, [sum(self.values()) / len(self.elements)])
 
-                for i in range(len(self.elements)):
-                    sum += self.elements[i].value
-                    self.elements[i].value = sum
+    @nativeMethods.method('dot', 1)
+    def _dot(self, interpreter, args):
+        if _isType(args[0], _number.RocketInt):
+            if self.isTyped():
+                self.elements.update([args[0].value * value for value in self.elements.buffer])
 
                 return self
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'cumsum' of Array>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+            # Swap in new values rather than editing them, elements may be shared (i.e literals under '-O')
+            for i in range(len(self.elements)):
+                prod = args[0].value * self.elements[i].value
+                self.elements[i] = self.elements[i].__class__(prod)
 
-        if name.lexeme == 'prod':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
+            return self
+        
+        else:
+            raise _RuntimeError(self, "Expected an Int.")
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+    @nativeMethods.method('fill', 1)
+    def _fill(self, interpreter, args):
+        if _isType(args[0], _number.RocketInt):
+            self.admit(args[0])
 
-                if len(self.elements) == 0:
-                    return _number.Int().call(self, [0])
+            if self.isTyped():
+                self.elements.update([args[0].value] * len(self.elements))
 
-                prod = 1
+                return self
 
-                for i in range(len(self.elements)):
-                    prod *= self.elements[i].value
+            for i in range(len(self.elements)):
+                self.elements[i] = args[0]
 
-                return _number.Int().call(self, [prod])
+            return self
+        
+        else:
+            raise _RuntimeError(self, "Expected an Int.")
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'prod' of Array>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('sum', 0)
+    def _sum(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-            return rocketCallable
+        if len(self.elements) == 0:
+            return _number.Int().call(self, [0])
 
-        if name.lexeme == 'cumprod':
-            rocketCallable = _RocketCallable(self)
+        return _number.Int().call(self, [sum(self.values())])
 
-            def arity():
-                return 0
+    @nativeMethods.method('cumsum', 0)
+    def _cumsum(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-            def call(interpreter, args):
-                if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
-                    raise _RuntimeError(self, "Can only perform operation on number Arrays.")
+        if self.isTyped():
+            self.elements.update(_accumulate(self.elements.buffer))
 
-                prod = 1
+            return self
 
-                for i in range(len(self.elements)):
-                    prod *= self.elements[i].value
-                    self.elements[i].value = prod
+        sum = 0
 
-                return self
+        for i in range(len(self.elements)):
+            sum += self.elements[i].value
+            self.elements[i] = self.elements[i].__class__(sum)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'cumprod' of Array>"
-            rocketCallable.nature = 'native'
+        return self
 
-            return rocketCallable
+    @nativeMethods.method('prod', 0)
+    def _prod(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-        if name.lexeme == 'indexOf':
-            rocketCallable = _RocketCallable(self)
+        if len(self.elements) == 0:
+            return _number.Int().call(self, [0])
 
-            def arity():
-                return 1
+        return _number.Int().call(self, [_math.prod(self.values())])
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for i in range(len(self.elements)):
-                        if args[0].value == self.elements[i].value:
-                            return _number.Int().call(self, [i])
+    @nativeMethods.method('cumprod', 0)
+    def _cumprod(self, interpreter, args):
+        if (self.arrayType != _number.RocketInt) and (self.arrayType != _number.RocketFloat):
+            raise _RuntimeError(self, "Can only perform operation on number Arrays.")
 
-                    raise _RuntimeError('Array', "IndexError: Item not in list")
+        if self.isTyped():
+            self.elements.update(_accumulate(self.elements.buffer, _operator.mul))
 
-                else:
-                    raise _RuntimeError('Array', "IndexError: cannot index from an empty list")
+            return self
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'indexOf' of Array>"
-            rocketCallable.nature = 'native'
+        prod = 1
 
-            return rocketCallable
+        for i in range(len(self.elements)):
+            prod *= self.elements[i].value
+            self.elements[i] = self.elements[i].__class__(prod)
 
-        if name.lexeme == 'includes':
-            rocketCallable = _RocketCallable(self)
+        return self
 
-            def arity():
-                return 1
+    @nativeMethods.method('indexOf', 1)
+    def _indexOf(self, interpreter, args):
+        if self.notEmpty():
+            for i in range(len(self.elements)):
+                if args[0].value == self.elements[i].value:
+                    return _number.Int().call(self, [i])
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for i in range(len(self.elements)):
-                        if args[0].value == self.elements[i].value:
-                            return _boolean.Bool().call(self, [True])
-                    
-                    return _boolean.Bool().call(self, [False])
+            raise _RuntimeError('Array', "IndexError: Item not in list")
 
-                else:
-                    raise _RuntimeError('Array', "IndexError: cannot index from an empty list")
+        else:
+            raise _RuntimeError('Array', "IndexError: cannot index from an empty list")
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'includes' of Array>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('includes', 1)
+    def _includes(self, interpreter, args):
+        if self.notEmpty():
+            for i in range(len(self.elements)):
+                if args[0].value == self.elements[i].value:
+                    return _boolean.Bool().call(self, [True])
+            
+            return _boolean.Bool().call(self, [False])
 
-            return rocketCallable
+        else:
+            raise _RuntimeError('Array', "IndexError: cannot index from an empty list")
 
-        if name.lexeme == 'forEach':
-            rocketCallable = _RocketCallable(self)
+    @nativeMethods.method('forEach', 1)
+    def _forEach(self, interpreter, args):
+        if self.notEmpty():
+            for item in self.elements: args[0].call(interpreter, [item])
+        else:
+            raise _RuntimeError('Array', "IndexError: cannot run function on an empty list")
 
-            def arity():
-                return 1
+    def set(self, name, value):
+        raise _RuntimeError(name, "Cannot mutate an Array's props")
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for item in self.elements: args[0].call(interpreter, [item])
-                else:
-                    raise _RuntimeError('Array', "IndexError: cannot run function on an empty list")
+    def like(self, elms):
+        # A new Array of this one's type holding 'elms' (i.e a slice of it), a typed slice keeps its buffer
+        return RocketArray(elms, self.arrayType if len(elms) else type(None), self.nin_lexeme)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'forEach' of Array>"
-            rocketCallable.nature = 'native'
+    def isTyped(self):
+        return type(self.elements) == NumberBuffer
 
-            return rocketCallable
+    def values(self):
+        # Raw numbers, straight off the buffer for typed Arrays
+        if self.isTyped():
+            return self.elements.buffer
 
-        else:
-            raise _RuntimeError(name, f"'Array' has no method '{name.lexeme}'.")
+        return (elm.value for elm in self.elements)
 
-    def set(self, name, value):
-        raise _RuntimeError(name, "Cannot mutate an Array's props")
+    def admit(self, elm):
+        # A typed buffer only holds elms of its own type, anything else turns the Array back into a list of boxed elms
+        if self.isTyped() and not self.elements.fits(elm):
+            self.elements = list(self.elements)
 
     def notEmpty(self):
         if len(self.elements) == 0:
@@ -665,16 +508,18 @@ class RocketArray(_RocketInstance):
         return True
 
     def stringify(self, elm, uncoloured=False):
-        if (_isType(elm, RocketArray) or _isType(elm, _list.RocketList)):
+        tag = _tags.tagOf(elm)
+
+        if (tag == _tags.ARRAY) or (tag == _tags.LIST):
             return elm.__str__()
 
-        if (_isType(elm, _number.RocketInt) or _isType(elm, _number.RocketFloat)):
+        if (tag == _tags.INT) or (tag == _tags.FLOAT):
             return f'\033[36m{elm}\033[0m' if not uncoloured else str(elm.value)
 
-        if _isType(elm, _string.RocketString):
+        if tag == _tags.STRING:
             return f'\033[32m{elm}\033[0m' if not uncoloured else elm.value
 
-        if _isType(elm, _boolean.Bool):
+        if tag == _tags.BOOL:
             return f'\033[1m{elm}\033[0m' if not uncoloured else str(elm.value)
 
         if type(elm) == type(None):
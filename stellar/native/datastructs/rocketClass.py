@@ -1,12 +1,22 @@
-import copy as _copy
-
 from utils.env      import Environment  as _Environment
+from utils.env      import SlotEnvironment  as _SlotEnvironment
 from utils.reporter import runtimeError as _RuntimeError
+from utils.reporter import RETURN       as _RETURN
+from utils.reporter import TAIL_CALL    as _TAIL_CALL
 from utils.tokens   import Token        as _Token
 from utils.tokens   import TokenType    as _TokenType
 
+import utils.tags as _tags
+
+
+def declName(stmt: object):
+    # The name an 'init' stmt declares, i.e 'x' for 'this.x = x;'. 'None' if it isn't a decleration
+    return getattr(getattr(getattr(stmt, 'expression', None), 'name', None), 'lexeme', None)
+
 
 class RocketCallable:
+    tag = _tags.NATIVE
+
     def __init__(self, callee):
         self.callee = callee
 
@@ -17,75 +27,140 @@ class RocketCallable:
         raise NotImplementedError
 
 
+class NativeMethod(RocketCallable):
+    # A native datatype method bound to its receiver ('callee').
+    # 'spec' is the shared '(fn, arity, toString, variadic)' entry from the datatype's 'NativeMethods' table
+    nature = 'native'
+    tag = _tags.NATIVE_METHOD
+
+    def __init__(self, callee, spec):
+        self.callee = callee
+        self.spec = spec
+
+    @property
+    def toString(self):
+        return self.spec[2]
+
+    def arity(self):
+        return self.spec[1]
+
+    def call(self, interpreter: object, args: list):
+        return self.spec[0](self.callee, interpreter, args)
+
+
+class NativeSliceMethod(NativeMethod):
+    # 'slice' and 'splice' take an optional extra arg.
+    # The interpreter spots them by their 'slice'/'splice' attr and flips 'inc' when the extra arg is given
+    def __init__(self, callee, spec):
+        self.callee = callee
+        self.spec = spec
+        self.signature = callee.nativeMethods.typename
+        self.inc = False
+
+        setattr(self, spec[3], True)
+
+    def arity(self, inc=False):
+        return self.spec[1] + 1 if inc else self.spec[1]
+
+    def call(self, interpreter: object, args: list, inc=False):
+        return self.spec[0](self.callee, interpreter, args, inc)
+
+
+class NativeMethods(dict):
+    # Class-level method table for a native datatype (String, List, ...), filled once at import by the 'method' decorator.
+    # Lookups are a single dict hit and only allocate the small bound 'NativeMethod'
+    def __init__(self, typename: str):
+        super().__init__()
+        self.typename = typename
+
+    def method(self, name: str, arity: int, aliases=(), toString=None, variadic=None):
+        def register(fn):
+            spec = (fn, arity, toString or f"<native method '{name}' of {self.typename}>", variadic)
+
+            for alias in (name, *aliases):
+                self[alias] = spec
+
+            return fn
+
+        return register
+
+    def bind(self, receiver: object, name: _Token):
+        spec = self.get(name.lexeme)
+
+        if spec == None:
+            raise _RuntimeError(name, f"'{self.typename}' has no method '{name.lexeme}'.")
+
+        if spec[3] != None:
+            return NativeSliceMethod(receiver, spec)
+
+        return NativeMethod(receiver, spec)
+
+
+class Shape:
+    # Hidden class of a 'RocketInstance'. Instances of the same class that got the same fields in the same order share one,
+    # so each field name is stored once per shape and the instances only keep a list of values.
+    # Shapes never change, adding a field moves the instance on to the next shape (made once, then shared through 'transitions')
+    __slots__ = ('klass', 'names', 'transitions')
+
+    def __init__(self, klass: object, names: dict):
+        self.klass = klass
+        self.names = names # field name -> index into the instance's 'fields'
+        self.transitions = {} # field name -> shape with that field added
+
+    def add(self, name: str):
+        shape = self.transitions.get(name)
+
+        if shape is None:
+            names = dict(self.names)
+            names[name] = len(names)
+
+            shape = self.transitions[name] = Shape(self.klass, names)
+
+        return shape
+
+
 class RocketClass(RocketCallable):
+    tag = _tags.CLASS
+
     def __init__(self, name, superclass, methods: dict):
         self.name = name
         self.superclass = superclass
         self.methods = methods
         self.merged = False
+        self.methodCache = {} # name -> unbound method (or None), see 'findMethod'
+        self.shape = Shape(self, {}) # Shape of fresh instances, no fields yet
         self.nature = 'class'
         self.kind = f"<class type>"
 
-    def locateMethod(self, instance: object, name: str):
-        if self.methods.get(name):
-            return self.methods.get(name).bind(instance, name)
-
-        if self.superclass != None:
-            return self.superclass.locateMethod(instance, name)
-
-        return None
-
-    def merge_inits(self, sub, sup, short_sup_init=False):
-        # store copy, to be manipulated and used
-        tmp = _copy.deepcopy(sup)
-
-        # So, we loop through sub checking the names declared in the inits
-        # if we find a name that appears in both the sub-class 'init' and the super-clas 'init' we just shadow the super-class with the sub-class decl.
-        # At the end unmatched decls are simply added to the sub's decls. Forming a fully merged (inherited and shadow ready) list of decls on the sub-class's 'init' method
-        # TODO: In the future, use this loop to 'loop-n-merge' all the super-classes of a subclass. That is if we want to add support for multi-class inheritance.
-
-        # We loop through using this sub's decls body IF and ONLY if sup decls body is longer than sub's ELSE we use sup's decls body len
-        # 'lim' is the number we use to loop with
-        lim = len(sub.decleration.body)
-        reverse_check = False
-
-        # check for sup-init decls height and adjust lim appropriately
-        if short_sup_init:
-            lim = len(sup.decleration.body)
-            # if sup decl is smaller we need to reverse the check to whether a given sup decl is in the sub decls. Else we check for whether the subdec is in the supdecs.
-            reverse_check = True
+        # Worked out once here, when the class is defined. Every instantiation just reuses them
+        self.init = self.mergeInit()
+        self.initArity = self.countArity()
 
-        for i in range(lim):
-            try:
-                supdec = sup.decleration.body[i].expression.name.lexeme
-                subdec = sub.decleration.body[i].expression.name.lexeme
-                supdecs = [i.expression.name.lexeme for i in tmp.decleration.body]
-                subdecs = [i.expression.name.lexeme for i in sub.decleration.body]
+    def findMethod(self, name: str):
+        # Walk up the superclass chain once per name and remember the result.
+        # Methods never change once a class is built, and redefining a class builds a fresh 'RocketClass' (fresh cache), so nothing ever needs evicting
+        try:
+            return self.methodCache[name]
 
-                if not reverse_check:
-                    if subdec in supdecs:
-                        index = tmp.decleration.body[i]
-                        tmp.decleration.body.remove(index)
+        except KeyError:
+            method = self.methods.get(name)
 
-                else:
-                    if supdec in subdecs:
-                        index = tmp.decleration.body[i]
-                        tmp.decleration.body.remove(index)
+            if (method == None) and (self.superclass != None):
+                method = self.superclass.findMethod(name)
 
-            except AttributeError:
-                # In case we hit a decleration that isn't an expression in the body. We just remove it from the sub's body.
-                index = tmp.decleration.body[i]
-                tmp.decleration.body.remove(index)
+            self.methodCache[name] = method
 
-        sub.decleration.body += tmp.decleration.body
+            return method
 
-        self.superclass.bp_arity = True
+    def locateMethod(self, instance: object, name: str):
+        method = self.findMethod(name)
 
-        return sub
+        if method != None:
+            return method.bind(instance, name)
 
-    def call(self, interpreter: object, args: list):
-        instance = RocketInstance(self)
+        return None
 
+    def mergeInit(self):
         # Grab subclass
         sub_init = self.methods.get("init")
         super_init = None
@@ -98,23 +173,44 @@ class RocketClass(RocketCallable):
         # Remember, sometimes a subclass might not have 'init' only in its superclass. So we just set it to superclass's 'init'
         init = sub_init if sub_init != None else super_init
 
-        if super_init != None:
-            # only merge if super-class has more than or just as many 'init' decls
-            if not len(super_init.decleration.body) == 0 and sub_init != None:
-                # Lets merge the params also
-                # But make sure the order is still matched
-                # I.e init(type) (sup) init(x, y) (sub) --> init(type, x, y) not init(x, y, type)
-                init.decleration.params = [p for p in super_init.decleration.params if p.lexeme not in [y.lexeme for y in init.decleration.params]] + init.decleration.params
-                init = self.merge_inits(sub_init, super_init, len(super_init.decleration.body) < len(sub_init.decleration.body))
-                self.merged = True
-
-        if init != None:
-            binded_init = init.bind(instance, init.name)
+        # only merge if super-class has 'init' decls to hand down
+        if (super_init != None) and (sub_init != None) and not len(super_init.decleration.body) == 0:
+            # Lets merge the params also
+            # But make sure the order is still matched
+            # I.e init(type) (sup) init(x, y) (sub) --> init(type, x, y) not init(x, y, type)
+            params = {p.lexeme for p in sub_init.decleration.params}
+
+            sub_init.decleration.params = [p for p in super_init.decleration.params if p.lexeme not in params] + sub_init.decleration.params
+            init = self.merge_inits(sub_init, super_init)
+            self.merged = True
+
+        return init
+
+    def merge_inits(self, sub, sup):
+        # If we find a name that is declared in both the sub-class 'init' and the super-class 'init' we just shadow the super-class decl with the sub-class one.
+        # The unmatched super-class decls are simply added to the sub's decls. Forming a fully merged (inherited and shadow ready) list of decls on the sub-class's 'init' method
+        # Anything in the super-class 'init' that isn't a decleration is left out.
+        # NOTE: Runs once per class, and merging an already merged 'init' again adds nothing
+        # TODO: In the future, use this to 'loop-n-merge' all the super-classes of a subclass. That is if we want to add support for multi-class inheritance.
+        subdecs = {declName(stmt) for stmt in sub.decleration.body}
+
+        sub.decleration.body += [stmt for stmt in sup.decleration.body if declName(stmt) not in subdecs and declName(stmt) != None]
+
+        return sub
+
+    def call(self, interpreter: object, args: list):
+        instance = RocketInstance(self)
+
+        if self.init != None:
+            binded_init = self.init.bind(instance, self.init.name)
             binded_init.call(interpreter, args)
 
         return instance
 
     def arity(self):
+        return self.initArity
+
+    def countArity(self):
         # Fix so tha KSL still applies here and in 'self.call()'
         # Add dynamic superclass res for params and iinit. Maybe we call a function who knows
         init_arity = 0
@@ -155,16 +251,34 @@ class RocketClass(RocketCallable):
 
 
 class RocketInstance:
+    # NOTE: The native datatypes subclass this too, so every runtime value stays '__dict__' free (see their '__slots__')
+    # Field values live in 'fields', in the order the 'shape' lists their names
+    __slots__ = ('shape', 'fields')
+
+    nature = 'class'
+    kind = "<class type instanceOf>"
+    tag = _tags.INSTANCE
+
     def __init__(self, _class: RocketClass):
-        self._class = _class
-        self.fields = {}
-        self.nature = 'class'
-        self.kind = f"<class type instanceOf>"
+        self.shape = _class.shape
+        self.fields = []
+
+    @property
+    def _class(self):
+        return self.shape.klass
+
+    def field(self, name: str):
+        # Field value or 'None'
+        index = self.shape.names.get(name)
+
+        return self.fields[index] if index is not None else None
 
     def get(self, name: _Token):
+        value = self.field(name.lexeme)
+
         # Not exactly sure why accessing a value stored as '0' causes regular 'if something' check to be jumped. So we explicitly check to see if it is not 'None'
-        if self.fields.get(name.lexeme) != None:
-            return self.fields.get(name.lexeme)
+        if value != None:
+            return value
 
         method = self._class.locateMethod(self, name.lexeme)
 
@@ -178,7 +292,14 @@ class RocketInstance:
         raise _RuntimeError(name, f"Undefined property '{name.lexeme}.")
 
     def set(self, name: _Token, value: object):
-        self.fields[name.lexeme] = value
+        index = self.shape.names.get(name.lexeme)
+
+        if index is not None:
+            self.fields[index] = value
+
+        else:
+            self.shape = self.shape.add(name.lexeme)
+            self.fields.append(value)
 
     def __str__(self):
         return f"<class instanceOf '{self._class.name}'>"
@@ -191,6 +312,8 @@ class RocketInstance:
 
 
 class RocketFunction(RocketCallable):
+    tag = _tags.FUNCTION
+
     def __init__(self, decleration, closure, isInit, this_lexeme, isAnon=False, methodName=''):
         super(RocketCallable)
         self.closure = closure
@@ -200,6 +323,7 @@ class RocketFunction(RocketCallable):
         self.this_lexeme = this_lexeme
         self.isAnon = isAnon
         self.isMethod = True if methodName != '' else False
+        self.layout = getattr(self.decleration, 'layout', None) # set by the resolver for plain fns
         self.nature = 'class'
         self.kind = f"<fn type>" if self.name != '' else "<anonymous fn type>"
 
@@ -219,28 +343,62 @@ class RocketFunction(RocketCallable):
             return len(self.decleration.params) - len(confs)
 
     def call(self, interpreter: object, args: list):
+        return self.invoke(interpreter, args, self.closure)
+
+    def callBound(self, interpreter: object, args: list, instance: RocketInstance):
+        # Same as 'self.bind(instance, ...).call(interpreter, args)' without building the throwaway bound fn
+        return self.invoke(interpreter, args, self.boundClosure(instance))
+
+    def boundClosure(self, instance: RocketInstance):
         env = _Environment(self.closure)
+        env.define(self.this_lexeme, instance)
 
-        for i in range(len(self.decleration.params)):
-            env.define(self.decleration.params[i].lexeme, args[i])
+        return env
 
-        try:
-            interpreter.executeBlock(self.decleration.body, env)
+    def newEnv(self, args: list, closure: _Environment):
+        if self.layout is not None:
+            env = _SlotEnvironment(self.layout, closure)
+            slots = env.slots
+
+            for i, index in enumerate(self.layout.params):
+                slots[index] = args[i]
+
+        else:
+            env = _Environment(closure)
+
+            for i in range(len(self.decleration.params)):
+                env.define(self.decleration.params[i].lexeme, args[i])
+
+        return env
+
+    def invoke(self, interpreter: object, args: list, closure: _Environment):
+        function = self
+
+        # Trampoline, each tail call swaps in its target and goes around again instead of nesting another call
+        while True:
+            try:
+                signal = interpreter.executeBlock(function.decleration.body, function.newEnv(args, closure))
+
+            # Errors raised inside the fn body are handed back as its value
+            except Exception as err:
+                return err
+
+            # 'return' leaves its value on the interpreter before signalling
+            if signal is _RETURN:
+                value = interpreter.returnValue
+
+                if value is not _TAIL_CALL:
+                    return value
 
-        # Hack to avoid "ReturnException" from prematurely quiting prog
-        except Exception as ret:
-            if hasattr(ret, 'returnable') and hasattr(ret, 'value'):
-                return ret.value
+                function, args, instance = interpreter.tailCall
+                closure = function.closure if instance is None else function.boundClosure(instance)
 
-            # If 'ret' is not 'returnable'
-            # its most probably a sub-class of 'Exception' (an Error)
-            else:
-                return ret
+                continue
 
-        if (self.isInit):
-            return self.closure.getAt(0, self.this_lexeme)
+            if (function.isInit):
+                return closure.getAt(0, function.this_lexeme)
 
-        return interpreter.KSL[1][_TokenType.NIN.value] # "nin"
+            return interpreter.KSL[1][_TokenType.NIN.value] # "nin"
 
     def __str__(self):
         if not self.isAnon or self.isMethod:
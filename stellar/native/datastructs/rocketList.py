@@ -5,8 +5,11 @@ from utils.tokens import TokenType as _TokenType
 
 from utils.misc   import isValNeg as _isValNeg
 
+import utils.tags as _tags
+
 from native.datastructs.rocketClass import RocketCallable as _RocketCallable
 from native.datastructs.rocketClass import RocketInstance as _RocketInstance
+from native.datastructs.rocketClass import NativeMethods  as _NativeMethods
 
 from native.datatypes import rocketBoolean as _boolean
 from native.datatypes import rocketNumber  as _number
@@ -33,403 +36,211 @@ class List(_RocketCallable):
 
 
 class RocketList(_RocketInstance):
+    __slots__ = ('elements', 'nin_lexeme')
+
+    nativeMethods = _NativeMethods('List')
+    nature = 'datatype'
+    kind = "<native type 'List'>"
+    tag = _tags.LIST
+
     def __init__(self, elms, nin_lexeme):
         self.elements = elms
-        self.nature = 'datatype'
-        self.kind = "<native type 'List'>"
         self.nin_lexeme = nin_lexeme
 
     def get(self, name: _Token):
-        # Note: 'edna' is what we use to manipulate arity for 'slice' function from '1' to '2'
-        if name.lexeme == 'get':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                index = args[0].value
-
-                if index >= len(self.elements):
-                    raise _RuntimeError('List', "IndexError: list index out of range")
-
-                return self.elements[index]
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'get' of list>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'insert':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 2
-
-            def call(interpreter, args):
-                # This fn expects input like the standard Python 'insert' list method
-                # 'insert(index, item)'
-                # It requires two args exactly
-                # where if 'index' is -1 it translates to secone to the last not the last
-                # to add an item at the end we need to pass the length of the list as the index
-                # i.e. [list].insert([list].length(), [item]) 
-                self.elements.insert(args[0].value, args[1])
-
-                return List().call(self, self.elements)
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'List'
-            rocketCallable.toString = "<native method 'insert' of List>"
-            rocketCallable.insert = True
-
-            return rocketCallable
-
-        if name.lexeme == 'slice':
-            rocketCallable = _RocketCallable(self)
-
-            def arity(inc=False):
-                if inc:
-                    return 2
-
-                return 1
-
-            def call(interpreter, args, inc=False):
-                if inc:
-                    if args[0].value >= len(self.elements) or args[1].value >= len(self.elements):
-                        raise _RuntimeError('List', "IndexError: list index out of range")
-
-                    # Special case
-                    if (args[0].value >= args[1].value):
-                        return List().call(self, [])
-
-                    else:
-                        return List().call(self, self.elements[args[0].value:args[1].value])
-
-                return List().call(self, self.elements[args[0].value:])
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'List'
-            rocketCallable.toString = "<native method 'slice' of List>"
-            rocketCallable.slice = True
-            rocketCallable.inc = False
-
-            return rocketCallable
-
-        if name.lexeme == 'splice':
-            rocketCallable = _RocketCallable(self)
-
-            def arity(inc=False):
-                if inc:
-                    return 2
-
-                return 1
-
-            def call(interpreter, args, inc=False):
-                # If initial index is beyond the limit then nothing is returned
-                if args[0].value >= len(self.elements):
-                    return List().call(self, [])
-
-                removed_list = []
-                is_negative_index = False
-
-                if inc:
-                    # Please note, if the item count is zero then nothing is returned
-                    if args[1].value == 0:
-                        return List().call(self, [])
-
-                    # Negative steps return nothing irrespective of the index
-                    # ... so we need to perform a negativivty test on the input
-                    if _isValNeg(args[1].value):
-                        return List().call(self, [])
-
-                    # Handle Positive and negative index
-                    # count is always positive
-                    # Run positivity test for index to determine behaviour (adapted from test above)
-                    if not _isValNeg(args[0].value):
-                        removed_list = self.elements[args[0].value:args[0].value + args[1].value:]
-
-                    else:
-                        # I.e. when index is negative
-                        idx = args[0].value
-                        # step is the index of the starting elm to the next subseq. 'n' (args[1]) elms
-                        step = (len(self.elements) + args[0].value) + args[1].value
-
-                        removed_list = self.elements[idx:step:]
-                        is_negative_index = True
-
-                else:
-                    # if only index provided then the entire list from the index to end is returned
-                    removed_list = List().call(self, self.elements[args[0].value:])
-
-                # Remove list items
-                # Remember the slices are contiguously stored so we can safely use indexing
-                # ... by cutting out the first chunk and last chunk then attaching them (surgically)
-                head = self.elements[0:len(self.elements) + args[0].value] if is_negative_index else self.elements[0:args[0].value]
-                tail = self.elements[len(self.elements) + args[0].value + args[1].value:] if is_negative_index else self.elements[args[0].value + args[1].value:]
-
-                self.elements = head + tail
-
-                # return removed list slice
-                return List().call(self, removed_list)
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'List'
-            rocketCallable.toString = "<native method 'splice' of List>"
-            rocketCallable.splice = True
-            rocketCallable.inc = False
-
-            return rocketCallable
-
-        if (name.lexeme == 'append') or (name.lexeme == 'push'):
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                # Internally add new elm
-                self.elements.append(args[0])
-
-                # we return the appended list
-                return self
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'append' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+        return self.nativeMethods.bind(self, name)
+
+    @nativeMethods.method('get', 1, toString="<native method 'get' of list>")
+    def _get(self, interpreter, args):
+        index = args[0].value
+
+        if index >= len(self.elements):
+            raise _RuntimeError('List', "IndexError: list index out of range")
+
+        return self.elements[index]
+
+    @nativeMethods.method('insert', 2)
+    def _insert(self, interpreter, args):
+        # This fn expects input like the standard Python 'insert' list method
+        # 'insert(index, item)'
+        # It requires two args exactly
+        # where if 'index' is -1 it translates to secone to the last not the last
+        # to add an item at the end we need to pass the length of the list as the index
+        # i.e. [list].insert([list].length(), [item]) 
+        self.elements.insert(args[0].value, args[1])
+
+        return List().call(self, self.elements)
+
+    @nativeMethods.method('slice', 1, variadic='slice')
+    def _slice(self, interpreter, args, inc=False):
+        if inc:
+            if args[0].value >= len(self.elements) or args[1].value >= len(self.elements):
+                raise _RuntimeError('List', "IndexError: list index out of range")
+
+            # Special case
+            if (args[0].value >= args[1].value):
+                return List().call(self, [])
+
+            else:
+                return List().call(self, self.elements[args[0].value:args[1].value])
+
+        return List().call(self, self.elements[args[0].value:])
+
+    @nativeMethods.method('splice', 1, variadic='splice')
+    def _splice(self, interpreter, args, inc=False):
+        # If initial index is beyond the limit then nothing is returned
+        if args[0].value >= len(self.elements):
+            return List().call(self, [])
+
+        removed_list = []
+        is_negative_index = False
+
+        if inc:
+            # Please note, if the item count is zero then nothing is returned
+            if args[1].value == 0:
+                return List().call(self, [])
+
+            # Negative steps return nothing irrespective of the index
+            # ... so we need to perform a negativivty test on the input
+            if _isValNeg(args[1].value):
+                return List().call(self, [])
+
+            # Handle Positive and negative index
+            # count is always positive
+            # Run positivity test for index to determine behaviour (adapted from test above)
+            if not _isValNeg(args[0].value):
+                removed_list = self.elements[args[0].value:args[0].value + args[1].value:]
+
+            else:
+                # I.e. when index is negative
+                idx = args[0].value
+                # step is the index of the starting elm to the next subseq. 'n' (args[1]) elms
+                step = (len(self.elements) + args[0].value) + args[1].value
+
+                removed_list = self.elements[idx:step:]
+                is_negative_index = True
 
-        if name.lexeme == 'clear':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                self.elements = []
-
-                # return the newly cleared list
-                return self
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'clear' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'length':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return len(self.elements)
-                else:
-                    return 0
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'length' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'pop':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    last = self.elements[-1]
-                    self.elements.remove(last)
-                    return last
-                else:
-                    raise _RuntimeError('List', "IndexError: cannot pop empty list")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'pop' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'remove':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    removed_index = -1
-
-                    for i in range(len(self.elements) - 1):
-                        if args[0].value == self.elements[i].value:
-                            self.elements.remove(self.elements[i])
-                            removed_index = i
-
-                    if removed_index == -1:
-                        raise _RuntimeError('List', "IndexError: Item not in list")
-                
-                    else:
-                        return _number.Int().call(self, [removed_index])
-
-                else:
-                    raise _RuntimeError('List', "IndexError: cannot remove items from an empty list")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'remove' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'sort':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    self.elements.sort()
-                    return None
-                else:
-                    return None
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'sort' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'reverse':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    # internally change and return mutation
-                    self.elements.reverse()
-                    return self
-
-                else:
-                    return List().call(self, [])
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'reverse' of List>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'concat':
-            rocketCallable = _RocketCallable(self)
+        else:
+            # if only index provided then the entire list from the index to end is returned
+            removed_list = List().call(self, self.elements[args[0].value:])
 
-            def arity():
-                return 1
+        # Remove list items
+        # Remember the slices are contiguously stored so we can safely use indexing
+        # ... by cutting out the first chunk and last chunk then attaching them (surgically)
+        head = self.elements[0:len(self.elements) + args[0].value] if is_negative_index else self.elements[0:args[0].value]
+        tail = self.elements[len(self.elements) + args[0].value + args[1].value:] if is_negative_index else self.elements[args[0].value + args[1].value:]
 
-            def call(interpreter, args):
-                if isinstance(args[0], RocketList):
-                    # we return the mutation
-                    return List().call(self, self.elements + args[0].elements)
+        self.elements = head + tail
 
-                else:
-                    raise _RuntimeError('List', "IndexError: can only concatenate 'List' native type with another 'List'.")
+        # return removed list slice
+        return List().call(self, removed_list)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'concat' of List>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('append', 1, aliases=('push',))
+    def _append(self, interpreter, args):
+        # Internally add new elm
+        self.elements.append(args[0])
 
-            return rocketCallable
+        # we return the appended list
+        return self
 
-        if name.lexeme == 'indexOf':
-            rocketCallable = _RocketCallable(self)
+    @nativeMethods.method('clear', 0)
+    def _clear(self, interpreter, args):
+        self.elements = []
 
-            def arity():
-                return 1
+        # return the newly cleared list
+        return self
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for i in range(len(self.elements)):
-                        if args[0].value == self.elements[i].value:
-                            return _number.Int().call(self, [i])
+    @nativeMethods.method('length', 0)
+    def _length(self, interpreter, args):
+        if self.notEmpty():
+            return len(self.elements)
+        else:
+            return 0
 
-                    raise _RuntimeError('List', "IndexError: Item not in list")
+    @nativeMethods.method('pop', 0)
+    def _pop(self, interpreter, args):
+        if self.notEmpty():
+            # By position, equal elms can be the same (interned) object
+            return self.elements.pop()
+        else:
+            raise _RuntimeError('List', "IndexError: cannot pop empty list")
 
-                else:
-                    raise _RuntimeError('List', "IndexError: cannot index from an empty list")
+    @nativeMethods.method('remove', 1)
+    def _remove(self, interpreter, args):
+        if self.notEmpty():
+            removed_index = -1
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'indexOf' of List>"
-            rocketCallable.nature = 'native'
+            for i in range(len(self.elements) - 1):
+                if args[0].value == self.elements[i].value:
+                    self.elements.remove(self.elements[i])
+                    removed_index = i
 
-            return rocketCallable
+            if removed_index == -1:
+                raise _RuntimeError('List', "IndexError: Item not in list")
+        
+            else:
+                return _number.Int().call(self, [removed_index])
 
-        if name.lexeme == 'includes':
-            rocketCallable = _RocketCallable(self)
+        else:
+            raise _RuntimeError('List', "IndexError: cannot remove items from an empty list")
 
-            def arity():
-                return 1
+    @nativeMethods.method('sort', 0)
+    def _sort(self, interpreter, args):
+        if self.notEmpty():
+            self.elements.sort()
+            return None
+        else:
+            return None
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for i in range(len(self.elements)):
-                        if args[0].value == self.elements[i].value:
-                            return _boolean.Bool().call(self, [True])
-                    
-                    return _boolean.Bool().call(self, [False])
+    @nativeMethods.method('reverse', 0)
+    def _reverse(self, interpreter, args):
+        if self.notEmpty():
+            # internally change and return mutation
+            self.elements.reverse()
+            return self
 
-                else:
-                    raise _RuntimeError('List', "IndexError: cannot index from an empty list")
+        else:
+            return List().call(self, [])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'includes' of List>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('concat', 1)
+    def _concat(self, interpreter, args):
+        if isinstance(args[0], RocketList):
+            # we return the mutation
+            return List().call(self, self.elements + args[0].elements)
 
-            return rocketCallable
+        else:
+            raise _RuntimeError('List', "IndexError: can only concatenate 'List' native type with another 'List'.")
 
-        if name.lexeme == 'forEach':
-            rocketCallable = _RocketCallable(self)
+    @nativeMethods.method('indexOf', 1)
+    def _indexOf(self, interpreter, args):
+        if self.notEmpty():
+            for i in range(len(self.elements)):
+                if args[0].value == self.elements[i].value:
+                    return _number.Int().call(self, [i])
 
-            def arity():
-                return 1
+            raise _RuntimeError('List', "IndexError: Item not in list")
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    for item in self.elements: args[0].call(interpreter, [item])
-                else:
-                    raise _RuntimeError('List', "IndexError: cannot run function on an empty list")
+        else:
+            raise _RuntimeError('List', "IndexError: cannot index from an empty list")
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'forEach' of List>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('includes', 1)
+    def _includes(self, interpreter, args):
+        if self.notEmpty():
+            for i in range(len(self.elements)):
+                if args[0].value == self.elements[i].value:
+                    return _boolean.Bool().call(self, [True])
+            
+            return _boolean.Bool().call(self, [False])
 
-            return rocketCallable
+        else:
+            raise _RuntimeError('List', "IndexError: cannot index from an empty list")
 
+    @nativeMethods.method('forEach', 1)
+    def _forEach(self, interpreter, args):
+        if self.notEmpty():
+            for item in self.elements: args[0].call(interpreter, [item])
         else:
-            raise _RuntimeError(name, f"'List' has no method '{name.lexeme}'.")
+            raise _RuntimeError('List', "IndexError: cannot run function on an empty list")
 
 
     def set(self, name, value):
@@ -443,16 +254,18 @@ class RocketList(_RocketInstance):
         return True
 
     def stringify(self, elm, uncoloured=False):
-        if (_isType(elm, RocketArray) or _isType(elm, _list.RocketList)):
+        tag = _tags.tagOf(elm)
+
+        if (tag == _tags.ARRAY) or (tag == _tags.LIST):
             return elm.__str__()
 
-        if (_isType(elm, _number.RocketInt) or _isType(elm, _number.RocketFloat)):
+        if (tag == _tags.INT) or (tag == _tags.FLOAT):
             return f'\033[36m{elm}\033[0m' if not uncoloured else str(elm.value)
 
-        if _isType(elm, _string.RocketString):
+        if tag == _tags.STRING:
             return f'\033[32m{elm}\033[0m' if not uncoloured else elm.value
 
-        if _isType(elm, _boolean.Bool):
+        if tag == _tags.BOOL:
             return f'\033[1m{elm}\033[0m' if not uncoloured else str(elm.value)
 
         if type(elm) == type(None):
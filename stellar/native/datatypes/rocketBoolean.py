@@ -3,6 +3,8 @@ from native.datastructs.rocketClass import RocketInstance as _RocketInstance
 
 from utils.reporter    import runtimeError   as _RuntimeError
 
+import utils.tags as _tags
+
 
 class Bool(_RocketCallable):
     def __init__(self):
@@ -18,7 +20,7 @@ class Bool(_RocketCallable):
         # 'None' aka 'nin' is false
         # All values (including empty objects) in Rocket are true except 'false' or 'nin'
         if (type(val) == type(None)) or (val == False):
-            return RocketBool(False)
+            return FALSE
 
         if (hasattr(val, 'value')):
             # in case a RocketBool was passed
@@ -30,7 +32,7 @@ class Bool(_RocketCallable):
             if ((val.value == False) or (val.value == True)) and not ((val.value == 0) or (val.value == 1)):
                 return RocketBool(val.value)
 
-        return RocketBool(True)
+        return TRUE
 
     def __repr__(self):
         return self.__str__()
@@ -40,10 +42,14 @@ class Bool(_RocketCallable):
 
 
 class RocketBool(_RocketInstance):
+    __slots__ = ('value',)
+
+    nature = 'datatype'
+    kind = "<native type 'Bool'>"
+    tag = _tags.BOOL
+
     def __init__(self, value):
         self.value = value
-        self.nature = 'datatype'
-        self.kind = "<native type 'Bool'>"
 
     def get(self, name):
         raise _RuntimeError(name, f"'Bool' has no method '{name.lexeme}'.")
@@ -58,4 +64,9 @@ class RocketBool(_RocketInstance):
         return f'\033[1m{str(self.value).lower()}\033[0m'
 
     def __str__(self):
-        return self.__repr__()
\ No newline at end of file
+        return self.__repr__()
+
+
+# Bools are immutable, so one 'true' and one 'false' is all we need
+TRUE = RocketBool(True)
+FALSE = RocketBool(False)
\ No newline at end of file
@@ -1,7 +1,10 @@
 from utils.reporter    import runtimeError   as _RuntimeError
 
+import utils.tags as _tags
+
 from native.datastructs.rocketClass import RocketCallable as _RocketCallable
 from native.datastructs.rocketClass import RocketInstance as _RocketInstance
+from native.datastructs.rocketClass import NativeMethods  as _NativeMethods
 
 from native.datatypes  import rocketString   as _string
 
@@ -23,7 +26,7 @@ class Int(_RocketCallable):
             if (hasattr(args[0], 'value')):
                 value = args[0].value
 
-            return RocketInt(int(float(value)) if _isType(args[0], _string.RocketString) else int(value))
+            return makeInt(int(float(value)) if _isType(args[0], _string.RocketString) else int(value))
 
         raise _RuntimeError(obj, f"Type Mismatch: Cannot convert {args[0].kind} to Int.")
 
@@ -35,10 +38,14 @@ class Int(_RocketCallable):
 
 
 class RocketInt(_RocketInstance):
+    __slots__ = ('value',)
+
+    nature = 'datatype'
+    kind = "<native type 'Int'>"
+    tag = _tags.INT
+
     def __init__(self, value):
         self.value = value.__trunc__()
-        self.nature = 'datatype'
-        self.kind = "<native type 'Int'>"
 
     def get(self, name):
         raise _RuntimeError(name, f"'Int' has no method '{name.lexeme}'.")
@@ -84,34 +91,26 @@ class Float(_RocketCallable):
 
 
 class RocketFloat(_RocketInstance):
+    __slots__ = ('value',)
+
+    nativeMethods = _NativeMethods('Float')
+    nature = 'datatype'
+    kind = "<native type 'Float'>"
+    tag = _tags.FLOAT
+
     def __init__(self, value):
         self.value = value
-        self.nature = 'datatype'
-        self.kind = "<native type 'Float'>"
 
     def get(self, name):
-        if name.lexeme == 'toFixed':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                if (args[0].value > 0):
-                    return _string.String().call(self, [str(self.value)[0:args[0].value + 2]])
-
-                else:
-                    return _string.String().call(self, [str(int(self.value))])
+        return self.nativeMethods.bind(self, name)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'toFixed' of Float>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+    @nativeMethods.method('toFixed', 1)
+    def _toFixed(self, interpreter, args):
+        if (args[0].value > 0):
+            return _string.String().call(self, [str(self.value)[0:args[0].value + 2]])
 
         else:
-            raise _RuntimeError(name, f"'Float' has no method '{name.lexeme}'.")
+            return _string.String().call(self, [str(int(self.value))])
 
     def set(self, name, value):
         raise _RuntimeError(name, "Cannot mutate an Float's props")
@@ -126,11 +125,24 @@ class RocketFloat(_RocketInstance):
         return self.__repr__()
 
 
+# Ints are immutable, so the small ones (loop counters, indices, ...) are shared instead of rebuilt each time
+SMALL_INTS = { i: RocketInt(i) for i in range(-5, 257) }
+
+
+def makeInt(value: int):
+    shared = SMALL_INTS.get(value)
+
+    return shared if shared is not None else RocketInt(value)
+
+
 def isNumber(n):
-    if hasattr(n, 'value'):
-        if (_isType(n, _string.RocketString)):
-            return not (n.value.isalnum() and n.value.isalpha())
+    tag = _tags.tagOf(n)
+
+    if tag == _tags.STRING:
+        return not (n.value.isalnum() and n.value.isalpha())
 
-        return _isType(n, RocketInt) or _isType(n, RocketFloat)
+    # Any other Rocket value
+    if tag != _tags.NONE:
+        return _tags.isNumberTag(tag)
 
     return _isType(n, int) or _isType(n, float)
\ No newline at end of file
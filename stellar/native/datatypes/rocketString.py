@@ -3,8 +3,11 @@ from utils.tokens import TokenType as _TokenType
 
 from   utils.reporter    import runtimeError   as _RuntimeError
 
+import utils.tags as _tags
+
 from   native.datastructs.rocketClass import RocketCallable as _RocketCallable
 from   native.datastructs.rocketClass import RocketInstance as _RocketInstance
+from   native.datastructs.rocketClass import NativeMethods  as _NativeMethods
 
 import native.datastructs.rocketList   as _list
 
@@ -26,10 +29,10 @@ class String(_RocketCallable):
         # but that is for the Rocket datatypes
         if (hasattr(args[0], 'nature')):
             if (args[0].nature == 'datatype'):
-                    return RocketString(str(args[0].value))
+                    return makeString(str(args[0].value))
 
         # however, for classes, fns, etc. '___str__' is enough
-        return RocketString(args[0].__str__())
+        return makeString(args[0].__str__())
 
     def __repr__(self):
         return self.__str__()
@@ -39,401 +42,194 @@ class String(_RocketCallable):
 
 
 class RocketString(_RocketInstance):
+    __slots__ = ('value',)
+
+    nativeMethods = _NativeMethods('String')
+    nature = 'datatype'
+    kind = "<native type 'String'>"
+    tag = _tags.STRING
+
     def __init__(self, value):
         self.value = value
-        self.nature = 'datatype'
-        self.kind = "<native type 'String'>"
 
     def get(self, name):
-        # Note: 'edna' is what we use to manipulate arity for 'slice' function from '1' to '2'
-        if name.lexeme == 'get':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                index = args[0].value
-
-                if index >= len(self.value):
-                    raise _RuntimeError('String', "IndexError: string index out of range")
-
-                return String().call(self, [self.value[index]])
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'get' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'slice':
-            rocketCallable = _RocketCallable(self)
-
-            def arity(inc=False):
-                if inc:
-                    return 2
-
-                return 1
-
-            def call(interpreter, args, inc=False):
-                if inc:
-                    if (args[0].value >= len(self.value)) or (args[1].value >= len(self.value)):
-                        raise _RuntimeError('String', "IndexError: string index out of range")
-
-                    # Special case
-                    if (args[0].value >= args[1].value):
-                        String().call(self, [''])
-
-                    else:
-                        return String().call(self, [self.value[args[0].value:args[1].value]])
-
-                return self.value[args[0].value:]
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.nature = 'native'
-            rocketCallable.signature = 'String'
-            rocketCallable.toString = "<native method 'slice' of String>"
-            rocketCallable.slice = True
-            rocketCallable.inc = False
-
-            return rocketCallable
-
-        if name.lexeme == 'length':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return _number.Int().call(self, [len(self.value)])
-                else:
-                    return 0
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'length' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'reverse':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return String().call(self, [self.value[::-1]])
-
-                else:
-                    return String().call(self, [self.value['']])
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'reverse' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'capitalize':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    if len(self.value) >= 2:
-                        return String().call(self, [self.value[0].upper() + self.value[1:]])
-
-                    else:
-                        return String().call(self, [self.value])
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'capitalize' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'upper':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return String().call(self, [self.value.upper()])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'upper' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'lower':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return String().call(self, [self.value.lower()])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+        return self.nativeMethods.bind(self, name)
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'lower' of String>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('get', 1)
+    def _get(self, interpreter, args):
+        index = args[0].value
 
-            return rocketCallable
+        if index >= len(self.value):
+            raise _RuntimeError('String', "IndexError: string index out of range")
 
-        if name.lexeme == 'isupper':
-            rocketCallable = _RocketCallable(self)
+        return String().call(self, [self.value[index]])
 
-            def arity():
-                return 0
+    @nativeMethods.method('slice', 1, variadic='slice')
+    def _slice(self, interpreter, args, inc=False):
+        if inc:
+            if (args[0].value >= len(self.value)) or (args[1].value >= len(self.value)):
+                raise _RuntimeError('String', "IndexError: string index out of range")
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return _boolean.Bool().call(self, [self.value.isupper()])
+            # Special case
+            if (args[0].value >= args[1].value):
+                String().call(self, [''])
 
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+            else:
+                return String().call(self, [self.value[args[0].value:args[1].value]])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'isupper' of String>"
-            rocketCallable.nature = 'native'
+        return self.value[args[0].value:]
 
-            return rocketCallable
-
-        if name.lexeme == 'islower':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return _boolean.Bool().call(self, [self.value.islower()])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'islower' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'isalpha':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return _boolean.Bool().call(self, [self.value.isalpha()])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'isalpha' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'isnum':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 0
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return _boolean.Bool().call(self, [self.value.isdecimal()])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'isnum' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'center':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
-
-            def call(interpreter, args):
-                if self.notEmpty():
-                    return String().call(self, [self.value.center(args[0].value)])
-
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'center' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
-
-        if name.lexeme == 'concat':
-            rocketCallable = _RocketCallable(self)
-
-            def arity():
-                return 1
+    @nativeMethods.method('length', 0)
+    def _length(self, interpreter, args):
+        if self.notEmpty():
+            return _number.Int().call(self, [len(self.value)])
+        else:
+            return 0
 
-            def call(interpreter, args):
-                if isinstance(args[0], RocketString):
-                    # We do not internally edit it, instead its returned
-                    # self.value = self.value + new_list.elements
-                    text = args[0].value
+    @nativeMethods.method('reverse', 0)
+    def _reverse(self, interpreter, args):
+        if self.notEmpty():
+            return String().call(self, [self.value[::-1]])
 
-                    return String().call(self, [self.value + text])
+        else:
+            return String().call(self, [self.value['']])
 
-                else:
-                    raise _RuntimeError('String', "IndexError: can only concatenate 'String' native type with another 'String'.")
+    @nativeMethods.method('capitalize', 0)
+    def _capitalize(self, interpreter, args):
+        if self.notEmpty():
+            if len(self.value) >= 2:
+                return String().call(self, [self.value[0].upper() + self.value[1:]])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'concat' of String>"
-            rocketCallable.nature = 'native'
+            else:
+                return String().call(self, [self.value])
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            return rocketCallable
+    @nativeMethods.method('upper', 0)
+    def _upper(self, interpreter, args):
+        if self.notEmpty():
+            return String().call(self, [self.value.upper()])
 
-        if name.lexeme == 'indexOf':
-            rocketCallable = _RocketCallable(self)
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            def arity():
-                return 1
+    @nativeMethods.method('lower', 0)
+    def _lower(self, interpreter, args):
+        if self.notEmpty():
+            return String().call(self, [self.value.lower()])
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    if args[0].value in self.value:
-                        return String().call(self, [self.value.index(args[0].value)])
-                        
-                    else:
-                        raise _RuntimeError('String', "IndexError: Item not in string")
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'indexOf' of String>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('isupper', 0)
+    def _isupper(self, interpreter, args):
+        if self.notEmpty():
+            return _boolean.Bool().call(self, [self.value.isupper()])
 
-            return rocketCallable
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-        if name.lexeme == 'includes':
-            rocketCallable = _RocketCallable(self)
+    @nativeMethods.method('islower', 0)
+    def _islower(self, interpreter, args):
+        if self.notEmpty():
+            return _boolean.Bool().call(self, [self.value.islower()])
 
-            def arity():
-                return 1
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    if args[0].value in self.value:
-                        return _boolean.Bool().call(self, [True])
-                    else:
-                        return _boolean.Bool().call(self, [False])
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+    @nativeMethods.method('isalpha', 0)
+    def _isalpha(self, interpreter, args):
+        if self.notEmpty():
+            return _boolean.Bool().call(self, [self.value.isalpha()])
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'includes' of String>"
-            rocketCallable.nature = 'native'
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            return rocketCallable
+    @nativeMethods.method('isnum', 0)
+    def _isnum(self, interpreter, args):
+        if self.notEmpty():
+            return _boolean.Bool().call(self, [self.value.isdecimal()])
 
-        if name.lexeme == 'endsWith':
-            rocketCallable = _RocketCallable(self)
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            def arity():
-                return 1
+    @nativeMethods.method('center', 1)
+    def _center(self, interpreter, args):
+        if self.notEmpty():
+            return String().call(self, [self.value.center(args[0].value)])
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    endlen = len(args[0].value)
-                    index = -(endlen)
-                    if args[0] == self.value[index:]:
-                        return _boolean.Bool().call(self, [True])
-                    else:
-                        return _boolean.Bool().call(self, [False])
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'endsWith' of String>"
-            rocketCallable.nature = 'native'
+    @nativeMethods.method('concat', 1)
+    def _concat(self, interpreter, args):
+        if isinstance(args[0], RocketString):
+            # We do not internally edit it, instead its returned
+            # self.value = self.value + new_list.elements
+            text = args[0].value
 
-            return rocketCallable
+            return String().call(self, [self.value + text])
 
-        if name.lexeme == 'split':
-            rocketCallable = _RocketCallable(self)
+        else:
+            raise _RuntimeError('String', "IndexError: can only concatenate 'String' native type with another 'String'.")
+
+    @nativeMethods.method('indexOf', 1)
+    def _indexOf(self, interpreter, args):
+        if self.notEmpty():
+            if args[0].value in self.value:
+                return String().call(self, [self.value.index(args[0].value)])
+                
+            else:
+                raise _RuntimeError('String', "IndexError: Item not in string")
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+
+    @nativeMethods.method('includes', 1)
+    def _includes(self, interpreter, args):
+        if self.notEmpty():
+            if args[0].value in self.value:
+                return _boolean.Bool().call(self, [True])
+            else:
+                return _boolean.Bool().call(self, [False])
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
+
+    @nativeMethods.method('endsWith', 1)
+    def _endsWith(self, interpreter, args):
+        if self.notEmpty():
+            endlen = len(args[0].value)
+            index = -(endlen)
+            if args[0] == self.value[index:]:
+                return _boolean.Bool().call(self, [True])
+            else:
+                return _boolean.Bool().call(self, [False])
+        else:
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
-            def arity():
-                return 1
+    @nativeMethods.method('split', 1)
+    def _split(self, interpreter, args):
+        if self.notEmpty():
+            if args[0].value in self.value:
+                # split it Python style
+                splitted_list = self.value.split(args[0].value)
 
-            def call(interpreter, args):
-                if self.notEmpty():
-                    if args[0].value in self.value:
-                        # split it Python style
-                        splitted_list = self.value.split(args[0].value)
+                # Create a Rocket List
+                arr = _list.List().call(self, [])
 
-                        # Create a Rocket List
-                        arr = _list.List().call(self, [])
+                # Create fake token for getter
+                append_tok = _Token(_TokenType.STRING, 'append', 'append', 0)
 
-                        # Create fake token for getter
-                        append_tok = _Token(_TokenType.STRING, 'append', 'append', 0)
+                # Add chunks to Rocket List
+                for i in range(len(splitted_list)):
+                    arr.get(append_tok).call(self, [splitted_list[i]])
 
-                        # Add chunks to Rocket List
-                        for i in range(len(splitted_list)):
-                            arr.get(append_tok).call(self, [splitted_list[i]])
-
-                        # return new rocket List with chunks
-                        return arr
-
-                    else:
-                        return _list.List().call(self, [self.value])
-                else:
-                    raise _RuntimeError('String', "IndexError: cannot index from an empty string")
-
-            rocketCallable.arity = arity
-            rocketCallable.call = call
-            rocketCallable.toString = "<native method 'split' of String>"
-            rocketCallable.nature = 'native'
-
-            return rocketCallable
+                # return new rocket List with chunks
+                return arr
 
+            else:
+                return _list.List().call(self, [self.value])
         else:
-            raise _RuntimeError(name, f"'String' has no method '{name.lexeme}'.")
+            raise _RuntimeError('String', "IndexError: cannot index from an empty string")
 
 
     def set(self, name, value):
@@ -454,3 +250,13 @@ class RocketString(_RocketInstance):
 
     def __str__(self):
         return self.__repr__()
+
+
+# Strings are immutable, so the common tiny ones ('' and single chars, i.e from indexing and splitting) are shared
+COMMON_STRINGS = { char: RocketString(char) for char in [''] + [chr(i) for i in range(128)] }
+
+
+def makeString(value: str):
+    shared = COMMON_STRINGS.get(value)
+
+    return shared if shared is not None else RocketString(value)
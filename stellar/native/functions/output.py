@@ -2,6 +2,8 @@ import codecs as _codecs
 
 from native.datastructs.rocketClass import RocketCallable as _RocketCallable
 
+import utils.tags as _tags
+
 
 class Print(_RocketCallable):
     def __init__(self):
@@ -48,8 +50,7 @@ def should_space(item, idx, lim):
 
 
 def stringify(item):
-    if (hasattr(item, 'nature')):
-        if (item.nature == 'datatype'):
-            return item.raw_string()
+    if _tags.isDatatypeTag(_tags.tagOf(item)):
+        return item.raw_string()
 
     return item.__str__()
\ No newline at end of file
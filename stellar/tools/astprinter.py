@@ -1,43 +1,168 @@
-from utils.expr import Expr     as _Expr
-from utils.expr import Visitor  as __Visitor
-from utils.expr import Binary   as _Binary
-from utils.expr import Grouping as _Literal
-from utils.expr import Unary    as _Unary
+from utils.expr import Expr         as _Expr
+from utils.expr import ExprVisitor  as _ExprVisitor
+from utils.expr import Binary       as _Binary
+from utils.expr import Grouping     as _Grouping
+from utils.expr import Literal      as _Literal
+from utils.expr import Unary        as _Unary
 
+from utils.stmt import Stmt         as _Stmt
+from utils.stmt import StmtVisitor  as _StmtVisitor
 
-class LispAstPrinter(__Visitor):
-    def printAst(self, expr: _Expr):
-        return expr.accept(self)
+
+class LispAstPrinter(_ExprVisitor, _StmtVisitor):
+    # Dumps programs as s-exprs, one top-level stmt per line. I.e 'print 1 + 2;' -> '(print (+ 1 2))'
+    # Used by 'main.py --dump-ast' (add '-O' to see what the optimizer did)
+    def printAst(self, node):
+        return self.show(node)
+
+    def printStmts(self, stmts: list):
+        return '\n'.join(self.show(stmt) for stmt in stmts)
+
+    def show(self, node):
+        if node == None:
+            return "nin"
+
+        # Multi-variable declerations
+        if type(node) == list:
+            return '[' + ' '.join(self.show(item) for item in node) + ']'
+
+        if isinstance(node, (_Expr, _Stmt)):
+            return node.accept(self)
+
+        # Tokens
+        if hasattr(node, 'lexeme'):
+            return node.lexeme
+
+        return str(node)
+
+    def visitAssignExpr(self, expr):
+        return self.parenthesize("=", expr.name, expr.value)
+
+    def visitCompoundAssignExpr(self, expr):
+        return self.parenthesize(expr.operator.lexeme + "=", expr.name, expr.value)
+
+    def visitPostfixExpr(self, expr):
+        # I.e 'i++' -> '(++ i)'
+        return self.parenthesize(expr.operator.lexeme * 2, expr.name)
 
     def visitBinaryExpr(self, expr: _Binary):
         return self.parenthesize(expr.operator.lexeme, expr.left, expr.right)
 
+    def visitCallExpr(self, expr):
+        return self.parenthesize("call", expr.callee, *expr.args)
+
+    def visitIndexExpr(self, expr):
+        return self.parenthesize("index", expr.callee, *expr.args)
+
+    def visitConditionalExpr(self, expr):
+        return self.parenthesize("?:", expr.expr, expr.thenExpr, expr.elseExpr)
+
+    def visitGetExpr(self, expr):
+        return self.parenthesize(".", expr.object, expr.name)
+
+    def visitSetExpr(self, expr):
+        return self.parenthesize(".=", expr.object, expr.name, expr.value)
+
+    def visitSuperExpr(self, expr):
+        return self.parenthesize("super", expr.method)
+
+    def visitThisExpr(self, expr):
+        return "this"
+
+    def visitFunctionExpr(self, expr):
+        return self.parenthesize("fn", expr.params, *expr.body)
+
     def visitGroupingExpr(self, expr: _Grouping):
         return self.parenthesize("group", expr.expression)
 
+    def visitLogicalExpr(self, expr):
+        return self.parenthesize(expr.operator.lexeme, expr.left, expr.right)
+
     def visitLiteralExpr(self, expr: _Literal):
         if (expr.value == None):
             return "nin"
 
-        # variables that not instatiated with a value default to 'nin'
-        return str(expr.value)
+        # Literals pre-boxed by the optimizer are runtime values
+        value = expr.value.value if hasattr(expr.value, 'value') else expr.value
+
+        if type(value) == str:
+            return f'"{value}"'
+
+        if type(value) == bool:
+            return str(value).lower()
+
+        return str(value)
 
     def visitUnaryExpr(self, expr: _Unary):
         return self.parenthesize(expr.operator.lexeme, expr.right)
 
-    def parenthesize(self, name, *exprs):
+    def visitVariableExpr(self, expr):
+        return expr.name.lexeme
+
+    def visitBlockStmt(self, stmt):
+        return self.parenthesize("block", *stmt.statements)
+
+    def visitExpressionStmt(self, stmt):
+        return self.parenthesize(";", stmt.expression)
+
+    def visitPrintStmt(self, stmt):
+        return self.parenthesize("print", stmt.expression)
+
+    def visitClassStmt(self, stmt):
+        if stmt.superclass != None:
+            return self.parenthesize("class", stmt.name, "<", stmt.superclass, *stmt.methods)
+
+        return self.parenthesize("class", stmt.name, *stmt.methods)
+
+    def visitFuncStmt(self, stmt):
+        return self.parenthesize("func", stmt.name, stmt.function.params, *stmt.function.body)
+
+    def visitVarStmt(self, stmt):
+        if stmt.initializer == None:
+            return self.parenthesize("var", stmt.name)
+
+        return self.parenthesize("var", stmt.name, "=", stmt.initializer)
+
+    def visitConstStmt(self, stmt):
+        return self.parenthesize("const", stmt.name, "=", stmt.initializer)
+
+    def visitIfStmt(self, stmt):
+        if stmt.elseBranch == None:
+            return self.parenthesize("if", stmt.condition, stmt.thenBranch)
+
+        return self.parenthesize("if-else", stmt.condition, stmt.thenBranch, stmt.elseBranch)
+
+    def visitWhileStmt(self, stmt):
+        return self.parenthesize("while", stmt.condition, stmt.body)
+
+    def visitImportStmt(self, stmt):
+        return self.parenthesize("import", *stmt.modules)
+
+    def visitBreakStmt(self, stmt):
+        return "(break)"
+
+    def visitReturnStmt(self, stmt):
+        if stmt.value == None:
+            return "(return)"
+
+        return self.parenthesize("return", stmt.value)
+
+    def visitDelStmt(self, stmt):
+        return self.parenthesize("del", *stmt.names)
+
+    def parenthesize(self, name, *parts):
         result = f"({name}"
 
-        for expr in exprs:
+        for part in parts:
             result += " "
-            result += expr.accept(self)
+            result += part if type(part) == str else self.show(part)
 
-            result += ")"
+        result += ")"
 
         return result
 
 
-class RPNAstPrinter(__Visitor):
+class RPNAstPrinter(_ExprVisitor):
     def printAst(self, expr: _Expr):
         return expr.accept(self)
 
@@ -51,6 +176,10 @@ class RPNAstPrinter(__Visitor):
         if (expr.value == None):
             return "nin"
 
+        # Literals pre-boxed by the optimizer are runtime values
+        if hasattr(expr.value, 'value'):
+            return str(expr.value.value)
+
         # variables that not instatiated with a value default to 'nin'
         return str(expr.value)
 
@@ -0,0 +1,175 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Engine Benchmark (C) 2018
+
+import io  as _io
+import os  as _os
+import sys as _sys
+import time as _time
+import contextlib as _contextlib
+
+# So it runs as 'python tools/enginebench.py' from the 'stellar' dir
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+
+from core.scanner     import Scanner             as _Scanner
+from core.parser      import Parser              as _Parser
+from core.interpreter import Interpreter         as _Interpreter
+from core.closures    import ClosureInterpreter  as _ClosureInterpreter
+from core.vm          import VM                  as _VM
+
+from utils.resolver  import Resolver   as _Resolver
+from utils.optimizer import Optimizer  as _Optimizer
+
+from tools.custom_syntax import Scanner   as _Dante
+from tools.custom_syntax import Parser    as _Virgil
+
+
+ENGINES = {
+    'tree': _Interpreter,
+    'closure': _ClosureInterpreter,
+    'vm': _VM,
+}
+
+# What the engines spend most of their time on, plain loops, calls and method dispatch
+WORKLOADS = {
+    'loop': """
+var i = 0;
+var total = 0;
+while (i < 200000) {
+    total = total + i * 2;
+    i = i + 1;
+}
+print total;
+""",
+    'fib': """
+func fib(n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+print fib(20);
+""",
+    'oop': """
+class Point {
+    init(x, y) {
+        this.x = x;
+        this.y = y;
+    }
+
+    add(other) {
+        return Point(this.x + other.x, this.y + other.y);
+    }
+
+    len2() {
+        return this.x * this.x + this.y * this.y;
+    }
+}
+
+var p = Point(0, 0);
+var step = Point(1, 2);
+var i = 0;
+var acc = 0;
+while (i < 20000) {
+    p = p.add(step);
+    acc = acc + p.len2() % 7;
+    i = i + 1;
+}
+print acc;
+""",
+}
+
+
+def usage():
+    print("enginebench [-n <runs>] [-O] [--engines=tree,closure,vm] [file.rckt ...]")
+    print("Times running the files (or the built-in loop/fib/oop workloads if none are given) on each engine")
+
+
+def execute(source, engine, KSL, optimize):
+    # Same steps as 'main.run', output is kept to compare the engines
+    interpreter = engine(KSL)
+    stmts = _Parser(_Scanner(source, KSL[0]).scan(), KSL[1]).parse()
+
+    if optimize:
+        stmts = _Optimizer(interpreter).optimize(stmts)
+
+    _Resolver(interpreter, KSL[1]).resolveStmts(stmts)
+
+    out = _io.StringIO()
+
+    with _contextlib.redirect_stdout(out):
+        interpreter.interpret(stmts)
+
+    return out.getvalue(), [str(error) for error in interpreter.errors]
+
+
+def best(fn, runs):
+    # Best of 'runs', the least noisy number
+    times = []
+
+    for _ in range(runs):
+        start = _time.perf_counter()
+        result = fn()
+        times.append(_time.perf_counter() - start)
+
+    return min(times), result
+
+
+def bench(name, source, KSL, engines, runs, optimize):
+    print(f"{name}{' (-O)' if optimize else ''}:")
+
+    first = None
+    baseline = None
+
+    for engine in engines:
+        elapsed, result = best(lambda: execute(source, ENGINES[engine], KSL, optimize), runs)
+
+        if first == None:
+            first, baseline = result, elapsed
+
+        note = '' if result == first else '  <- output differs'
+        print(f"    {engine:8} {elapsed * 1000:9.1f}ms  {baseline / elapsed:5.2f}x{note}")
+
+
+def main():
+    args = _sys.argv[1:]
+    runs = 3
+    optimize = False
+    engines = list(ENGINES)
+    files = []
+
+    while args:
+        arg = args.pop(0)
+
+        if arg == '-n':
+            if not args or not args[0].isdigit():
+                usage()
+                return
+
+            runs = int(args.pop(0))
+
+        elif arg == '-O':
+            optimize = True
+
+        elif arg.startswith('--engines='):
+            engines = arg.split('=', 1)[1].split(',')
+
+            if any(engine not in ENGINES for engine in engines):
+                usage()
+                return
+
+        else:
+            files.append(arg)
+
+    # The default KSL, i.e no custom keywords
+    KSL = _Virgil(_Dante('').scan()).parse()
+
+    if not files:
+        for name, source in WORKLOADS.items():
+            bench(name, source, KSL, engines, runs, optimize)
+
+    for filename in files:
+        with open(filename, 'r') as f:
+            bench(filename, f.read(), KSL, engines, runs, optimize)
+
+
+if __name__ == "__main__":
+    main()
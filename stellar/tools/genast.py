@@ -34,7 +34,7 @@ def getNames(fields):
     return names
 
 
-def defineAst(out, baseName, types):
+def defineAst(out, baseName, types, caches):
     filename = (baseName[0].lower() + baseName[1:])  + '.py'
     filename = _os.path.join(out, filename)
 
@@ -43,9 +43,11 @@ def defineAst(out, baseName, types):
 
     with open(filename, "w") as f:
         if baseName == "Stmt":
-            f.write("from expr import Expr as _Expr\n")
+            f.write("from utils.expr   import Expr  as _Expr\n")
+            f.write("from utils.tokens import Token as _Token\n\n\n")
 
-        f.write("from tokens import Token as _Token\n\n\n")
+        else:
+            f.write("from utils.tokens import Token as _Token\n\n\n")
 
         f.write(f"class {baseName}Visitor:")
 
@@ -56,7 +58,9 @@ def defineAst(out, baseName, types):
 
         f.write("\n\n")
 
+        # Nodes are '__slots__' only. Besides its fields, each node has room for whatever the engines cache on it (see 'caches')
         f.write(f"class {className}:")
+        f.write(f"\n\t__slots__ = {tuple(caches[baseName])}\n")
         f.write(f"\n\tdef accept(visitor: {baseName}Visitor):")
         f.write(f"\n\t\traise NotImplementedError\n")
         f.write("\n\tdef parent(self):")
@@ -71,6 +75,7 @@ def defineAst(out, baseName, types):
             field_names = getNames(fields) if fields else None
 
             f.write(f"class {className}({globalClass}):")
+            f.write(f"\n\t__slots__ = {tuple((field_names or []) + caches.get(className, []))}\n")
 
             if ((fields) and (field_names)):
                 f.write(f"\n\tdef __init__(self, {fields}):")
@@ -78,7 +83,10 @@ def defineAst(out, baseName, types):
                 for fn in field_names:
                     f.write(f"\n\t\tself.{fn} = {fn}")
 
-            f.write(f"\n\n\tdef accept(self, visitor: {baseName}Visitor):")
+            if ((fields) and (field_names)):
+                f.write("\n")
+
+            f.write(f"\n\tdef accept(self, visitor: {baseName}Visitor):")
             f.write(f"\n\t\treturn visitor.visit{className}{baseName}(self)")
 
             f.write("\n\n\n")
@@ -87,11 +95,42 @@ def defineAst(out, baseName, types):
 
 
 def main():
-    if len(sys.argv) == 2:
-        out = _os.path.join(sys.argv[1])
+    if len(_sys.argv) == 2:
+        out = _os.path.join(_sys.argv[1])
+
+        # Per node state the resolver and engines cache on the nodes (the base class' caches are on every node)
+        #  - compiled:    closure the closure engine compiled the node to
+        #  - slot:        slot (or '(depth, slot)') the resolver gave the name
+        #  - globalCache: '(global table version, value)', see 'Interpreter.lookupName'
+        #  - inline:      call site inline cache, see 'Interpreter.visitCallExpr'
+        #  - tail:        call is in tail position
+        #  - shapeCache:  property access shape cache, see 'Interpreter.getProperty'
+        #  - layout:      slot layout of the scope's runtime env
+        #  - flat:        block that doesn't need its own env
+        #  - counted:     counted loop info, see 'Resolver.countedLoop'
+        caches = {
+                "Expr": ["compiled"],
+                "Assign": ["slot"],
+                "CompoundAssign": ["slot", "globalCache"],
+                "Postfix": ["slot", "globalCache"],
+                "Call": ["inline", "tail"],
+                "Get": ["shapeCache"],
+                "Set": ["shapeCache"],
+                "Super": ["slot"],
+                "This": ["slot"],
+                "Function": ["layout"],
+                "Variable": ["slot", "globalCache"],
+
+                "Stmt": ["compiled"],
+                "Block": ["layout", "flat", "counted"],
+                "Var": ["slot"],
+                "Const": ["slot"],
+        }
 
         types = {
                 "Assign": "_Token name, Expr value",
+                "CompoundAssign": "_Token name, _Token operator, Expr value",
+                "Postfix": "_Token name, _Token operator",
                 "Binary": "Expr left, _Token operator, Expr right",
                 "Call": "Expr callee, _Token paren, list args",
                 "Index": "Expr callee, _Token list args",
@@ -108,7 +147,7 @@ def main():
                 "Variable": "_Token name"
         }
 
-        defineAst(out, "Expr", types)
+        defineAst(out, "Expr", types, caches)
 
         types_two = {
             "Block": "list statements",
@@ -126,7 +165,7 @@ def main():
             "Del"  : "list names"
         }
 
-        defineAst(out, "Stmt", types_two)
+        defineAst(out, "Stmt", types_two, caches)
 
     else:
         usage()
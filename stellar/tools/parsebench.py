@@ -0,0 +1,79 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Parse Benchmark (C) 2018
+
+import os  as _os
+import sys as _sys
+import time as _time
+
+# So it runs as 'python tools/parsebench.py' from the 'stellar' dir
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+
+from core.scanner import Scanner          as _Scanner
+from core.parser  import Parser           as _Parser
+
+from tools.custom_syntax import Scanner   as _Dante
+from tools.custom_syntax import Parser    as _Virgil
+
+
+def usage():
+    print("parsebench [-n <runs>] [file.rckt ...]")
+    print("Times scanning and parsing the files (or a generated expression heavy source if none are given)")
+
+
+def generate(lines=20000):
+    # A mix of what the parser sees the most, arithmetic, comparisons, calls, property access, data literals
+    src = []
+
+    for i in range(lines):
+        src.append(f"var v{i} = (a{i % 7} + {i} * 2 - b.c({i}, \"s{i}\")) // 3 >= {i} and !done or x{i % 5} == nin ? -{i}.5 : Array({i}, {i}, true);\n")
+
+    return ''.join(src)
+
+
+def best(fn, runs):
+    # Best of 'runs', the least noisy number
+    times = []
+
+    for _ in range(runs):
+        start = _time.perf_counter()
+        result = fn()
+        times.append(_time.perf_counter() - start)
+
+    return min(times), result
+
+
+def bench(name, source, KSL, runs):
+    scanTime, tokens = best(lambda: _Scanner(source, KSL[0]).scan(), runs)
+    parseTime, stmts = best(lambda: _Parser(list(tokens), KSL[1]).parse(), runs)
+
+    print(f"{name}: {len(source.splitlines())} lines, {len(tokens)} tokens, {len(stmts)} stmts")
+    print(f"    scan  {scanTime * 1000:9.1f}ms  {len(tokens) / scanTime:12,.0f} tokens/s")
+    print(f"    parse {parseTime * 1000:9.1f}ms  {len(tokens) / parseTime:12,.0f} tokens/s")
+
+
+def main():
+    args = _sys.argv[1:]
+    runs = 3
+
+    if args[:1] == ['-n']:
+        if len(args) < 2 or not args[1].isdigit():
+            usage()
+            return
+
+        runs = int(args[1])
+        args = args[2:]
+
+    # The default KSL, i.e no custom keywords
+    KSL = _Virgil(_Dante('').scan()).parse()
+
+    if not args:
+        bench('<generated>', generate(), KSL, runs)
+
+    for filename in args:
+        with open(filename, 'r') as f:
+            bench(filename, f.read(), KSL, runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,13 @@
+import itertools as _itertools
+
 from utils.tokens   import Token        as _Token
 from utils.reporter import runtimeError as _RuntimeError
 
 
+# Shared by every 'GlobalEnvironment', so a version number never means the same thing for two tables
+VERSIONS = _itertools.count(1)
+
+
 class Environment:
     def __init__(self, enclosing=None):
         self.values = {} # To store re-assignable variables
@@ -87,3 +93,248 @@ class Environment:
             return
 
         raise _RuntimeError(name, f"ReferenceError: Undefined variable '{name.lexeme}'.")
+
+    def remove(self, name: str):
+        # Used by 'del', only looks in this env
+        if name in self.values.keys():
+            del self.values[name]
+            return True
+
+        if name in self.statics.keys():
+            del self.statics[name]
+            return True
+
+        return False
+
+
+class Unset:
+    # Marks a slot whose name hasn't been defined (yet) or was 'del'eted
+    def __repr__(self):
+        return "<unset>"
+
+
+UNSET = Unset()
+
+
+class GlobalEnvironment(Environment):
+    # The table natives, fns and classes live in.
+    # Any change to which names it holds (or what they are bound to) bumps 'version',
+    # so lookups can cache what they found per reference and only look again once it moves
+    def __init__(self):
+        super().__init__()
+        self.version = next(VERSIONS)
+
+    def decl(self, name: str, val: object):
+        super().decl(name, val)
+        self.version = next(VERSIONS)
+
+    def define(self, name: str, val: object):
+        super().define(name, val)
+        self.version = next(VERSIONS)
+
+    def assign(self, name: _Token, val: object):
+        super().assign(name, val)
+        self.version = next(VERSIONS)
+
+    def remove(self, name: str):
+        removed = super().remove(name)
+        self.version = next(VERSIONS)
+
+        return removed
+
+    def lookup(self, name: str):
+        # Value bound to 'name', 'UNSET' if there isn't one
+        if name in self.values:
+            return self.values[name]
+
+        return self.statics.get(name, UNSET)
+
+
+class Layout:
+    # Static shape of a resolved scope. Built once by the resolver and shared by every env made for that scope.
+    __slots__ = ('names', 'consts', 'params', 'reuse', 'spare', 'blank')
+
+    def __init__(self):
+        self.names = {} # lexeme -> slot index
+        self.consts = set() # lexemes declared 'const'
+        self.params = [] # slot index of each fn param, in order
+        self.reuse = False # Set by the resolver for loop body blocks no closure can capture
+        self.spare = None # Env left over from the last run of a 'reuse' block
+        self.blank = () # All 'UNSET' slots, copied over a 'spare' env's slots to clear them
+
+    def __len__(self):
+        return len(self.names)
+
+
+class SlotEnvironment:
+    # Array-backed env for resolved scopes.
+    # Resolved 'Variable'/'Assign'/'Var'/'Const' nodes carry a slot and go straight to 'slots'.
+    # Everything else (imports, anonymous fns, 'Locals', ...) still works by name through the same API as 'Environment'.
+    __slots__ = ('slots', 'layout', 'enclosing', 'extras')
+
+    def __init__(self, layout: Layout, enclosing=None):
+        self.slots = [UNSET] * len(layout.names)
+        self.layout = layout
+        self.enclosing = enclosing
+        self.extras = None # Names the resolver didn't see, stored the old way
+
+    def extra(self):
+        if self.extras is None:
+            self.extras = Environment()
+
+        return self.extras
+
+    @property
+    def values(self):
+        consts = self.layout.consts
+        values = {name: self.slots[i] for name, i in self.layout.names.items() if (name not in consts) and (self.slots[i] is not UNSET)}
+
+        if self.extras is not None:
+            values.update(self.extras.values)
+
+        return values
+
+    @property
+    def statics(self):
+        consts = self.layout.consts
+        statics = {name: self.slots[i] for name, i in self.layout.names.items() if (name in consts) and (self.slots[i] is not UNSET)}
+
+        if self.extras is not None:
+            statics.update(self.extras.statics)
+
+        return statics
+
+    def decl(self, name: str, val: object):
+        if name in self.layout.consts:
+            self.slots[self.layout.names[name]] = val
+
+        else:
+            self.extra().decl(name, val)
+
+    def define(self, name: str, val: object):
+        index = self.layout.names.get(name)
+
+        if (index is not None) and (name not in self.layout.consts):
+            self.slots[index] = val
+
+        elif (index is not None) and (self.slots[index] is UNSET):
+            self.slots[index] = val
+
+        elif index is not None:
+            raise _RuntimeError(name, f"Variable name '{name}' already declared as 'const'")
+
+        else:
+            self.extra().define(name, val)
+
+    def varExists(self, name: _Token):
+        index = self.layout.names.get(name.lexeme)
+
+        if (index is not None) and (name.lexeme not in self.layout.consts) and (self.slots[index] is not UNSET):
+            return True
+
+        return (self.extras is not None) and self.extras.varExists(name)
+
+    def constExists(self, name: _Token):
+        index = self.layout.names.get(name.lexeme)
+
+        if (index is not None) and (name.lexeme in self.layout.consts) and (self.slots[index] is not UNSET):
+            return True
+
+        return (self.extras is not None) and self.extras.constExists(name)
+
+    def isTaken(self, name: _Token):
+        return self.varExists(name) or self.constExists(name)
+
+    def get(self, name: _Token):
+        index = self.layout.names.get(name.lexeme)
+
+        if (index is not None) and (self.slots[index] is not UNSET):
+            return self.slots[index]
+
+        if (self.extras is not None) and (self.extras.isTaken(name)):
+            return self.extras.get(name)
+
+        if (self.enclosing != None):
+            return self.enclosing.get(name)
+
+        raise _RuntimeError(name, f"ReferenceError: Undefined variable '{name.lexeme}'")
+
+    def getAt(self, dist: int, name: str):
+        return self.ancestor(dist).values.get(name)
+
+    def assignAt(self, dist: int, name: _Token, value: object):
+        self.ancestor(dist).define(name.lexeme, value)
+
+    def ancestor(self, dist: int):
+        env = self
+
+        # Same 'this' hack as 'Environment.ancestor'
+        if dist == 0:
+            env = env.enclosing
+
+        else:
+            for i in range(dist):
+                env = env.enclosing
+
+        return env
+
+    def assign(self, name: _Token, val: object):
+        index = self.layout.names.get(name.lexeme)
+
+        if (index is not None) and (self.slots[index] is not UNSET):
+            if name.lexeme in self.layout.consts:
+                raise _RuntimeError(name, f"AssignmentError: 'const' variables can't be re-assigned")
+
+            self.slots[index] = val
+            return
+
+        if (self.extras is not None) and (self.extras.isTaken(name)):
+            self.extras.assign(name, val)
+            return
+
+        elif (self.enclosing is not None):
+            self.enclosing.assign(name, val)
+            return
+
+        raise _RuntimeError(name, f"ReferenceError: Undefined variable '{name.lexeme}'.")
+
+    def remove(self, name: str):
+        index = self.layout.names.get(name)
+
+        if (index is not None) and (self.slots[index] is not UNSET):
+            self.slots[index] = UNSET
+            return True
+
+        return (self.extras is not None) and self.extras.remove(name)
+
+
+def makeEnvironment(layout: Layout, enclosing=None):
+    # Resolved scopes get an array-backed env, the rest keep using names
+    if layout is None:
+        return Environment(enclosing)
+
+    env = layout.spare
+
+    # Nothing can still see the last iteration's env (see 'releaseEnvironment'), so just clear it out
+    if env is not None:
+        layout.spare = None
+
+        # Reset in place, the slots list is reused as well
+        blank = layout.blank
+
+        if len(blank) != len(layout.names):
+            blank = layout.blank = (UNSET,) * len(layout.names)
+
+        env.slots[:] = blank
+        env.enclosing = enclosing
+        env.extras = None
+
+        return env
+
+    return SlotEnvironment(layout, enclosing)
+
+
+def releaseEnvironment(env):
+    # Called once a block is done with its env. Keep it around for the next run of the same block if the resolver said no closure can hold on to it
+    if (env.__class__ is SlotEnvironment) and env.layout.reuse:
+        env.layout.spare = env
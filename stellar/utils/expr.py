@@ -5,6 +5,12 @@ class ExprVisitor:
 	def visitAssignExpr(self, expr):
 		raise NotImplementedError
 
+	def visitCompoundAssignExpr(self, expr):
+		raise NotImplementedError
+
+	def visitPostfixExpr(self, expr):
+		raise NotImplementedError
+
 	def visitBinaryExpr(self, expr):
 		raise NotImplementedError
 
@@ -49,6 +55,8 @@ class ExprVisitor:
 
 
 class Expr:
+	__slots__ = ('compiled',)
+
 	def accept(visitor: ExprVisitor):
 		raise NotImplementedError
 
@@ -57,6 +65,8 @@ class Expr:
 
 
 class Assign(Expr):
+	__slots__ = ('name', 'value', 'slot')
+
 	def __init__(self, name: _Token, value: Expr):
 		self.name = name
 		self.value = value
@@ -65,7 +75,32 @@ class Assign(Expr):
 		return visitor.visitAssignExpr(self)
 
 
+class CompoundAssign(Expr):
+	__slots__ = ('name', 'operator', 'value', 'slot', 'globalCache')
+
+	def __init__(self, name: _Token, operator: _Token, value: Expr):
+		self.name = name
+		self.operator = operator
+		self.value = value
+
+	def accept(self, visitor: ExprVisitor):
+		return visitor.visitCompoundAssignExpr(self)
+
+
+class Postfix(Expr):
+	__slots__ = ('name', 'operator', 'slot', 'globalCache')
+
+	def __init__(self, name: _Token, operator: _Token):
+		self.name = name
+		self.operator = operator
+
+	def accept(self, visitor: ExprVisitor):
+		return visitor.visitPostfixExpr(self)
+
+
 class Binary(Expr):
+	__slots__ = ('left', 'operator', 'right')
+
 	def __init__(self, left: Expr, operator: _Token, right: Expr):
 		self.left = left
 		self.operator = operator
@@ -76,6 +111,8 @@ class Binary(Expr):
 
 
 class Call(Expr):
+	__slots__ = ('callee', 'paren', 'args', 'inline', 'tail')
+
 	def __init__(self, callee: Expr, paren: _Token, args: list):
 		self.callee = callee
 		self.paren = paren
@@ -86,6 +123,8 @@ class Call(Expr):
 
 
 class Index(Expr):
+	__slots__ = ('callee', 'args')
+
 	def __init__(self, callee: Expr, args: _Token):
 		self.callee = callee
 		self.args = args
@@ -95,6 +134,8 @@ class Index(Expr):
 
 
 class Conditional(Expr):
+	__slots__ = ('expr', 'thenExpr', 'elseExpr')
+
 	def __init__(self, expr: Expr, thenExpr: Expr, elseExpr: Expr):
 		self.expr = expr
 		self.thenExpr = thenExpr
@@ -105,6 +146,8 @@ class Conditional(Expr):
 
 
 class Get(Expr):
+	__slots__ = ('object', 'name', 'shapeCache')
+
 	def __init__(self, object: Expr, name: _Token):
 		self.object = object
 		self.name = name
@@ -114,6 +157,8 @@ class Get(Expr):
 
 
 class Set(Expr):
+	__slots__ = ('object', 'name', 'value', 'shapeCache')
+
 	def __init__(self, object: Expr, name: _Token, value: Expr):
 		self.object = object
 		self.name = name
@@ -124,6 +169,8 @@ class Set(Expr):
 
 
 class Super(Expr):
+	__slots__ = ('keyword', 'method', 'slot')
+
 	def __init__(self, keyword: _Token, method: _Token):
 		self.keyword = keyword
 		self.method = method
@@ -133,6 +180,8 @@ class Super(Expr):
 
 
 class This(Expr):
+	__slots__ = ('keyword', 'slot')
+
 	def __init__(self, keyword: _Token):
 		self.keyword = keyword
 
@@ -141,6 +190,8 @@ class This(Expr):
 
 
 class Function(Expr):
+	__slots__ = ('params', 'body', 'layout')
+
 	def __init__(self, params: list, body: list):
 		self.params = params
 		self.body = body
@@ -150,6 +201,8 @@ class Function(Expr):
 
 
 class Grouping(Expr):
+	__slots__ = ('expression',)
+
 	def __init__(self, expression: Expr):
 		self.expression = expression
 
@@ -158,6 +211,8 @@ class Grouping(Expr):
 
 
 class Logical(Expr):
+	__slots__ = ('left', 'operator', 'right')
+
 	def __init__(self, left: Expr, operator: _Token, right: Expr):
 		self.left = left
 		self.operator = operator
@@ -168,6 +223,8 @@ class Logical(Expr):
 
 
 class Literal(Expr):
+	__slots__ = ('value',)
+
 	def __init__(self, value: object):
 		self.value = value
 
@@ -176,6 +233,8 @@ class Literal(Expr):
 
 
 class Unary(Expr):
+	__slots__ = ('operator', 'right')
+
 	def __init__(self, operator: _Token, right: Expr):
 		self.operator = operator
 		self.right = right
@@ -185,6 +244,8 @@ class Unary(Expr):
 
 
 class Variable(Expr):
+	__slots__ = ('name', 'slot', 'globalCache')
+
 	def __init__(self, name: _Token):
 		self.name = name
 
@@ -1,7 +1,11 @@
 # Utilities fns to reduce code redundancy
+import operator as _operator
+
 from core.scanner import Scanner as _Scanner
 from core.parser  import Parser  as _Parser
 
+from utils.reporter import runtimeError as _RuntimeError
+
 
 # Integer Negativity test
 def isValNeg(x):
@@ -38,7 +42,7 @@ def importCodeStmts(filename, KSL):
         module_contents = module.read()
         module.close()
 
-    tks = _Scanner(module_contents, KSL[0]).scan()
+    tks = _Scanner(module_contents, KSL[0]).tokenize()
     stmts = _Parser(tks, KSL[1]).parse()
 
     return stmts
@@ -61,24 +65,85 @@ def isAllSameType(objs, kind):
     return result
 
 
-# array addition fn
-def addArrays(left, right, sanitize):
-    result = []
+# Array arithmetic kernels
+# op lexeme -> the python fn that implements it
+ARRAY_OPS = {
+    '+': _operator.add,
+    '-': _operator.sub,
+    '*': _operator.mul,
+    '/': _operator.truediv,
+    '//': _operator.floordiv,
+    '%': _operator.mod,
+    '**': _operator.pow,
+}
 
-    # What about uneven array heights?
-    for i in range(len(left.elements)):
-        result.append(sanitize(left.elements[i].value + right.elements[i].value))
 
-    return result
+# These have to check for zero first
+ARRAY_DIVISION = ('/', '//', '%')
+
+
+# Raw numbers of an Array. Typed (Int/Float) Arrays hand over their unboxed buffer as is
+def rawValues(arr, skipNin=False):
+    buffer = getattr(arr.elements, 'buffer', None)
+
+    if buffer != None:
+        return buffer
+
+    if skipNin:
+        return [elm.value for elm in arr.elements if type(elm) != type(None)]
+
+    return [elm.value for elm in arr.elements]
+
+
+def checkDivisors(divisors, operator):
+    # Same report as the scalar path in 'core/operators.py'
+    if (operator.lexeme in ARRAY_DIVISION) and (0 in divisors):
+        raise _RuntimeError(operator, "ZeroDivError: Can't divide by zero", False)
+
+
+def checkResults(results, operator):
+    # I.e '-1 ** 0.5', the Array ctor can't hold complex nums
+    if operator.lexeme == '**':
+        for value in results:
+            if value.__class__ == complex:
+                raise _RuntimeError(operator, "Can't raise a negative number to a fractional power.", False)
+
+    return results
+
+
+# element-wise array op, i.e. [4,3,5] * [3,1,0] = [12,3,0]
+def opArrays(left, right, sanitize, operator):
+    fn = ARRAY_OPS[operator.lexeme]
+    lefts = rawValues(left)
+    rights = rawValues(right)
+
+    # Uneven arrays can't be lined up
+    if len(lefts) != len(rights):
+        raise _RuntimeError(operator, f"Arrays must be of the same length, got {len(lefts)} and {len(rights)}.", False)
+
+    checkDivisors(rights, operator)
+
+    return checkResults([sanitize(fn(value, rights[i])) for i, value in enumerate(lefts)], operator)
+
+
+# array op number, i.e. [4,3,5] * 2 = [8,6,10]
+def opOverArray(arr, num, sanitize, operator):
+    fn = ARRAY_OPS[operator.lexeme]
+    n = num.value
+
+    checkDivisors((n,), operator)
+
+    # 'nin' elms are skipped
+    return checkResults([sanitize(fn(value, n)) for value in rawValues(arr, True)], operator)
 
-def doMath(left, right, op):
-    return eval(f"{left} {op} {right}")
 
-def opOverArray(arr, num, sanitize, op):
-    result = []
+# number op array, i.e. 12 / [1,2,3] = [12,6,4]. The number stays the left operand
+def opUnderArray(num, arr, sanitize, operator):
+    fn = ARRAY_OPS[operator.lexeme]
+    n = num.value
+    values = rawValues(arr, True)
 
-    for i in range(len(arr.elements)):
-        if type(arr.elements[i]) != type(None):
-            result.append(sanitize(doMath(arr.elements[i].value, num.value, op)))
+    checkDivisors(values, operator)
 
-    return result
\ No newline at end of file
+    # 'nin' elms are skipped
+    return checkResults([sanitize(fn(n, value)) for value in values], operator)
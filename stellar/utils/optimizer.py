@@ -0,0 +1,306 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) AST Optimizer (C) 2018
+
+from utils.expr import ExprVisitor   as _ExprVisitor
+from utils.expr import Expr          as _Expr
+from utils.expr import Literal       as _Literal
+from utils.expr import Assign        as _Assign
+from utils.expr import CompoundAssign as _CompoundAssign
+from utils.expr import Postfix       as _Postfix
+from utils.expr import Binary        as _Binary
+from utils.expr import Call          as _Call
+from utils.expr import Index         as _Index
+from utils.expr import Conditional   as _Conditional
+from utils.expr import Get           as _Get
+from utils.expr import Set           as _Set
+from utils.expr import Super         as _Super
+from utils.expr import This          as _This
+from utils.expr import Function      as _Function
+from utils.expr import Grouping      as _Grouping
+from utils.expr import Logical       as _Logical
+from utils.expr import Unary         as _Unary
+from utils.expr import Variable      as _Variable
+
+from utils.stmt import StmtVisitor   as _StmtVisitor
+from utils.stmt import Stmt          as _Stmt
+from utils.stmt import Block         as _Block
+from utils.stmt import Expression    as _Expression
+from utils.stmt import Print         as _Print
+from utils.stmt import Class         as _Class
+from utils.stmt import Func          as _Func
+from utils.stmt import Var           as _Var
+from utils.stmt import Const         as _Const
+from utils.stmt import If            as _If
+from utils.stmt import While         as _While
+from utils.stmt import Import        as _Import
+from utils.stmt import Break         as _Break
+from utils.stmt import Return        as _Return
+from utils.stmt import Del           as _Del
+
+from native.datatypes.rocketNumber  import RocketInt     as _RocketInt
+from native.datatypes.rocketNumber  import RocketFloat   as _RocketFloat
+from native.datatypes.rocketString  import RocketString  as _RocketString
+from native.datatypes.rocketBoolean import RocketBool    as _RocketBool
+
+
+# Runtime values that nothing mutates, so one instance can be shared by every evaluation of a literal
+CONSTANT_TYPES = (_RocketInt, _RocketFloat, _RocketString, _RocketBool)
+
+
+class Optimizer(_ExprVisitor, _StmtVisitor):
+    # Runs between the parser and the resolver (enabled with '-O'). Each visit returns the node to use in place of the visited one.
+    #  - folds constant sub-expressions, i.e '60 * 60 * 24' -> '86400'
+    #  - pre-boxes literals into shared runtime values from a constant pool, so they aren't rebuilt on each evaluation
+    #  - drops 'if' branches whose condition is a constant
+    # NOTE: Folding runs the interpreter's own operators, so a folded value is exactly what the unoptimized code would produce at runtime
+    def __init__(self, interpreter: object):
+        self.interpreter = interpreter
+        self.constants = {} # (type, repr) -> shared runtime value
+
+    def optimize(self, stmts: list):
+        return self.optimizeStmts(stmts)
+
+    # Helpers
+
+    def optimizeStmts(self, stmts: list):
+        result = []
+
+        for stmt in stmts:
+            # I.e when multi-variable/const declerations are made
+            if type(stmt) == list:
+                result.append(self.optimizeStmts(stmt))
+                continue
+
+            stmt = self.optimizeStmt(stmt)
+
+            # Dead 'if' without an 'else'
+            if stmt != None:
+                result.append(stmt)
+
+        return result
+
+    def optimizeStmt(self, stmt: _Stmt):
+        return stmt.accept(self)
+
+    def optimizeBranch(self, stmt: _Stmt):
+        # Branches and loop bodies can't be dropped, use an empty block instead
+        if stmt == None:
+            return None
+
+        stmt = self.optimizeStmt(stmt)
+
+        return stmt if stmt != None else _Block([])
+
+    def optimizeExpr(self, expr: _Expr):
+        if expr == None:
+            return None
+
+        return expr.accept(self)
+
+    def constant(self, value: object):
+        # Share one boxed runtime value per distinct literal
+        # NOTE: 'repr' keeps i.e '0.0' and '-0.0' (or '1' and 'true') apart
+        if (value == None) or isinstance(value, CONSTANT_TYPES):
+            return value
+
+        key = (type(value), repr(value))
+
+        if key not in self.constants:
+            self.constants[key] = self.interpreter.literal(value)
+
+        return self.constants[key]
+
+    def isConstant(self, expr: _Expr):
+        return isinstance(expr, _Literal)
+
+    def fold(self, compute, expr: _Expr):
+        # Try computing the value now. Anything that fails (or isn't a plain immutable value) is left for the runtime to deal with
+        errors = len(self.interpreter.errors)
+
+        try:
+            value = compute()
+
+        except Exception:
+            del self.interpreter.errors[errors:]
+            return expr
+
+        if type(value) not in CONSTANT_TYPES:
+            return expr
+
+        return _Literal(value)
+
+    # Expressions
+
+    def visitAssignExpr(self, expr: _Assign):
+        expr.value = self.optimizeExpr(expr.value)
+
+        return expr
+
+    def visitCompoundAssignExpr(self, expr: _CompoundAssign):
+        expr.value = self.optimizeExpr(expr.value)
+
+        return expr
+
+    def visitPostfixExpr(self, expr: _Postfix):
+        return expr
+
+    def visitBinaryExpr(self, expr: _Binary):
+        expr.left = self.optimizeExpr(expr.left)
+        expr.right = self.optimizeExpr(expr.right)
+
+        if self.isConstant(expr.left) and self.isConstant(expr.right):
+            literal = self.interpreter.literal
+
+            return self.fold(lambda: self.interpreter.binaryOp(expr.operator, literal(expr.left.value), literal(expr.right.value)), expr)
+
+        return expr
+
+    def visitCallExpr(self, expr: _Call):
+        expr.callee = self.optimizeExpr(expr.callee)
+        expr.args = [self.optimizeExpr(arg) for arg in expr.args]
+
+        return expr
+
+    def visitIndexExpr(self, expr: _Index):
+        expr.callee = self.optimizeExpr(expr.callee)
+        expr.args = [self.optimizeExpr(arg) for arg in expr.args]
+
+        return expr
+
+    def visitConditionalExpr(self, expr: _Conditional):
+        # NOTE: The branch isn't picked even for constant conditions. The resolver skips conditional exprs, so promoting a branch would change how its names resolve
+        expr.expr = self.optimizeExpr(expr.expr)
+        expr.thenExpr = self.optimizeExpr(expr.thenExpr)
+        expr.elseExpr = self.optimizeExpr(expr.elseExpr)
+
+        return expr
+
+    def visitGetExpr(self, expr: _Get):
+        expr.object = self.optimizeExpr(expr.object)
+
+        return expr
+
+    def visitSetExpr(self, expr: _Set):
+        expr.object = self.optimizeExpr(expr.object)
+        expr.value = self.optimizeExpr(expr.value)
+
+        return expr
+
+    def visitSuperExpr(self, expr: _Super):
+        return expr
+
+    def visitThisExpr(self, expr: _This):
+        return expr
+
+    def visitFunctionExpr(self, expr: _Function):
+        expr.body = self.optimizeStmts(expr.body)
+
+        return expr
+
+    def visitGroupingExpr(self, expr: _Grouping):
+        expr.expression = self.optimizeExpr(expr.expression)
+
+        # '(42)' is just '42'
+        if self.isConstant(expr.expression):
+            return expr.expression
+
+        return expr
+
+    def visitLogicalExpr(self, expr: _Logical):
+        expr.left = self.optimizeExpr(expr.left)
+        expr.right = self.optimizeExpr(expr.right)
+
+        return expr
+
+    def visitLiteralExpr(self, expr: _Literal):
+        expr.value = self.constant(expr.value)
+
+        return expr
+
+    def visitUnaryExpr(self, expr: _Unary):
+        expr.right = self.optimizeExpr(expr.right)
+
+        # NOTE: '!' hands back a raw python bool, which 'fold' refuses, so it stays as is
+        if self.isConstant(expr.right):
+            return self.fold(lambda: self.interpreter.unaryOp(expr.operator, self.interpreter.literal(expr.right.value)), expr)
+
+        return expr
+
+    def visitVariableExpr(self, expr: _Variable):
+        return expr
+
+    # Statements
+
+    def visitBlockStmt(self, stmt: _Block):
+        stmt.statements = self.optimizeStmts(stmt.statements)
+
+        return stmt
+
+    def visitExpressionStmt(self, stmt: _Expression):
+        stmt.expression = self.optimizeExpr(stmt.expression)
+
+        return stmt
+
+    def visitPrintStmt(self, stmt: _Print):
+        stmt.expression = self.optimizeExpr(stmt.expression)
+
+        return stmt
+
+    def visitClassStmt(self, stmt: _Class):
+        stmt.methods = [self.optimizeStmt(method) for method in stmt.methods]
+
+        return stmt
+
+    def visitFuncStmt(self, stmt: _Func):
+        stmt.function = self.optimizeExpr(stmt.function)
+
+        return stmt
+
+    def visitVarStmt(self, stmt: _Var):
+        stmt.initializer = self.optimizeExpr(stmt.initializer)
+
+        return stmt
+
+    def visitConstStmt(self, stmt: _Const):
+        stmt.initializer = self.optimizeExpr(stmt.initializer)
+
+        return stmt
+
+    def visitIfStmt(self, stmt: _If):
+        stmt.condition = self.optimizeExpr(stmt.condition)
+
+        if self.isConstant(stmt.condition):
+            # Same truthiness rules as the runtime. I.e only 'nin' is false here, the 'false' literal is a (truthy) 'RocketBool'
+            if self.interpreter.isTruthy(stmt.condition.value):
+                return self.optimizeStmt(stmt.thenBranch)
+
+            if stmt.elseBranch != None:
+                return self.optimizeStmt(stmt.elseBranch)
+
+            return None
+
+        stmt.thenBranch = self.optimizeBranch(stmt.thenBranch)
+        stmt.elseBranch = self.optimizeBranch(stmt.elseBranch)
+
+        return stmt
+
+    def visitWhileStmt(self, stmt: _While):
+        stmt.condition = self.optimizeExpr(stmt.condition)
+        stmt.body = self.optimizeBranch(stmt.body)
+
+        return stmt
+
+    def visitImportStmt(self, stmt: _Import):
+        return stmt
+
+    def visitBreakStmt(self, stmt: _Break):
+        return stmt
+
+    def visitReturnStmt(self, stmt: _Return):
+        stmt.value = self.optimizeExpr(stmt.value)
+
+        return stmt
+
+    def visitDelStmt(self, stmt: _Del):
+        return stmt
@@ -53,17 +53,22 @@ class runtimeError(RuntimeError):
         return self.__str__()
 
 
-class BreakException(Exception):
-    def returnable(self):
-        return False
+class Completion(object):
+    # Abrupt completion signal. Stmts hand these back (instead of raising) and every block/loop passes them up until something consumes them.
+    # Loops consume 'BREAK', 'RocketFunction.invoke' consumes 'RETURN'
+    def __init__(self, name: str):
+        self.name = name
 
+    def __repr__(self):
+        return f"<completion '{self.name}'>"
 
-class ReturnException(Exception):
-    def __init__(self, value):
-        self.value = value
 
-    def returnable(self):
-        return True
+BREAK = Completion('break')
+RETURN = Completion('return') # The returned value is left in 'Interpreter.returnValue'
+
+# Not a stmt signal but the value of a call in tail position (i.e 'return f(n - 1);'), the target is left in 'Interpreter.tailCall'
+# It rides up with 'RETURN' and 'RocketFunction.invoke' runs the target in place of the fn that returned it
+TAIL_CALL = Completion('tail call')
 
 
 class ResolutionError(RuntimeError):
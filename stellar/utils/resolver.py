@@ -2,6 +2,8 @@ import enum as _enum
 
 from utils.reporter import ResolutionError as _ResolutionError
 
+from utils.env      import Layout          as _Layout
+
 from utils.tokens   import Token           as _Token
 from utils.tokens   import TokenType       as _TokenType
 
@@ -9,6 +11,8 @@ from utils.expr     import ExprVisitor     as _ExprVisitor
 
 from utils.expr import Expr          as _Expr
 from utils.expr import Assign        as _Assign
+from utils.expr import CompoundAssign as _CompoundAssign
+from utils.expr import Postfix       as _Postfix
 from utils.expr import Variable      as _Variable
 from utils.expr import Binary        as _Binary
 from utils.expr import Call          as _Call
@@ -34,6 +38,7 @@ from utils.stmt import Import        as _Import
 from utils.stmt import Func          as _Func
 from utils.stmt import Class         as _Class
 from utils.stmt import Block         as _Block
+from utils.stmt import Break         as _Break
 from utils.stmt import Return        as _Return
 from utils.stmt import Del           as _Del
 from utils.stmt import Print         as _Print
@@ -63,12 +68,24 @@ class ClassType(_enum.Enum):
     SUB = 46
 
 
+# Conditions a counted loop can test its counter with, see 'Resolver.countedLoop'
+COUNTED_OPS = (_TokenType.LESS, _TokenType.LESS_EQUAL, _TokenType.GREATER, _TokenType.GREATER_EQUAL)
+
+
 class Variable:
     def __init__(self, name, state):
         self.name = name
         self.state = state
 
 
+class SlotScope:
+    # Resolve-time bookkeeping for a scope that gets an array-backed env at runtime
+    def __init__(self):
+        self.layout = _Layout()
+        self.refs = [] # (node, slot) pairs, only handed out if the scope stays static
+        self.dynamic = False
+
+
 class Stack(list):
     def __init__(self):
         # For REPL sakes a pre-defined scope should be used for global vars
@@ -116,23 +133,162 @@ class Resolver(_ExprVisitor, _StmtVisitor):
     def __init__(self, interpreter: object, vw_Dict: dict):
         self.currentFunction = FunctionType.NONE
         self.currentClass = ClassType.NONE
+        self.loopDepth = 0
+        self.captures = 0 # fns and classes resolved so far, each one can capture the env it's made in
         self.interpreter = interpreter
         self.scopes = Stack()
         self.vw_Dict = vw_Dict
         self.errors = []
 
-    def visitImportStmt(Self, stmt: _Import):
+        # Parallel to 'scopes.stack'. 'None' for scopes that keep dict envs (global, class, method scopes)
+        self.slotScopes = [None]
+        # Index of the current fn's outermost scope. Slots are never resolved across fn boundaries
+        self.functionStart = 1
+
+    def visitImportStmt(self, stmt: _Import):
+        # Imported code defines names we can't see into the current env, so keep this fn's scopes name based
+        for info in self.slotScopes[self.functionStart:]:
+            if info != None: info.dynamic = True
+
         return None
 
     def visitBlockStmt(self, stmt: _Block):
-        self.beginScope()
+        # A block that declares nothing has nothing to scope, so run it straight in the enclosing env.
+        # I.e the '{ body; increment }' block every desugared 'for' loop wraps its body in
+        if not self.declares(stmt.statements):
+            stmt.flat = True
+            self.resolveStmts(stmt.statements)
+
+            return None
+
+        captures = self.captures
+
+        self.beginScope(True)
         self.resolveStmts(stmt.statements)
-        self.endScope()
+        stmt.layout = self.endScope()
+
+        # Loop bodies run over and over, if no fn/class made inside can hold on to the env one env can be recycled for every iteration
+        if (stmt.layout != None) and (self.loopDepth > 0) and (captures == self.captures):
+            stmt.layout.reuse = True
+
+        stmt.counted = self.countedLoop(stmt)
 
         return None
 
+    def countedLoop(self, stmt: _Block):
+        # Spots what 'for (var i = a; i < n; i = i + k) body' desugars to, i.e 'Block([Var, While(cond, Block([body, increment]))])'.
+        # The engines can then run 'i' as a python int and only box it into its slot when 'body' reads it.
+        # Hands back '(init, loop, slot, op, limit, step, body, reads)' or 'None' if it isn't (safely) a counted loop
+        if (stmt.layout == None) or (len(stmt.statements) != 2):
+            return None
+
+        init, loop = stmt.statements
+
+        if not (isinstance(init, _Var) and (init.initializer != None) and (getattr(init, 'slot', None) != None) and isinstance(loop, _While)):
+            return None
+
+        name = init.name.lexeme
+        cond = loop.condition
+
+        # 'i < n' where 'n' is a literal or a plain variable (so evaluating it has no side effects)
+        if not (isinstance(cond, _Binary) and (cond.operator.type in COUNTED_OPS) and isinstance(cond.left, _Variable) and (cond.left.name.lexeme == name)):
+            return None
+
+        limit = cond.right
+
+        if not (isinstance(limit, _Literal) or (isinstance(limit, _Variable) and limit.name.lexeme != name)):
+            return None
+
+        if not (isinstance(loop.body, _Block) and getattr(loop.body, 'flat', False) and (len(loop.body.statements) == 2)):
+            return None
+
+        body, increment = loop.body.statements
+        step = self.counterStep(increment, name)
+
+        if step == None:
+            return None
+
+        reads = self.counterReads(body, name)
+
+        if reads == None:
+            return None
+
+        return (init, loop, init.slot, cond.operator.type, limit, step, body, reads)
+
+    def counterStep(self, expr: _Expr, name: str):
+        # 'i = i + k', 'i += k' (or their '-' forms) with a non-zero int 'k', 'i++' and 'i--'
+        if isinstance(expr, _Postfix) and (expr.name.lexeme == name):
+            return 1 if expr.operator.type == _TokenType.PLUS else -1
+
+        if isinstance(expr, _CompoundAssign) and (expr.name.lexeme == name):
+            operator = expr.operator
+            step = expr.value
+
+        elif isinstance(expr, _Assign) and (expr.name.lexeme == name) and isinstance(expr.value, _Binary):
+            value = expr.value
+
+            if not (isinstance(value.left, _Variable) and (value.left.name.lexeme == name)):
+                return None
+
+            operator = value.operator
+            step = value.right
+
+        else:
+            return None
+
+        sign = {_TokenType.PLUS: 1, _TokenType.MINUS: -1}.get(operator.type)
+
+        if (sign == None) or not isinstance(step, _Literal):
+            return None
+
+        # Literals pre-boxed by the optimizer
+        step = step.value.value if hasattr(step.value, 'value') else step.value
+
+        if (type(step) != int) or (step == 0):
+            return None
+
+        return sign * step
+
+    def counterReads(self, body: _Stmt, name: str):
+        # Whether 'body' reads the counter. 'None' if it might write it, or hide a read from us (fns, classes, imports, 'del')
+        reads = False
+        nodes = [body]
+
+        while nodes:
+            node = nodes.pop()
+
+            if type(node) == list:
+                nodes.extend(node)
+                continue
+
+            if not isinstance(node, (_Expr, _Stmt)):
+                continue
+
+            if isinstance(node, (_Function, _Func, _Class, _Import, _Del)):
+                return None
+
+            if isinstance(node, (_Assign, _CompoundAssign, _Postfix, _Var, _Const)) and (node.name.lexeme == name):
+                return None
+
+            if isinstance(node, _Variable) and (node.name.lexeme == name):
+                reads = True
+
+            # Fields and whatever is cached on the node alike, only the nodes (and lists of them) are walked
+            nodes.extend(getattr(node, field, None) for field in node.__slots__)
+
+        return reads
+
+    def declares(self, stmts: list):
+        # Whether any stmt adds (or 'del's) names in the block's own env
+        for stmt in stmts:
+            if (type(stmt) == list) or isinstance(stmt, (_Var, _Const, _Func, _Class, _Import, _Del)):
+                return True
+
+        return False
+
     def visitVarStmt(self, stmt: _Var):
         self.declare(stmt.name)
+        self.allocate(stmt.name, stmt)
 
         if (stmt.initializer != None):
             self.resolveStmt(stmt.initializer)
@@ -143,16 +299,20 @@ class Resolver(_ExprVisitor, _StmtVisitor):
 
     def visitConstStmt(self, stmt: _Const):
         self.declare(stmt.name)
+        self.allocate(stmt.name, stmt, True)
         self.resolveStmt(stmt.initializer)
         self.define(stmt.name)
 
         return None
 
     def visitClassStmt(self, stmt: _Class):
+        self.captures += 1
+
         super_lexeme = self.vw_Dict[_TokenType.SUPER.value]
         this_lexeme = self.vw_Dict[_TokenType.THIS.value]
 
         self.declare(stmt.name)
+        self.allocate(stmt.name)
         self.define(stmt.name)
 
         enclosingClass = self.currentClass
@@ -187,6 +347,8 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitFuncStmt(self, stmt: _Func):
+        self.captures += 1
+
         self.declare(stmt.name)
         self.define(stmt.name)
 
@@ -214,7 +376,19 @@ class Resolver(_ExprVisitor, _StmtVisitor):
 
     def visitWhileStmt(self, stmt: _While):
         self.resolveStmt(stmt.condition)
+
+        self.loopDepth += 1
         self.resolveStmt(stmt.body)
+        self.loopDepth -= 1
+
+        return None
+
+    def visitBreakStmt(self, stmt: _Break):
+        # The parser only counts loops, so a 'break' inside a fn that's inside a loop gets past it
+        if self.loopDepth == 0:
+            break_lexeme = self.vw_Dict[_TokenType.BREAK.value]
+            err = _ResolutionError(break_lexeme, f"'{break_lexeme}' used outside loop.").report()
+            self.errors.append(err)
 
         return None
 
@@ -235,6 +409,16 @@ class Resolver(_ExprVisitor, _StmtVisitor):
 
             self.resolveStmt(stmt.value)
 
+            # 'return f(...)' from a fn body is a tail call, see 'Interpreter.callFunction'
+            if (self.currentFunction != FunctionType.NONE) and (self.currentFunction != FunctionType.INIT):
+                value = stmt.value
+
+                while isinstance(value, _Grouping):
+                    value = value.expression
+
+                if isinstance(value, _Call):
+                    value.tail = True
+
         return None
 
     def visitVariableExpr(self, expr: _Variable):
@@ -248,15 +432,23 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitAssignExpr(self, expr: _Assign):
-        if type(expr.value) != list:
-            self.resolveExpr(expr.value)
-            # Not read yet
-            self.resolveLocal(expr, expr.name, False)
+        self.resolveExpr(expr.value)
+        # Not read yet
+        self.resolveLocal(expr, expr.name, False)
 
-            return None
+        return None
 
-        else:
-            return None
+    def visitCompoundAssignExpr(self, expr: _CompoundAssign):
+        self.resolveExpr(expr.value)
+        # 'a += 1' reads 'a' too
+        self.resolveLocal(expr, expr.name, True)
+
+        return None
+
+    def visitPostfixExpr(self, expr: _Postfix):
+        self.resolveLocal(expr, expr.name, True)
+
+        return None
 
     def visitBinaryExpr(self, expr: _Binary):
         self.resolveExpr(expr.left)
@@ -280,6 +472,9 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         self.resolveExpr(expr.value)
         self.resolveExpr(expr.value)
 
+        # 'expr.object' isn't walked, so assume it could make a fn (see 'captures')
+        self.captures += 1
+
         return None
 
     def visitThisExpr(self, expr: _This):
@@ -309,6 +504,7 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitFunctionExpr(self, expr: _Function):
+        self.captures += 1
         return None
 
     def visitGroupingExpr(self, expr: _Grouping):
@@ -319,6 +515,8 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         return None
 
     def visitConditionalExpr(self, expr: _Conditional):
+        # Not walked, so assume it could make a fn (see 'captures')
+        self.captures += 1
         return None
 
     def visitLogicalExpr(self, expr: _Logical):
@@ -332,8 +530,9 @@ class Resolver(_ExprVisitor, _StmtVisitor):
 
         return None
 
-    def beginScope(self):
+    def beginScope(self, slotted=False):
         self.scopes.push(dict())
+        self.slotScopes.append(SlotScope() if slotted else None)
 
     def endScope(self):
         scope = self.scopes.pop()
@@ -346,6 +545,57 @@ class Resolver(_ExprVisitor, _StmtVisitor):
                 err = _ResolutionError(line, f"Local variable '{entry}' is declared but unused.")
                 self.errors.append(err)
 
+        # Hand out slots and return the layout for the runtime env, if this scope gets one
+        info = self.slotScopes.pop()
+
+        if (info == None) or info.dynamic:
+            return None
+
+        for node, slot in info.refs:
+            node.slot = slot
+
+        return info.layout
+
+    def allocate(self, name: _Token, node=None, const=False):
+        # Give 'name' a slot in the current scope's layout
+        info = self.slotScopes[-1]
+
+        if info == None: return None
+
+        layout = info.layout
+
+        if name.lexeme in layout.names:
+            index = layout.names[name.lexeme]
+
+            # Same name used for both a 'var' and a 'const' in one scope, leave it to the dict env to raise at runtime
+            if (name.lexeme in layout.consts) != const:
+                info.dynamic = True
+
+        else:
+            index = len(layout.names)
+            layout.names[name.lexeme] = index
+
+            if const: layout.consts.add(name.lexeme)
+
+        if node != None:
+            info.refs.append((node, index))
+
+        return index
+
+    def resolveSlot(self, expr: _Expr, name: _Token, index: int):
+        # Only scopes inside the current fn line up 1:1 with runtime envs
+        if index < self.functionStart: return
+
+        info = self.slotScopes[index]
+
+        if (info == None) or (name.lexeme not in info.layout.names): return
+
+        # Const re-assignment has to go the slow way to raise
+        if isinstance(expr, _Assign) and (name.lexeme in info.layout.consts): return
+
+        depth = len(self.scopes.stack) - 1 - index
+        info.refs.append((expr, (depth, info.layout.names[name.lexeme])))
+
     # Similar to evaluate
     def resolveStmts(self, stmts: list):
         # Loop 'n' resolve
@@ -368,10 +618,17 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         expr.accept(self)
 
     def resolveLocal(self, expr: _Expr, name: _Token, isRead: bool):
+        slotted = False
+
         for i in range(len(self.scopes.stack), 0, -1):
             if (name.lexeme in self.scopes.stack[i - 1]):
                 self.interpreter.resolve(expr, (len(self.scopes.stack) - 1 - i))
 
+                # Innermost match only
+                if not slotted:
+                    self.resolveSlot(expr, name, i - 1)
+                    slotted = True
+
                 if (isRead):
                     self.scopes.stack[i - 1][name.lexeme].state = VariableState.READ
                     return
@@ -382,16 +639,30 @@ class Resolver(_ExprVisitor, _StmtVisitor):
         enclosingFunction = self.currentFunction
         self.currentFunction = functype
 
+        enclosingStart = self.functionStart
+        enclosingLoops = self.loopDepth
+
+        # Loops around the decleration don't count inside the fn body
+        self.loopDepth = 0
+
         # Declare and define each param to avoid param redefinition in func body
-        self.beginScope()
+        # Methods keep dict envs, 'bind' and 'merge_inits' reshape them at runtime
+        self.beginScope(functype == FunctionType.FUNCTION)
+        self.functionStart = len(self.scopes.stack) - 1
 
         for param in func.function.params:
             self.declare(param)
+            index = self.allocate(param)
             self.define(param)
 
+            if index != None:
+                self.slotScopes[-1].layout.params.append(index)
+
         self.resolveStmts(func.function.body)
-        self.endScope()
+        func.function.layout = self.endScope()
 
+        self.functionStart = enclosingStart
+        self.loopDepth = enclosingLoops
         self.currentFunction = enclosingFunction
 
     def declare(self, name: _Token):
@@ -44,6 +44,8 @@ class StmtVisitor:
 
 
 class Stmt:
+	__slots__ = ('compiled',)
+
 	def accept(visitor: StmtVisitor):
 		raise NotImplementedError
 
@@ -52,6 +54,8 @@ class Stmt:
 
 
 class Block(Stmt):
+	__slots__ = ('statements', 'layout', 'flat', 'counted')
+
 	def __init__(self, statements: list):
 		self.statements = statements
 
@@ -60,6 +64,8 @@ class Block(Stmt):
 
 
 class Expression(Stmt):
+	__slots__ = ('expression',)
+
 	def __init__(self, expression: _Expr):
 		self.expression = expression
 
@@ -68,6 +74,8 @@ class Expression(Stmt):
 
 
 class Print(Stmt):
+	__slots__ = ('expression',)
+
 	def __init__(self, expression: _Expr):
 		self.expression = expression
 
@@ -76,6 +84,8 @@ class Print(Stmt):
 
 
 class Class(Stmt):
+	__slots__ = ('name', 'superclass', 'methods')
+
 	def __init__(self, name: _Token, superclass: _Expr, methods: list):
 		self.name = name
 		self.superclass = superclass
@@ -86,6 +96,8 @@ class Class(Stmt):
 
 
 class Func(Stmt):
+	__slots__ = ('name', 'function')
+
 	def __init__(self, name: _Token, function: _Expr):
 		self.name = name
 		self.function = function
@@ -95,6 +107,8 @@ class Func(Stmt):
 
 
 class Var(Stmt):
+	__slots__ = ('name', 'initializer', 'slot')
+
 	def __init__(self, name: _Token, initializer: _Expr):
 		self.name = name
 		self.initializer = initializer
@@ -104,6 +118,8 @@ class Var(Stmt):
 
 
 class Const(Stmt):
+	__slots__ = ('name', 'initializer', 'slot')
+
 	def __init__(self, name: _Token, initializer: _Expr):
 		self.name = name
 		self.initializer = initializer
@@ -113,6 +129,8 @@ class Const(Stmt):
 
 
 class If(Stmt):
+	__slots__ = ('condition', 'thenBranch', 'elseBranch')
+
 	def __init__(self, condition: Stmt, thenBranch: Stmt, elseBranch: Stmt):
 		self.condition = condition
 		self.thenBranch = thenBranch
@@ -123,6 +141,8 @@ class If(Stmt):
 
 
 class While(Stmt):
+	__slots__ = ('condition', 'body')
+
 	def __init__(self, condition: _Expr, body: Stmt):
 		self.condition = condition
 		self.body = body
@@ -132,6 +152,8 @@ class While(Stmt):
 
 
 class Import(Stmt):
+	__slots__ = ('modules',)
+
 	def __init__(self, modules: list):
 		self.modules = modules
 
@@ -140,11 +162,15 @@ class Import(Stmt):
 
 
 class Break(Stmt):
+	__slots__ = ()
+
 	def accept(self, visitor: StmtVisitor):
 		return visitor.visitBreakStmt(self)
 
 
 class Return(Stmt):
+	__slots__ = ('keyword', 'value')
+
 	def __init__(self, keyword: _Token, value: _Expr):
 		self.keyword = keyword
 		self.value = value
@@ -154,6 +180,8 @@ class Return(Stmt):
 
 
 class Del(Stmt):
+	__slots__ = ('names',)
+
 	def __init__(self, names: list):
 		self.names = names
 
@@ -0,0 +1,48 @@
+# Author: Abubakar Nur Kahlil (Zero-1729)
+# LICENSE: RLOL
+# Rocket Lang (Stellar) Runtime Type Tags (C) 2018
+
+# Every runtime value class carries one of these as its class-level 'tag'.
+# Classifying a value is then a single int compare instead of a chain of isinstance/hasattr/'nature' checks.
+# NOTE: The order matters, related tags are kept next to each other so groups can be checked with a range compare
+
+NONE          = 0  # Not a Rocket value, i.e 'nin' or raw python values
+
+# 'RocketInstance' and its native datatypes
+INT           = 1
+FLOAT         = 2
+STRING        = 3
+BOOL          = 4
+LIST          = 5
+ARRAY         = 6
+INSTANCE      = 7
+
+# 'RocketCallable's
+CLASS         = 8
+FUNCTION      = 9
+NATIVE_METHOD = 10
+NATIVE        = 11 # native fns and datatype constructors, i.e 'Print', 'List', ...
+
+
+def tagOf(value: object):
+    # Looked up on the class, so the (native) classes themselves aren't mistaken for their instances
+    return getattr(value.__class__, 'tag', NONE)
+
+
+def isNumberTag(tag: int):
+    return INT <= tag <= FLOAT
+
+
+def isDatatypeTag(tag: int):
+    # Same as "nature == 'datatype'"
+    return INT <= tag <= ARRAY
+
+
+def isInstanceTag(tag: int):
+    # Same as 'isinstance(value, RocketInstance)'
+    return INT <= tag <= INSTANCE
+
+
+def isCallableTag(tag: int):
+    # Same as 'isinstance(value, RocketCallable)'
+    return CLASS <= tag <= NATIVE
@@ -118,6 +118,9 @@ Keywords = {
 
 
 class Token:
+    # There's one of these for every lexeme in the source, so no per-token '__dict__'
+    __slots__ = ('lexeme', 'type', 'literal', 'line')
+
     def __init__(self, type: TokenType, lexeme: str, literal, line: int):
         self.lexeme = lexeme
         self.type = type
@@ -0,0 +1,105 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: Let the tests import the interpreter's modules (i.e 'core.scanner') from wherever pytest is run, and share the KSL and parse/run helpers
+
+import os as _os
+import re as _re
+import sys as _sys
+
+import pytest
+
+COLOURS = _re.compile(r'\x1b\[[0-9;]*m')
+
+STELLAR = _os.path.abspath(_os.path.join(_os.path.dirname(__file__), '..', '..', '..', 'stellar'))
+
+if STELLAR not in _sys.path:
+    _sys.path.insert(0, STELLAR)
+
+from core.scanner import Scanner as _Scanner
+from core.parser import Parser as _Parser
+from core.interpreter import Interpreter as _Interpreter
+from core.closures import ClosureInterpreter as _ClosureInterpreter
+from core.vm import VM as _VM
+
+from utils.resolver import Resolver as _Resolver
+
+from tools.custom_syntax import Scanner as _Virgil
+from tools.custom_syntax import Parser  as _Dante
+
+
+@pytest.fixture(scope='session')
+def KSL():
+    return _Dante(_Virgil('').scan()).parse()
+
+
+@pytest.fixture
+def parse(KSL):
+    # Source -> stmts, the source has to parse cleanly
+    def parse(source):
+        parser = _Parser(_Scanner(source, KSL[0]).scan(), KSL[1])
+        stmts = parser.parse()
+
+        assert parser.errors == []
+
+        return stmts
+
+    return parse
+
+
+@pytest.fixture
+def resolve(KSL, parse):
+    # Source -> stmts resolved against 'interpreter', ready to run or compile
+    def resolve(source, interpreter):
+        stmts = parse(source)
+        _Resolver(interpreter, KSL[1]).resolveStmts(stmts)
+
+        return stmts
+
+    return resolve
+
+
+@pytest.fixture
+def run(KSL, resolve, capsys):
+    # Runs source on a fresh 'engine' in-process, hands back what it printed and the messages of the errors it reported
+    def run(source, engine=_Interpreter):
+        interpreter = engine(KSL)
+        interpreter.interpret(resolve(source, interpreter))
+
+        return capsys.readouterr().out, [error.msg for error in interpreter.errors]
+
+    return run
+
+
+@pytest.fixture(params=[_Interpreter, _ClosureInterpreter, _VM], ids=['tree', 'closure', 'vm'])
+def engine(request):
+    return request.param
+
+
+@pytest.fixture
+def lines(run):
+    # Runs source that shouldn't fail on 'engine', hands back the printed lines without their colours
+    def lines(source, engine=_Interpreter):
+        out, errors = run(source, engine)
+
+        assert errors == []
+
+        return COLOURS.sub('', out).splitlines()
+
+    return lines
+
+
+@pytest.fixture
+def repl(KSL, resolve, capsys):
+    # Runs each chunk on the same 'engine', resolved on its own like lines typed into the REPL.
+    # Hands back the uncoloured printed lines and the messages of the errors reported along the way
+    def repl(chunks, engine=_Interpreter):
+        interpreter = engine(KSL)
+        errors = []
+
+        for chunk in chunks:
+            interpreter.interpret(resolve(chunk, interpreter))
+            errors += [error.msg for error in interpreter.errors]
+
+        return COLOURS.sub('', capsys.readouterr().out).splitlines(), errors
+
+    return repl
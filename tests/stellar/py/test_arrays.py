@@ -0,0 +1,139 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: The unboxed 'NumberBuffer' storage behind Int and Float Arrays, and when it falls back to a list
+
+from array import array
+
+import pytest
+
+from core.interpreter import Interpreter
+from core.operators import combineArrays
+
+from native.datastructs.rocketArray import NumberBuffer, RocketArray
+from native.datatypes.rocketNumber import RocketInt, RocketFloat, makeInt
+
+from utils.tokens import Token, TokenType
+
+BIG = 2 ** 63
+
+
+def ints(*values):
+    return RocketArray([makeInt(value) for value in values], RocketInt, 'nin')
+
+
+def floats(*values):
+    return RocketArray([RocketFloat(value) for value in values], RocketFloat, 'nin')
+
+
+def raw(arr):
+    return [elm.value for elm in arr.elements]
+
+
+def test_number_arrays_are_typed():
+    assert ints(1, 2).elements.buffer == array('q', [1, 2])
+    assert floats(1.5).elements.buffer == array('d', [1.5])
+
+
+def test_append_of_the_same_type_stays_typed():
+    arr = ints(1, 2)
+    arr._append(None, [makeInt(3)])
+
+    assert arr.isTyped()
+    assert raw(arr) == [1, 2, 3]
+
+
+@pytest.mark.parametrize('arr, method, args', [
+    (ints(1, 2), '_append', [RocketFloat(2.5)]),
+    (ints(1, 2), '_insert', [makeInt(0), RocketFloat(2.5)]),
+    (floats(1.5, 2.5), '_fill', [makeInt(3)]),
+])
+def test_other_types_fall_back_to_a_list(arr, method, args):
+    getattr(arr, method)(None, args)
+
+    assert not arr.isTyped()
+    assert type(arr.elements) == list
+    assert args[-1] in arr.elements
+
+
+def test_fallback_keeps_the_values():
+    arr = ints(1, 2)
+    arr._append(None, [RocketFloat(2.5)])
+
+    assert raw(arr) == [1, 2, 2.5]
+    assert [elm.__class__ for elm in arr.elements] == [RocketInt, RocketInt, RocketFloat]
+
+
+def test_pack_overflow_falls_back_to_a_list():
+    buffer = NumberBuffer.pack(RocketInt, [1, BIG])
+
+    assert buffer.buffer == [1, BIG]
+
+
+def test_store_overflow_falls_back_to_a_list():
+    arr = ints(1, 2)
+    arr.elements[0] = makeInt(BIG)
+
+    assert arr.isTyped()
+    assert arr.elements.buffer == [BIG, 2]
+
+
+def test_append_overflow_falls_back_to_a_list():
+    arr = ints(1, 2)
+    arr._append(None, [makeInt(BIG)])
+
+    assert arr.isTyped()
+    assert arr.elements.buffer == [1, 2, BIG]
+    assert arr.elements[2].value == BIG
+
+
+def test_slice_stays_typed():
+    part = ints(1, 2, 3)._slice(None, [makeInt(1)])
+
+    assert part.isTyped()
+    assert part.arrayType == RocketInt
+    assert part.elements.buffer == array('q', [2, 3])
+
+
+def test_empty_slice_is_an_empty_array():
+    part = ints(1, 2, 3)._slice(None, [makeInt(3)])
+
+    assert len(part) == 0
+    assert part.isEmpty
+
+
+def test_buffers_add_into_a_typed_buffer():
+    buffer = ints(1, 2).elements + ints(3).elements
+
+    assert buffer.buffer == array('q', [1, 2, 3])
+    assert (ints(1).elements + ints(BIG).elements).buffer == [1, BIG]
+
+
+def test_array_arithmetic_stays_typed(KSL):
+    plus = Token(TokenType.PLUS, '+', None, 0)
+    result = combineArrays(Interpreter(KSL), plus, ints(1, 2), ints(3, 4))
+
+    assert result.isTyped()
+    assert result.elements.buffer == array('q', [4, 6])
+
+
+def test_pop_on_a_typed_buffer():
+    arr = floats(1.5, 2.5)
+    popped = arr._pop(None, [])
+
+    assert popped.__class__ == RocketFloat
+    assert popped.value == 2.5
+    assert arr.isTyped()
+    assert arr.elements.buffer == array('d', [1.5])
+
+
+def test_remove_on_a_typed_buffer():
+    arr = ints(1, 2, 3)
+    index = arr._remove(None, [makeInt(1)])
+
+    assert index.value == 0
+    assert arr.isTyped()
+    assert arr.elements.buffer == array('q', [2, 3])
+
+
+def test_typed_arrays_print_like_boxed_ones(lines):
+    assert lines("var a = Array(1, 2, 3); a.append(4); print a.slice(1); a.append(0.5); print a;") == ["[ 2, 3, 4 ]", "[ 1, 2, 3, 4, 0.5 ]"]
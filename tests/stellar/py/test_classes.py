@@ -0,0 +1,189 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: Instance shapes (shared field layouts), the property sites that cache them and inits merged down a class chain
+
+from native.datastructs.rocketClass import RocketClass
+
+from utils.tokens import Token, TokenType
+
+
+def name(lexeme):
+    return Token(TokenType.IDENTIFIER, lexeme, None, 0)
+
+
+def instance(klass, *fields):
+    obj = klass.call(None, [])
+
+    for field in fields:
+        obj.set(name(field), field)
+
+    return obj
+
+
+def test_fresh_instances_start_on_the_class_shape():
+    P = RocketClass('P', None, {})
+
+    assert instance(P).shape is P.shape
+    assert P.shape.names == {}
+
+
+def test_same_field_order_shares_a_shape():
+    P = RocketClass('P', None, {})
+    a = instance(P, 'x', 'y')
+    b = instance(P, 'x', 'y')
+
+    assert a.shape is b.shape
+    assert a.shape.names == {'x': 0, 'y': 1}
+
+
+def test_different_field_orders_get_their_own_shape():
+    P = RocketClass('P', None, {})
+    a = instance(P, 'x', 'y')
+    b = instance(P, 'y', 'x')
+
+    assert a.shape is not b.shape
+    assert b.shape.names == {'y': 0, 'x': 1}
+
+    for obj in (a, b):
+        assert obj.field('x') == 'x'
+        assert obj.field('y') == 'y'
+
+
+def test_shared_prefixes_share_transitions():
+    P = RocketClass('P', None, {})
+    xy = instance(P, 'x', 'y')
+    xz = instance(P, 'x', 'z')
+
+    assert xy.shape is not xz.shape
+    assert P.shape.transitions['x'].transitions == {'y': xy.shape, 'z': xz.shape}
+
+
+def test_setting_a_known_field_keeps_the_shape():
+    P = RocketClass('P', None, {})
+    a = instance(P, 'x', 'y')
+    shape = a.shape
+
+    a.set(name('x'), 'again')
+
+    assert a.shape is shape
+    assert a.field('x') == 'again'
+    assert a.fields == ['again', 'y']
+
+
+def test_classes_dont_share_shapes():
+    P = RocketClass('P', None, {})
+    Q = RocketClass('Q', None, {})
+
+    assert instance(P, 'x').shape is not instance(Q, 'x').shape
+
+
+# The same get/set sites see instances whose fields sit at different indexes, or aren't there yet
+SITES = """
+class P {}
+
+func getX(p) { return p.x; }
+func setX(p, v) { p.x = v; }
+
+var a = P();
+a.x = 1;
+a.y = 2;
+
+var b = P();
+b.y = 3;
+b.x = 4;
+
+var c = P();
+c.z = 5;
+
+var i = 0;
+while (i < 2) {
+    print getX(a);
+    print getX(b);
+    setX(a, a.x + 10);
+    setX(b, b.x + 10);
+    setX(c, i);
+    print getX(c);
+    i = i + 1;
+}
+print a.y;
+print b.y;
+print c.z;
+"""
+
+
+def test_property_sites_follow_the_shape(engine, lines):
+    assert lines(SITES, engine) == ['1', '4', '0', '11', '14', '1', '2', '3', '5']
+
+
+CHAIN = """
+class A {
+    init(a) { this.a = a; }
+    describe() { return "A " + this.a; }
+}
+class B < A {
+    init(b) { this.b = b; }
+    describe() { return "B " + this.b + " " + super.describe(); }
+}
+class C < B {
+    init(c) { this.c = c; }
+    describe() { return "C " + this.c + " " + super.describe(); }
+}
+"""
+
+
+def test_three_level_inits_merge(engine, lines):
+    source = CHAIN + """
+    var c = C(1, 2, 3);
+    print c.a + c.b + c.c;
+    print c.describe();
+    print C(4, 5, 6).describe();
+    print B(7, 8).describe();
+    print A(9).describe();
+    """
+
+    assert lines(source, engine) == ['6', 'C 3 B 2 A 1', 'C 6 B 5 A 4', 'B 8 A 7', 'A 9']
+
+
+def test_three_level_arity(engine, run):
+    assert run(CHAIN + "C(1, 2);", engine)[1] == ["Expected '3' args but got '2.'"]
+
+
+def test_inherited_and_shadowed_inits(engine, lines):
+    source = """
+    class A { init(a) { this.a = a; } }
+    class D < A {}
+    class E < A { init(a) { this.a = a + 1; } }
+    print D(5).a;
+    print E(5).a;
+    """
+
+    assert lines(source, engine) == ['5', '6']
+
+
+# Every call declares a fresh 'Sub' from the same declaration, merging it again mustn't grow its init
+REDECLARED = """
+class A { init(a) { this.a = a; } }
+
+func make(tag) {
+    class Sub < A {
+        init(s) { this.s = s; }
+        show() { return tag + this.a + this.s; }
+    }
+    return Sub;
+}
+
+var one = make("one:");
+var two = make("two:");
+print one(1, 2).show();
+print two(3, 4).show();
+print make("three:")(5, 6).show();
+print one(7, 8).show();
+"""
+
+
+def test_subclass_declared_in_a_fn_called_twice(engine, lines):
+    assert lines(REDECLARED, engine) == ['one:12', 'two:34', 'three:56', 'one:78']
+
+
+def test_redeclared_subclass_keeps_its_arity(engine, run):
+    assert run(REDECLARED + "var four = make('four:'); four(1, 2, 3);", engine)[1] == ["Expected '2' args but got '3.'"]
@@ -0,0 +1,61 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: How the VM compiles counted 'for' loops
+
+from core.interpreter import Interpreter
+from core.compiler import OP_COUNTED, OP_PUSH_ENV
+from core.vm import VM
+
+LOOPS = """
+var total = 0;
+for (var i = 0; i < 10; i++) { total += i; }
+print total;
+
+func find(n) {
+    for (var i = 0; i < n; i = i + 2) {
+        if (i > 6) { return i; }
+    }
+
+    return -1;
+}
+
+print find(20);
+print find(3);
+
+for (var j = 10; j > 0; j -= 3) {
+    if (j < 3) { break; }
+    print j;
+}
+
+var k = 3;
+for (var m = 0.5; m < k; m++) { print m; }
+"""
+
+
+
+def test_counted_loop_gets_its_own_opcode(KSL, resolve):
+    vm = VM(KSL)
+    chunk = vm.compiler.compile(resolve("for (var i = 0; i < 3; i++) { print i; }", vm))
+
+    assert chunk.code == [OP_COUNTED]
+
+    stmt, chunks = chunk.constants[0]
+    init, loop, _, _, _, _, body, _ = stmt.counted
+
+    assert set(chunks) == {init, loop, body}
+
+
+def test_uncounted_loop_is_compiled_inline(KSL, resolve):
+    vm = VM(KSL)
+    chunk = vm.compiler.compile(resolve("for (var i = 0; i < 3; i++) { i = i + 1; }", vm))
+
+    assert OP_COUNTED not in chunk.code
+    assert chunk.code[0] == OP_PUSH_ENV
+
+
+def test_counted_loops_run_like_the_tree_walker(run):
+    expected, errors = run(LOOPS, Interpreter)
+
+    assert errors == []
+    assert run(LOOPS, VM) == (expected, [])
+    assert expected.count("\n") == 9
@@ -0,0 +1,54 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: Every engine (with and without '-O') has to print exactly what the tree-walker prints for the same sample
+
+import os as _os
+import sys as _sys
+import glob as _glob
+import subprocess as _subprocess
+
+import pytest
+
+STELLAR = _os.path.abspath(_os.path.join(_os.path.dirname(__file__), '..', '..', '..', 'stellar'))
+
+ROOT = _os.path.dirname(STELLAR)
+
+MAIN = _os.path.join(STELLAR, 'main.py')
+
+SAMPLES = sorted(_glob.glob(_os.path.join(ROOT, 'tests', 'stellar', 'rckt', '*.rckt')) + _glob.glob(_os.path.join(ROOT, 'code samples', '**', '*.rckt'), recursive=True))
+
+# Samples whose output changes from run to run, or that never finish
+SKIP = {
+    _os.path.join('miscellaneous', 'loop_five_randoms.rckt'), # 'Random'
+    _os.path.join('miscellaneous', 'test-clock.rckt'),        # 'Clock'
+    _os.path.join('loops', 'while.rckt'),                     # loops forever
+}
+
+CONFIGS = [
+    ('closure', False),
+    ('vm', False),
+    ('tree', True),
+    ('closure', True),
+    ('vm', True),
+]
+
+
+def run(sample, engine, optimize):
+    args = [_sys.executable, MAIN] + (['-O'] if optimize else []) + [f'--engine={engine}', _os.path.basename(sample)]
+
+    # Run from the sample's dir, so its imports resolve
+    result = _subprocess.run(args, cwd=_os.path.dirname(sample), stdin=_subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+
+    return result.returncode, result.stdout
+
+
+def sampleId(sample):
+    return _os.path.relpath(sample, ROOT)
+
+
+@pytest.mark.parametrize('sample', [s for s in SAMPLES if not any(s.endswith(skip) for skip in SKIP)], ids=sampleId)
+def test_engines_agree(sample):
+    expected = run(sample, 'tree', False)
+
+    for engine, optimize in CONFIGS:
+        assert run(sample, engine, optimize) == expected, f"'--engine={engine}{' -O' if optimize else ''}' differs from the tree-walker"
@@ -0,0 +1,63 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: Cached global lookups have to see every redefinition, reassignment and 'del' of the name
+
+SHOW = "var x = 1; func show() { print x; } func nested() { func inner() { return x; } return inner(); }"
+
+
+def test_reassigned_global(engine, lines):
+    source = SHOW + " show(); x = 2; show(); print nested(); var i = 0; while (i < 3) { x = i * 10; show(); i = i + 1; }"
+
+    assert lines(source, engine) == ['1', '2', '2', '0', '10', '20']
+
+
+def test_redefined_global(engine, repl):
+    out, errors = repl([SHOW, "show();", "var x = 'two';", "show(); print nested();", "var x = 3;", "show();"], engine)
+
+    assert errors == []
+    assert out == ['1', 'two', 'two', '3']
+
+
+def test_redefined_global_fn(engine, repl):
+    out, errors = repl(["func f() { return 'old'; } func callF() { return f(); }", "print callF();", "func f() { return 'new'; }", "print callF();"], engine)
+
+    assert errors == []
+    assert out == ['old', 'new']
+
+
+def test_deleted_global(engine, repl):
+    out = repl([SHOW, "show();", "del x;", "show();", "print nested();", "var x = 'back';", "show(); print nested();"], engine)[0]
+
+    # Reference errors are printed where they happen, not collected
+    undefined = "[RuntimeError] ReferenceError: Undefined variable 'x'"
+
+    assert undefined in out
+    assert [line for line in out if line != undefined] == ['1', 'back', 'back']
+
+
+def test_global_shadowed_by_a_later_local(engine, lines):
+    source = SHOW + """
+    {
+        show();
+        var x = "block";
+        print x;
+        show();
+    }
+    func shadow() {
+        show();
+        var x = "fn";
+        show();
+        return x;
+    }
+    print shadow();
+    show();
+    """
+
+    assert lines(source, engine) == ['1', 'block', '1', '1', '1', 'fn', '1']
+
+
+def test_redefined_native(engine, repl):
+    out, errors = repl(["func size() { return Array(1, 2).length(); }", "print size();", "func Array(a, b) { return List(); }", "print size();"], engine)
+
+    assert errors == []
+    assert out == ['2', '0']
@@ -0,0 +1,72 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: Loop bodies recycle their env between iterations, unless a fn declared in them can still reach it
+
+
+WHILE = """
+var fns = List();
+var i = 0;
+while (i < 3) {
+    var n = i * 10;
+    func f() { return n; }
+    fns.append(f);
+    i = i + 1;
+}
+print fns.get(0)();
+print fns.get(1)();
+print fns.get(2)();
+"""
+
+FOR = """
+var fns = List();
+for (var i = 0; i < 3; i = i + 1) {
+    var n = i * 10;
+    func f() { return n; }
+    fns.append(f);
+}
+print fns.get(0)();
+print fns.get(1)();
+print fns.get(2)();
+"""
+
+# The fn sits one block deeper than the loop body
+NESTED = """
+var fns = List();
+for (var i = 0; i < 3; i = i + 1) {
+    var n = i * 10;
+    if (true) {
+        func f() { return n; }
+        fns.append(f);
+    }
+}
+print fns.get(0)();
+print fns.get(1)();
+print fns.get(2)();
+"""
+
+# The 'for' var itself is declared once, outside the body, so every fn sees its last value
+SHARED = """
+var fns = List();
+for (var i = 0; i < 3; i = i + 1) {
+    func f() { return i * 10; }
+    fns.append(f);
+}
+print fns.get(0)();
+print fns.get(2)();
+"""
+
+
+def test_while_body_fns_keep_their_iteration(engine, lines):
+    assert lines(WHILE, engine) == ['0', '10', '20']
+
+
+def test_for_body_fns_keep_their_iteration(engine, lines):
+    assert lines(FOR, engine) == ['0', '10', '20']
+
+
+def test_nested_block_fns_keep_their_iteration(engine, lines):
+    assert lines(NESTED, engine) == ['0', '10', '20']
+
+
+def test_for_var_is_shared_between_iterations(engine, lines):
+    assert lines(SHARED, engine) == ['30', '30']
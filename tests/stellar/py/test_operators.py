@@ -0,0 +1,43 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: What Array arithmetic and mismatched operands report instead of crashing
+
+import pytest
+
+
+@pytest.mark.parametrize('source', [
+    "Array(1, 2, 3) / Array(1, 0, 1);",
+    "Array(1, 2, 3) // 0;",
+    "Array(1, 2, 3) % Array(1, 0, 1);",
+    "12 / Array(1, 0, 3);",
+    "12 % Array(1, 0, 3);",
+    "Array(1, 2, 3) / 0;",
+])
+def test_array_division_by_zero(source, run):
+    assert run(source)[1] == ["ZeroDivError: Can't divide by zero"]
+
+
+@pytest.mark.parametrize('source', [
+    "Array(-1, 2, 3) ** 0.5;",
+    "Array(-1, 2, 3) ** Array(0.5, 1.0, 1.0);",
+    "-8 ** Array(1.0, 0.5);",
+])
+def test_array_negative_base_fractional_power(source, run):
+    assert run(source)[1] == ["Can't raise a negative number to a fractional power."]
+
+
+def test_array_division_by_nonzero(run):
+    out, errors = run("print Array(2, 4) / Array(1, 2); print 12 / Array(4, 6); print Array(-1, 4) ** 2;")
+
+    assert errors == []
+    assert out.count("\n") == 3
+
+
+@pytest.mark.parametrize('source, error', [
+    ("nin + 1;", "Operands must be either both strings or both numbers."),
+    ('"a" + nin;', "Operands must be either both strings or both numbers."),
+    ("true - 1;", "Operands must be numbers."),
+    ('"a" < 1;', "Operands must be numbers."),
+])
+def test_mismatched_operands(source, error, run):
+    assert run(source)[1] == [error]
@@ -0,0 +1,72 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: What '-O' folds, pools and drops
+
+import pytest
+
+from core.interpreter import Interpreter
+
+from utils.expr import Literal
+from utils.stmt import If
+from utils.optimizer import Optimizer
+
+from tools.astprinter import LispAstPrinter
+
+
+@pytest.fixture
+def optimize(KSL, parse):
+    return lambda source: Optimizer(Interpreter(KSL)).optimize(parse(source))
+
+
+def show(stmts):
+    return LispAstPrinter().printStmts(stmts)
+
+
+def test_folds_constant_arithmetic(optimize):
+    stmts = optimize("print 1 + 2 * 3;")
+
+    assert show(stmts) == "(print 7)"
+    assert isinstance(stmts[0].expression, Literal)
+
+
+def test_keeps_names_unfolded(optimize):
+    assert show(optimize("print a + 2 * 3;")) == "(print (+ a 6))"
+
+
+def test_pool_keeps_ints_and_floats_apart(optimize):
+    stmts = optimize("print 1; print 1.0; print 1;")
+    one, oneFloat, oneAgain = [stmt.expression.value for stmt in stmts]
+
+    # Same literal, same pooled value
+    assert one is oneAgain
+
+    assert oneFloat is not one
+    assert type(one.value) == int
+    assert type(oneFloat.value) == float
+
+
+def test_folded_int_and_float_stay_apart(optimize):
+    stmts = optimize("print 2 - 1; print 2.0 - 1;")
+
+    assert type(stmts[0].expression.value.value) == int
+    assert type(stmts[1].expression.value.value) == float
+
+
+def test_drops_if_nin(optimize):
+    assert optimize("if (nin) { print 1; }") == []
+
+
+def test_takes_else_of_if_nin(optimize):
+    assert show(optimize("if (nin) { print 1; } else { print 2; }")) == "(block (print 2))"
+
+
+def test_keeps_then_branch_of_other_constants(optimize):
+    # Only 'nin' is falsy, '0' and '""' are not
+    assert show(optimize("if (0) { print 1; } else { print 2; }")) == "(block (print 1))"
+    assert show(optimize('if ("") { print 1; } else { print 2; }')) == "(block (print 1))"
+
+
+def test_keeps_non_constant_if(optimize):
+    stmts = optimize("if (a) { print 1; }")
+
+    assert isinstance(stmts[0], If)
@@ -7,6 +7,10 @@ from utils.tokens import TokenType
 from core.scanner import Scanner
 from core.parser import Parser
 
+import core.parser
+
+from tools.astprinter import LispAstPrinter
+
 from tools.custom_syntax import Scanner as _Virgil
 from tools.custom_syntax import Parser  as _Dante
 
@@ -26,3 +30,81 @@ tks = Scanner(source, KSL[0]).scan()
 pr = Parser(tks, KSL[1])
 
 print("\nFirst Token is variable (VAR):", pr.check(TokenType.VAR)) # True
+
+
+def parsed(tokens):
+    parser = Parser(tokens, KSL[1])
+    stmts = parser.parse()
+
+    return LispAstPrinter().printStmts(stmts), [str(error) for error in parser.errors]
+
+
+def streamed(source):
+    # Same source, once from the full token list and once from 'Scanner.tokenize'
+    return parsed(Scanner(source, KSL[0]).tokenize()), parsed(Scanner(source, KSL[0]).scan())
+
+
+ARROWS = """var add = (a, b) => { return a + b; };
+var c = (1 + 2) * (add(3, 4) - 5);
+print c;
+"""
+
+
+def test_arrow_fn_and_grouping_across_chunks(monkeypatch):
+    # Tiny chunks, so the window ends inside '(a, b) => {...}' (which the parser has to back out of) and the groupings at some point
+    for size in range(1, 9):
+        monkeypatch.setattr(core.parser, 'CHUNK', size)
+
+        stream, whole = streamed(ARROWS)
+
+        assert stream == whole
+        assert stream == ("(var add = (fn [a b] (return (+ a b))))\n"
+                          "(var c = (* (group (+ 1 2)) (group (- (call add 3 4) 5))))\n"
+                          "(print c)", [])
+
+
+def test_source_longer_than_a_chunk():
+    source = ARROWS * 20
+    tokens = Scanner(source, KSL[0]).scan()
+
+    assert len(tokens) > 2 * core.parser.CHUNK
+
+    parser = Parser(Scanner(source, KSL[0]).tokenize(), KSL[1])
+    stmts = parser.parse()
+
+    assert len(stmts) == 60
+    assert parser.errors == []
+
+    # Parsed tokens are dropped as it goes
+    assert len(parser.tokens) < len(tokens)
+    assert LispAstPrinter().printStmts(stmts) == parsed(tokens)[0]
+
+
+def tree(source):
+    stmts, errors = parsed(Scanner(source, KSL[0]).scan())
+
+    assert errors == []
+
+    return stmts
+
+
+# NOTE: These are the shapes the old recursive descent parser built, quirks and all
+def test_nested_conditionals_group_right():
+    assert tree("a ? b : c ? d : e;") == "(; (?: a b (?: c d e)))"
+
+
+def test_conditional_binds_tighter_than_and_or():
+    assert tree("a or b ? c : d and e;") == "(; (or a (and (?: b c d) e)))"
+
+
+def test_conditional_binds_looser_than_equality():
+    assert tree("a == b ? 1 : 2;") == "(; (?: (== a b) 1 2))"
+
+
+def test_exponent_is_a_left_associative_factor():
+    # '**' sits with '*' and groups left, i.e '((2 * 3) ** 2) ** 2'
+    assert tree("1 + 2 * 3 ** 2 ** 2;") == "(; (+ 1 (** (** (* 2 3) 2) 2)))"
+
+
+def test_unary_binds_tighter_than_exponent():
+    assert tree("-a ** 2;") == "(; (** (- a) 2))"
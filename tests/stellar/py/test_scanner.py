@@ -28,3 +28,95 @@ tokens = rover.scan()
 
 print("\nTokens\n======\n")
 dump(tokens)
+
+
+def lex(source):
+	scanner = Scanner(source, KSL[0])
+	tokens = scanner.scan()
+
+	return [(token.type.name, token.lexeme, token.literal) for token in tokens], scanner.errors
+
+
+def test_floor_before_a_number():
+	for source in ["a //5;", "a // 5;"]:
+		tokens, errors = lex(source)
+
+		assert tokens == [('IDENTIFIER', 'a', None), ('FLOOR', '//', None), ('NUMBER', '5', 5), ('SEMICOLON', ';', None), ('EOF', '', None)]
+		assert errors == []
+
+
+def test_floor_assign():
+	tokens, errors = lex("a //= 2;")
+
+	assert tokens[1] == ('FLOOR_INC', '//=', None)
+	assert errors == []
+
+
+def test_slashes_as_comments():
+	# '///' comments out the rest of the line, a lone '//' is just skipped
+	tokens, errors = lex("/// note\nb")
+
+	assert tokens == [('IDENTIFIER', 'b', None), ('EOF', '', None)]
+	assert errors == []
+
+	tokens, errors = lex("a // b;")
+
+	assert tokens == [('IDENTIFIER', 'a', None), ('IDENTIFIER', 'b', None), ('SEMICOLON', ';', None), ('EOF', '', None)]
+	assert errors == []
+
+
+def test_unterminated_strings():
+	for source in ['"abc', "'abc"]:
+		tokens, errors = lex(source)
+
+		assert tokens == [('EOF', '', None)]
+		assert len(errors) == 1
+		assert errors[0].endswith("Unterminated string")
+
+
+def test_unterminated_block_comment():
+	tokens, errors = lex("a /* b")
+
+	assert tokens == [('IDENTIFIER', 'a', None), ('EOF', '', None)]
+	assert len(errors) == 1
+	assert errors[0].endswith("Unterminated comment: couldn't find matching '*/' for '/*'")
+
+
+def test_floats():
+	tokens, errors = lex("1.5;")
+
+	assert tokens[0] == ('NUMBER', '1.5', 1.5)
+	assert errors == []
+
+	# The '.' is reported and then left as its own token
+	tokens, errors = lex("1.;")
+
+	assert tokens == [('DOT', '.', None), ('SEMICOLON', ';', None), ('EOF', '', None)]
+	assert errors[0].endswith("Expected number after '.'. Did you mean float or int?")
+
+
+def test_bases():
+	tokens, errors = lex("0b101 0o17 1_000;")
+
+	assert tokens[:3] == [('NUMBER', '0b101', 5), ('NUMBER', '0o17', 15), ('NUMBER', '1_000', 1000)]
+	assert errors == []
+
+	tokens, errors = lex("0b102;")
+
+	assert tokens[0] == ('NUMBER', '0b102', 0.0)
+	assert errors[0].endswith("Expected number to be complete base '2' number")
+
+
+def test_hex_digits_are_decimal_only():
+	# NOTE: 'HEX' only takes [0-9], so the 'F' is a name of its own
+	tokens, errors = lex("0x1F;")
+
+	assert tokens == [('NUMBER', '0x1', 1), ('IDENTIFIER', 'F', None), ('SEMICOLON', ';', None), ('EOF', '', None)]
+	assert errors == []
+
+
+def test_string_lines():
+	scanner = Scanner('x = "a\nb"; y', KSL[0])
+	tokens = scanner.scan()
+
+	assert [(token.lexeme, token.line) for token in tokens] == [('x', 1), ('=', 1), ('a\nb', 2), (';', 2), ('y', 2), ('', 2)]
@@ -0,0 +1,109 @@
+# Author: Abubakar Nur Khalil
+# License: MIT
+# Purpose: VM dispatch and call frames. Timings live in 'tools/enginebench.py'
+
+import pytest
+
+from core.interpreter import Interpreter
+from core.compiler import OPNAMES, OP_CALL, OP_INVOKE, OP_ARITH, OP_ARITH_CONST, OP_BOX, OP_POP
+from core.vm import VM
+
+from utils.expr import Index, Literal
+
+CALLS = """
+func fib(n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+
+func count(n, acc) {
+    if (n == 0) { return acc; }
+    return count(n - 1, acc + 1);
+}
+
+class A {
+    init(name) { this.name = name; }
+    greet() { return "A " + this.name; }
+}
+
+class B < A {
+    greet() { return "B " + super.greet(); }
+}
+
+var b = B("b");
+print fib(12);
+print count(3000, 0);
+print b.greet();
+
+var n = 1;
+print n++;
+print n--;
+print n;
+"""
+
+ERRORS = [
+    "func f(a) { return a; } f(1, 2);",
+    "class P { init(x) { this.x = x; } } P();",
+    "class P { m(a) { return a; } } P().m();",
+    "func deep(n) { return 1 + deep(n + 1); } deep(0);",
+]
+
+
+def test_every_opcode_has_a_handler(KSL):
+    assert len(VM(KSL).dispatch) == len(OPNAMES)
+
+
+def test_arithmetic_stays_unboxed_until_the_result(KSL, resolve):
+    vm = VM(KSL)
+    chunk = vm.compiler.compile(resolve("var a = 1; var b = 2; print a * b + 3;", vm))
+
+    assert chunk.code.count(OP_ARITH) == 1
+    assert chunk.code.count(OP_ARITH_CONST) == 1
+    assert OP_BOX not in chunk.code
+
+    # Only the op at the root boxes its result
+    arith, const = [chunk.constants[arg] for op, arg in zip(chunk.code, chunk.args) if op in (OP_ARITH, OP_ARITH_CONST)]
+
+    assert arith[-1] is False
+    assert const[-1] is True
+
+
+def test_assignment_statements_store_without_a_pop(KSL, resolve):
+    vm = VM(KSL)
+    chunk = vm.compiler.compile(resolve("var a = 1; a = a + 1; a += 2; a++;", vm))
+
+    assert OP_POP not in chunk.code
+
+
+def test_index_is_rejected_like_the_tree_walker(KSL):
+    # The parser never builds 'Index', neither engine runs it
+    index = Index(Literal(1), [])
+
+    with pytest.raises(NotImplementedError):
+        Interpreter(KSL).evaluate(index)
+
+    with pytest.raises(NotImplementedError):
+        VM(KSL).compiler.compileExpr(index)
+
+
+def test_calls_compile_to_call_ops(KSL, resolve):
+    vm = VM(KSL)
+    chunk = vm.compiler.compile(resolve("func f() { return 1; } print f(); print 'a'.upper();", vm))
+
+    assert OP_CALL in chunk.code
+    assert OP_INVOKE in chunk.code
+
+
+def test_calls_run_like_the_tree_walker(run):
+    expected = run(CALLS, Interpreter)
+
+    assert run(CALLS, VM) == expected
+    assert expected[1] == []
+
+
+@pytest.mark.parametrize('source', ERRORS)
+def test_call_errors_match_the_tree_walker(source, run):
+    expected = run(source, Interpreter)
+
+    assert run(source, VM) == expected
+    assert expected[1] != []